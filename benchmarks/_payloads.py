@@ -0,0 +1,289 @@
+"""Synthetic API payloads shared by the model benchmarks.
+
+Payloads are built deterministically and shaped like real API responses,
+with every documented field populated, so decoding cost is representative.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+T0 = 1_700_000_000
+CONDITIONS = ("Clear", "Partly Cloudy", "Rain Likely", "Cloudy")
+ICONS = ("clear-day", "partly-cloudy-day", "rainy", "cloudy")
+
+
+def forecast_hour(i: int) -> dict[str, Any]:
+    """Return one hourly forecast entry."""
+    return {
+        "time": T0 + 3600 * i,
+        "conditions": CONDITIONS[i % 4],
+        "icon": ICONS[i % 4],
+        "air_temperature": 10.0 + (i % 24) * 0.5,
+        "sea_level_pressure": 1013.2 + (i % 7) * 0.1,
+        "station_pressure": 1001.4,
+        "relative_humidity": 60 + i % 30,
+        "precip": 0.0 if i % 5 else 0.4,
+        "precip_probability": (i * 7) % 100,
+        "precip_icon": "chance-rain",
+        "precip_type": "rain",
+        "wind_avg": 3.0 + (i % 10) * 0.3,
+        "wind_avg_color": "#ffffff",
+        "wind_direction": (i * 15) % 360,
+        "wind_direction_cardinal": "NW",
+        "wind_direction_icon": "wind-nw",
+        "wind_gust": 6.1,
+        "wind_gust_color": "#ffffff",
+        "uv": i % 9,
+        "feels_like": 9.5 + (i % 24) * 0.5,
+        "local_hour": i % 24,
+        "local_day": 1 + i // 24,
+    }
+
+
+def forecast_day(i: int) -> dict[str, Any]:
+    """Return one daily forecast entry."""
+    return {
+        "day_start_local": T0 + 86400 * i,
+        "day_num": 1 + i,
+        "month_num": 11,
+        "conditions": CONDITIONS[i % 4],
+        "icon": ICONS[i % 4],
+        "sunrise": T0 + 86400 * i + 25000,
+        "sunset": T0 + 86400 * i + 61000,
+        "air_temp_high": 18.0,
+        "air_temp_low": 7.0,
+        "air_temp_high_color": "#f7a600",
+        "air_temp_low_color": "#2d9cdb",
+        "precip_probability": 20,
+        "precip_icon": "chance-rain",
+        "precip_type": "rain",
+    }
+
+
+def better_forecast(hours: int = 240, days: int = 10) -> dict[str, Any]:
+    """Return a ``better_forecast`` response with ``hours`` hourly entries."""
+    return {
+        "latitude": 43.3,
+        "longitude": -79.8,
+        "timezone": "America/Toronto",
+        "timezone_offset_minutes": -300,
+        "location_name": "Bench Station",
+        "current_conditions": {
+            "time": T0,
+            "conditions": "Clear",
+            "icon": "clear-day",
+            "air_temperature": 12.5,
+            "sea_level_pressure": 1013.2,
+            "station_pressure": 1001.4,
+            "pressure_trend": "steady",
+            "relative_humidity": 71,
+            "wind_avg": 3.2,
+            "wind_direction": 290,
+            "wind_direction_cardinal": "WNW",
+            "wind_gust": 5.5,
+            "uv": 2,
+            "feels_like": 11.8,
+            "dew_point": 7.3,
+        },
+        "forecast": {
+            "hourly": [forecast_hour(i) for i in range(hours)],
+            "daily": [forecast_day(i) for i in range(days)],
+        },
+        "status": {"status_code": 0, "status_message": "SUCCESS"},
+        "units": {
+            "units_temp": "c",
+            "units_wind": "mps",
+            "units_precip": "mm",
+            "units_pressure": "mb",
+            "units_distance": "km",
+        },
+        "source_id_conditions": 5,
+    }
+
+
+def observation(i: int) -> dict[str, Any]:
+    """Return one ``obs_station`` observation entry."""
+    return {
+        "timestamp": T0 + 60 * i,
+        "air_temperature": 12.5 + (i % 20) * 0.1,
+        "barometric_pressure": 1001.4,
+        "station_pressure": 1001.4,
+        "sea_level_pressure": 1013.2,
+        "relative_humidity": 60 + i % 30,
+        "precip": 0.0,
+        "precip_accum_last_1hr": 0.0,
+        "precip_accum_local_day": 0.4,
+        "precip_accum_local_day_final": 0.4,
+        "precip_accum_local_yesterday": 1.2,
+        "precip_accum_local_yesterday_final": 1.2,
+        "precip_minutes_local_day": 3,
+        "precip_minutes_local_yesterday": 12,
+        "precip_minutes_local_yesterday_final": 12,
+        "precip_analysis_type_yesterday": 1,
+        "wind_avg": 3.0 + (i % 10) * 0.3,
+        "wind_direction": (i * 15) % 360,
+        "wind_gust": 6.1,
+        "wind_lull": 1.2,
+        "solar_radiation": 420,
+        "uv": 3,
+        "brightness": 50000,
+        "lightning_strike_last_epoch": T0 - 3600,
+        "lightning_strike_last_distance": 12,
+        "lightning_strike_count": 0,
+        "lightning_strike_count_last_1hr": 0,
+        "lightning_strike_count_last_3hr": 2,
+        "feels_like": 11.8,
+        "heat_index": 12.5,
+        "wind_chill": 11.8,
+        "dew_point": 7.3,
+        "wet_bulb_temperature": 9.6,
+        "wet_bulb_globe_temperature": 14.1,
+        "delta_t": 2.9,
+        "air_density": 1.22,
+        "pressure_trend": "steady",
+    }
+
+
+def station_observation(rows: int = 1440) -> dict[str, Any]:
+    """Return an ``obs_station`` response with ``rows`` one-minute rows."""
+    entries = [observation(i) for i in range(rows)]
+    ob_fields = list(entries[0]) if entries else []
+    return {
+        "status": {"status_code": 0, "status_message": "SUCCESS"},
+        "station_id": 1,
+        "type": "obs_st",
+        "ob_fields": ob_fields,
+        "source": "db",
+        "obs": [[entry[name] for name in ob_fields] for entry in entries],
+    }
+
+
+def obs_st_row(i: int) -> list[Any]:
+    """Return one 22-value ``obs_st`` array, ``i`` minutes after ``T0``."""
+    return [
+        T0 + 60 * i,
+        0.1 + (i % 5) * 0.1,
+        1.2 + (i % 10) * 0.3,
+        2.4 + (i % 7) * 0.2,
+        (i * 7) % 360,
+        3,
+        1001.4 + (i % 11) * 0.1,
+        12.5 + (i % 20) * 0.1,
+        60 + i % 30,
+        5000 + i % 1000,
+        (i % 9) * 0.5,
+        42 + i % 400,
+        0.0,
+        0,
+        None if i % 13 else 12,
+        0 if i % 13 else 1,
+        2.61,
+        1,
+        0.4,
+        None,
+        None,
+        1,
+    ]
+
+
+def device_observation(rows: int = 1440) -> dict[str, Any]:
+    """Return an ``obs_device`` response with ``rows`` one-minute obs_st rows."""
+    return {
+        "status": {"status_code": 0, "status_message": "SUCCESS"},
+        "device_id": 2,
+        "type": "obs_st",
+        "source": "db",
+        "bucket_step_minutes": 1,
+        "obs": [obs_st_row(i) for i in range(rows)],
+    }
+
+
+def station(i: int) -> dict[str, Any]:
+    """Return one station with a hub and a Tempest device."""
+    devices = [
+        {
+            "device_id": 1000 * i + n,
+            "serial_number": f"{kind}-{i:05d}",
+            "device_meta": {
+                "agl": 2.0,
+                "name": f"{kind}-{i:05d}",
+                "environment": "outdoor",
+                "wifi_network_name": "",
+            },
+            "device_settings": {"show_precip_final": True},
+            "device_type": kind,
+            "hardware_revision": "1",
+            "firmware_revision": "171",
+            "location_id": i,
+        }
+        for n, kind in enumerate(("HB", "ST"))
+    ]
+    return {
+        "location_id": i,
+        "station_id": i,
+        "name": f"Station {i}",
+        "public_name": f"Station {i}",
+        "latitude": 43.3,
+        "longitude": -79.8,
+        "timezone": "America/Toronto",
+        "timezone_offset_minutes": -300,
+        "station_meta": {
+            "elevation": 85.0,
+            "share_with_wf": True,
+            "share_with_wu": False,
+        },
+        "last_modified_epoch": T0,
+        "created_epoch": T0 - 86400 * 365,
+        "devices": devices,
+        "station_items": [
+            {
+                "location_item_id": 10 * i + n,
+                "location_id": i,
+                "device_id": 1000 * i + 1,
+                "item": item,
+                "sort": n,
+                "station_id": i,
+                "station_item_id": 10 * i + n,
+            }
+            for n, item in enumerate(("air_temperature_humidity", "wind", "rain"))
+        ],
+        "is_local_mode": False,
+        "capabilities": [
+            {
+                "device_id": 1000 * i + 1,
+                "capability": capability,
+                "agl": 2.0,
+                "environment": "outdoor",
+            }
+            for capability in ("air_temperature_humidity", "wind", "rain")
+        ],
+        "state": 1,
+    }
+
+
+def station_set(stations: int = 50) -> dict[str, Any]:
+    """Return a ``stations`` response listing ``stations`` stations."""
+    return {
+        "status": {"status_code": 0, "status_message": "SUCCESS"},
+        "stations": [station(i) for i in range(1, stations + 1)],
+    }
+
+
+def stats_set(days: int = 365) -> dict[str, Any]:
+    """Return a ``stats_station`` response with ``days`` daily rows."""
+    row = [1013.2, 1020.1, 1005.3, 12.5, 18.0, 7.0, 71, 90, 50, 5000]
+    return {
+        "status": {"status_code": 0, "status_message": "SUCCESS"},
+        "station_id": 1,
+        "type": "stats_day",
+        "first_ob_local_day": "2024-01-01",
+        "last_ob_local_day": "2024-12-31",
+        "stats_day": [
+            [f"2024-{1 + d // 31:02d}-{1 + d % 28:02d}", *row] for d in range(days)
+        ],
+        "stats_week": [[f"2024-W{w:02d}", *row] for w in range(1, 53)],
+        "stats_month": [[f"2024-{m:02d}", *row] for m in range(1, 13)],
+        "stats_year": [["2024", *row]],
+        "stats_alltime": row,
+    }
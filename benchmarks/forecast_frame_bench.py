@@ -0,0 +1,94 @@
+"""Benchmark columnar forecast decoding against forecast models.
+
+Decodes the raw JSON bodies of forecasts for many stations (240 hourly and
+10 daily entries each) into ``BetterForecast`` models, and with
+``json.loads`` plus ``ForecastFrame.from_forecast`` into hourly and daily
+columns with integer-coded enums. Reports time per forecast and the memory
+retained by the results, measured with :mod:`tracemalloc`. Requires NumPy.
+
+Run with ``just bench-one forecast_frame`` or
+``uv run python benchmarks/forecast_frame_bench.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+
+from _payloads import better_forecast
+
+from tempestwx._client.processor import model_instance
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.forecast_frame import ForecastFrame
+
+NUMBER = 3
+REPEAT = 5
+STATIONS = 50
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def retained(call: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the result of ``call``."""
+    tracemalloc.start()
+    try:
+        result = call()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def models(bodies: list[bytes]) -> list[BetterForecast | None]:
+    """Decode every body into a forecast model."""
+    decode = model_instance(BetterForecast).decode
+    return [decode(body) for body in bodies]
+
+
+def frames(bodies: list[bytes]) -> list[tuple[ForecastFrame, ForecastFrame]]:
+    """Decode every body into hourly and daily columns."""
+    result = []
+    for body in bodies:
+        data = json.loads(body)
+        result.append(
+            (
+                ForecastFrame.from_forecast(data, "hourly"),
+                ForecastFrame.from_forecast(data, "daily"),
+            )
+        )
+    return result
+
+
+def main() -> None:
+    """Measure model and columnar decoding time and memory."""
+    bodies = [json.dumps(better_forecast()).encode() for _ in range(STATIONS)]
+    forecast = models(bodies[:1])[0]
+    assert forecast is not None
+    hourly, _ = frames(bodies[:1])[0]
+    assert hourly.to_obs() == forecast.to_columns().to_obs()
+    print(f"forecast_frame: best of {REPEAT} x {NUMBER} refreshes of {STATIONS}")
+    cases: dict[str, Callable[[], object]] = {
+        "models": partial(models, bodies),
+        "frames": partial(frames, bodies),
+    }
+    baseline = None
+    for label, call in cases.items():
+        elapsed = best(call) / STATIONS
+        size = retained(call) / STATIONS
+        baseline = baseline or (elapsed, size)
+        print(
+            f"  {label:<6}: {elapsed * 1e3:6.2f} ms {size / 1024:7.1f} KiB"
+            f" per forecast  ({baseline[0] / elapsed:3.1f}x,"
+            f" {baseline[1] / size:4.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
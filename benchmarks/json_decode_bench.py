@@ -0,0 +1,62 @@
+"""Benchmark decoding raw JSON bodies straight into models.
+
+Decodes serialized ``StationSet`` (50 stations), 240-hour ``BetterForecast``
+and ``StatsSet`` (one year of daily rows) bodies two ways: parsing into a
+dictionary first and validating it as keyword arguments, as endpoints used
+to, and validating the bytes directly with ``ModelInstance.decode``
+(``model_validate_json``).
+
+Run with ``just bench-one json_decode`` or
+``uv run python benchmarks/json_decode_bench.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from _payloads import better_forecast, station_set, stats_set
+
+from tempestwx._client.processor import model_instance
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.station_set import StationSet
+from tempestwx._models.stats_set import StatsSet
+
+NUMBER = 100
+REPEAT = 5
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def via_dict(builder: Callable[[Any], Any], body: bytes) -> Any:
+    """Parse ``body`` into a dictionary and validate it as keyword arguments."""
+    return builder(json.loads(body))
+
+
+def main() -> None:
+    """Measure dictionary and direct bytes decoding throughput per model."""
+    cases: dict[str, tuple[Any, dict[str, Any]]] = {
+        "StationSet": (model_instance(StationSet), station_set(50)),
+        "BetterForecast": (model_instance(BetterForecast), better_forecast(240)),
+        "StatsSet": (model_instance(StatsSet), stats_set(365)),
+    }
+    print(f"json_decode: best of {REPEAT} x {NUMBER} decodes")
+    for name, (builder, data) in cases.items():
+        body = json.dumps(data).encode()
+        assert builder.decode(body) == via_dict(builder, body)
+        dictionary = best(partial(via_dict, builder, body))
+        direct = best(partial(builder.decode, body))
+        print(
+            f"  {name:<15}: dict {1 / dictionary:8.0f}/s"
+            f"  bytes {1 / direct:8.0f}/s  ({dictionary / direct:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
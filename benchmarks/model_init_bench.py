@@ -0,0 +1,123 @@
+"""Benchmark the unknown-attribute check of response models.
+
+Decodes a 240-hour ``BetterForecast`` (about 255 model instances, one per
+hourly and daily entry plus the containers) with each way of finding unknown
+input keys the models have used:
+
+- "per-instance keys" rebuilds each class's known-key set (field names and
+  aliases) for every instance, as ``Model.__init__`` used to;
+- "cached keys" compares the input keys with a per-class cached set in a
+  single set difference, as the ``known_keys`` check did;
+- "validation extras" collects unknown keys during validation and reports
+  them from ``Model.model_post_init``, as models do now (this also covers
+  JSON bodies decoded with ``model_validate_json``);
+- "check disabled" sets ``Model.warn_unknown_attributes = False``.
+
+The first two are replayed over every instance of the decoded tree, on top
+of a decode with the check disabled, so their cost includes walking the tree.
+
+Run with ``just bench-one model_init`` or
+``uv run python benchmarks/model_init_bench.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable, Set
+from functools import cache
+from typing import Any
+
+from _payloads import better_forecast
+from pydantic import AliasChoices, AliasPath
+
+from tempestwx._models._serializer import Model
+from tempestwx._models.better_forecast import BetterForecast
+
+NUMBER = 200
+REPEAT = 5
+
+KeySet = Callable[[type[Model]], Set[str]]
+
+
+def count_models(model: Model) -> int:
+    """Return the number of model instances in a model tree."""
+    total = 1
+    for value in model.__dict__.values():
+        items = value if isinstance(value, list) else [value]
+        total += sum(count_models(v) for v in items if isinstance(v, Model))
+    return total
+
+
+def field_keys(cls: type[Model]) -> set[str]:
+    """Return the field names and accepted aliases of a model class."""
+    keys = set(cls.__pydantic_fields__)
+    for info in cls.__pydantic_fields__.values():
+        if isinstance(info.alias, str):
+            keys.add(info.alias)
+        aliases = info.validation_alias
+        choices = aliases.choices if isinstance(aliases, AliasChoices) else [aliases]
+        for choice in choices:
+            if isinstance(choice, str):
+                keys.add(choice)
+            elif isinstance(choice, AliasPath) and isinstance(choice.path[0], str):
+                keys.add(choice.path[0])
+    return keys
+
+
+def check_keys(model: Model, data: Any, keys: KeySet) -> int:
+    """Compare input keys with known keys for every instance of a tree."""
+    unknown = len(data.keys() - keys(type(model)))
+    for name, info in type(model).__pydantic_fields__.items():
+        value = getattr(model, name)
+        if isinstance(value, Model):
+            unknown += check_keys(value, data[info.alias or name], keys)
+        elif isinstance(value, list):
+            raw = data[info.alias or name]
+            for item, item_raw in zip(value, raw, strict=True):
+                if isinstance(item, Model):
+                    unknown += check_keys(item, item_raw, keys)
+    return unknown
+
+
+def measure(label: str, call: Callable[[], object], instances: int) -> float:
+    """Print and return the best per-forecast time of ``call``."""
+    best = min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+    print(
+        f"  {label:<18}: {best * 1e3:7.3f} ms/forecast"
+        f"  {best / instances * 1e6:6.2f} us/instance"
+    )
+    return best
+
+
+def main() -> None:
+    """Measure decoding with each unknown-key check, and with none."""
+    data = better_forecast(hours=240)
+    instances = count_models(BetterForecast(**data))
+
+    def decode() -> BetterForecast:
+        return BetterForecast(**data)
+
+    def replay(keys: KeySet) -> Callable[[], object]:
+        return lambda: check_keys(decode(), data, keys)
+
+    print(f"model_init: 240-hour BetterForecast, {instances} instances")
+    current = measure("validation extras", decode, instances)
+    Model.warn_unknown_attributes = False
+    try:
+        before = measure("per-instance keys", replay(field_keys), instances)
+        cached = measure("cached keys", replay(cache(field_keys)), instances)
+        disabled = measure("check disabled", decode, instances)
+    finally:
+        Model.warn_unknown_attributes = True
+
+    def cost(seconds: float) -> str:
+        return f"{(seconds - disabled) / instances * 1e6:.2f} us"
+
+    print(
+        f"  check cost per instance: {cost(before)} per-instance keys,"
+        f" {cost(cached)} cached keys, {cost(current)} validation extras"
+    )
+
+
+if __name__ == "__main__":
+    main()
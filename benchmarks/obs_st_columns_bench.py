@@ -0,0 +1,65 @@
+"""Benchmark batch columnar decoding of obs_st arrays.
+
+Decodes a day of one-minute ``obs_st`` rows (``DeviceObservation.obs``)
+per row with ``TempestObservation.from_array``, and in one pass into
+columns with ``TempestObservation.from_arrays``, also timing a full walk
+of the lazily built rows. Reports rows per second.
+
+Run with ``just bench-one obs_st_columns`` or
+``uv run python benchmarks/obs_st_columns_bench.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from _payloads import device_observation
+
+from tempestwx._models.obs_st import Raw, TempestObservation
+
+NUMBER = 20
+REPEAT = 5
+ROWS = 1440
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def per_row(obs: list[list[Raw]]) -> list[TempestObservation]:
+    """Decode every array into a model."""
+    return [TempestObservation.from_array(array) for array in obs]
+
+
+def columns_and_rows(obs: list[list[Raw]]) -> list[TempestObservation]:
+    """Decode the arrays into columns, then build every row from them."""
+    return list(TempestObservation.from_arrays(obs).rows())
+
+
+def main() -> None:
+    """Measure per-row and columnar decoding throughput."""
+    data: dict[str, Any] = device_observation(ROWS)
+    obs: list[list[Raw]] = data["obs"]
+    assert per_row(obs) == columns_and_rows(obs)
+    print(f"obs_st_columns: best of {REPEAT} x {NUMBER} decodes of {ROWS} rows")
+    cases: dict[str, Callable[[], object]] = {
+        "from_array per row": partial(per_row, obs),
+        "from_arrays": partial(TempestObservation.from_arrays, obs),
+        "from_arrays + rows": partial(columns_and_rows, obs),
+    }
+    baseline = None
+    for label, call in cases.items():
+        elapsed = best(call)
+        baseline = baseline or elapsed
+        print(
+            f"  {label:<19}: {ROWS / elapsed:10.0f} rows/s"
+            f"  ({baseline / elapsed:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
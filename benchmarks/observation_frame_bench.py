@@ -0,0 +1,97 @@
+"""Benchmark the columnar observation frame against nested lists.
+
+Builds a ``StationObservation`` with a week of one-minute rows (37 fields
+each) and compares the ``obs`` nested lists with
+``StationObservation.to_frame()``: memory held by the rows as decoded from
+JSON and by the frame (measured with :mod:`tracemalloc`), and the mean air
+temperature over a six-hour window, computed by scanning rows in Python and
+by slicing the frame by time. Requires NumPy.
+
+Run with ``just bench-one observation_frame`` or
+``uv run python benchmarks/observation_frame_bench.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from _payloads import T0, station_observation
+
+from tempestwx._models.observation_frame import ObservationFrame
+from tempestwx._models.station_observations import StationObservation
+
+NUMBER = 20
+REPEAT = 5
+ROWS = 7 * 1440
+START = T0 + 3600
+END = START + 6 * 3600
+TOLERANCE = 1e-9
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def retained(call: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the result of ``call``."""
+    tracemalloc.start()
+    try:
+        result = call()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def mean_rows(model: StationObservation) -> float:
+    """Return the window's mean air temperature by scanning rows."""
+    assert model.ob_fields is not None
+    assert model.obs is not None
+    t = model.ob_fields.index("timestamp")
+    a = model.ob_fields.index("air_temperature")
+    values = [
+        row[a]
+        for row in model.obs
+        if START <= row[t] < END and isinstance(row[a], int | float)  # type: ignore[operator]
+    ]
+    return sum(values) / len(values)  # type: ignore[arg-type]
+
+
+def mean_frame(frame: ObservationFrame) -> float:
+    """Return the window's mean air temperature from the frame."""
+    return float(frame.between(START, END).valid("air_temperature").mean())
+
+
+def main() -> None:
+    """Measure memory and a windowed mean for rows and the frame."""
+    data: dict[str, Any] = station_observation(ROWS)
+    model = StationObservation(**data)
+    frame = model.to_frame()
+    assert abs(mean_rows(model) - mean_frame(frame)) < TOLERANCE
+    print(f"observation_frame: {ROWS} rows x {len(frame.fields)} fields")
+    body = json.dumps(data["obs"]).encode()
+    rows_size = retained(partial(json.loads, body))
+    frame_size = retained(model.to_frame)
+    print(
+        f"  memory       : rows {rows_size / 1e6:6.2f} MB"
+        f"  frame {frame_size / 1e6:6.2f} MB  ({rows_size / frame_size:4.1f}x)"
+    )
+    build = best(model.to_frame)
+    print(f"  to_frame     : {build * 1e3:6.2f} ms")
+    scan = best(partial(mean_rows, model))
+    sliced = best(partial(mean_frame, frame))
+    print(
+        f"  window mean  : rows {scan * 1e6:8.1f} us"
+        f"  frame {sliced * 1e6:8.1f} us  ({scan / sliced:5.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
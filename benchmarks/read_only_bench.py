@@ -0,0 +1,90 @@
+"""Benchmark read-only model variants against full models.
+
+Validates JSON arrays of 1000 ``BetterForecastHourlyForecast``,
+``Observation`` and ``Device`` entries (the models held in the largest
+numbers) into full models and into their read-only variants
+(``read_only(cls)``), and reports decoding time and retained memory per
+instance, measured with :mod:`tracemalloc`.
+
+Run with ``just bench-one read_only`` or
+``uv run python benchmarks/read_only_bench.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from _payloads import forecast_hour, observation, station
+from pydantic import TypeAdapter
+
+from tempestwx._models._read_only import read_only
+from tempestwx._models.better_forecast_hourly_forecast import (
+    BetterForecastHourlyForecast,
+)
+from tempestwx._models.device import Device
+from tempestwx._models.observation import Observation
+
+NUMBER = 20
+REPEAT = 5
+SIZE = 1000
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def list_adapter(item: Any) -> TypeAdapter[list[Any]]:
+    """Return a validator of JSON arrays of ``item``."""
+    return TypeAdapter(list[item])
+
+
+def retained(call: Callable[[], object]) -> int:
+    """Return the bytes still allocated by the result of ``call``."""
+    tracemalloc.start()
+    try:
+        result = call()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    """Measure full and read-only decoding time and memory per model."""
+    cases: dict[str, tuple[Any, list[dict[str, Any]]]] = {
+        "Hourly": (
+            BetterForecastHourlyForecast,
+            [forecast_hour(i) for i in range(SIZE)],
+        ),
+        "Observation": (Observation, [observation(i) for i in range(SIZE)]),
+        "Device": (Device, [station(i)["devices"][1] for i in range(SIZE)]),
+    }
+    print(f"read_only: best of {REPEAT} x {NUMBER} decodes of {SIZE} entries")
+    for name, (cls, items) in cases.items():
+        body = json.dumps(items).encode()
+        full = list_adapter(cls)
+        variant = list_adapter(read_only(cls))
+        assert [v.to_model() for v in variant.validate_json(body)] == (
+            full.validate_json(body)
+        )
+        full_time = best(partial(full.validate_json, body))
+        variant_time = best(partial(variant.validate_json, body))
+        full_size = retained(partial(full.validate_json, body)) / SIZE
+        variant_size = retained(partial(variant.validate_json, body)) / SIZE
+        print(
+            f"  {name:<12}: full {full_time / SIZE * 1e6:5.2f} us"
+            f" {full_size:5.0f} B  read-only {variant_time / SIZE * 1e6:5.2f} us"
+            f" {variant_size:5.0f} B  ({full_time / variant_time:3.1f}x,"
+            f" {full_size / variant_size:3.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
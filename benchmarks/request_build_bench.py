@@ -0,0 +1,107 @@
+"""Benchmark per-call request construction overhead.
+
+Measures the cost of building and sending (to a no-op transport) the
+requests for ``obs_station`` and ``forecast``, excluding response decoding.
+The "cold" rows clear the memoization caches before every call, which
+approximates the cost of request construction without memoization; the
+"warm" rows show the steady state of a poller repeating the same calls, and
+the "prepared" rows re-send a request built once with ``prepare()``.
+
+Run with ``just bench-one request_build`` or
+``uv run python benchmarks/request_build_bench.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+from tempestwx import Tempest
+from tempestwx._client import base
+from tempestwx._client.api.tempest_home.observations import observations
+from tempestwx._http import Request, Response, Transport
+
+NUMBER = 20_000
+REPEAT = 5
+
+
+class NullTransport(Transport):
+    """Sync transport that returns an empty response without I/O."""
+
+    def send(self, request: Request) -> Response:
+        """Return an empty successful response."""
+        return Response(url=request.url, headers={}, status_code=200, content=None)
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return False
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+        return
+
+
+def clear_caches() -> None:
+    """Clear every request-construction cache."""
+    base._coerce_enum.cache_clear()
+    base._cached_units.cache_clear()
+    observations._parse_obs_fields.cache_clear()
+
+
+def build_and_send(
+    client: Tempest, builder: Callable[[], tuple[Request, tuple[()]]]
+) -> Callable[[], None]:
+    """Return a callable building a request and sending it."""
+
+    def call() -> None:
+        request, _ = builder()
+        client.send(request)
+
+    return call
+
+
+def measure(label: str, call: Callable[[], None], cold: bool) -> None:
+    """Print the best per-call time of ``call``."""
+
+    def run() -> None:
+        if cold:
+            clear_caches()
+        call()
+
+    best = min(timeit.repeat(run, number=NUMBER, repeat=REPEAT)) / NUMBER
+    print(f"  {label:<22}: {best * 1e6:7.2f} us/call")
+
+
+def main() -> None:
+    """Measure cold and warm build cost for each endpoint."""
+    client = Tempest(token="bench", transport=NullTransport())
+    obs_station = Tempest.obs_station.__wrapped__  # type: ignore[attr-defined]
+    forecast = Tempest.forecast.__wrapped__  # type: ignore[attr-defined]
+
+    calls = {
+        "obs_station": build_and_send(
+            client,
+            lambda: obs_station(
+                client, 1234, bucket=5, obs_fields="timestamp,air_temperature"
+            ),
+        ),
+        "forecast": build_and_send(
+            client, lambda: forecast(client, 1234, units_temp="f", units_wind="mph")
+        ),
+    }
+    print(f"request_build: best of {REPEAT} x {NUMBER} calls")
+    prepared = {
+        "obs_station": client.obs_station.prepare(
+            1234, bucket=5, obs_fields="timestamp,air_temperature"
+        ),
+        "forecast": client.forecast.prepare(1234, units_temp="f", units_wind="mph"),
+    }
+    for name, call in calls.items():
+        measure(f"{name} (cold)", call, cold=True)
+        measure(f"{name} (warm)", call, cold=False)
+        measure(f"{name} (prepared)", prepared[name], cold=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark lazy row views against per-row array models.
+
+Walks a year of hourly ``obs_st`` rows, reading ``air_temperature`` from
+each, through ``TempestObservation.from_array`` models and through
+``row_views``. Reports time per row and the peak memory allocated while
+iterating, measured with :mod:`tracemalloc`.
+
+Run with ``just bench-one row_view`` or
+``uv run python benchmarks/row_view_bench.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+
+from _payloads import obs_st_row
+
+from tempestwx._models.obs_st import Raw, TempestObservation
+from tempestwx._models.row_view import row_views
+
+NUMBER = 3
+REPEAT = 5
+ROWS = 365 * 24
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def peak(call: Callable[[], object]) -> int:
+    """Return the peak bytes allocated while running ``call``."""
+    tracemalloc.start()
+    try:
+        call()
+        _, size = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+def models(obs: list[list[Raw]]) -> float:
+    """Sum the temperatures of a model built per row."""
+    total = 0.0
+    for array in obs:
+        total += TempestObservation.from_array(array).air_temperature or 0.0
+    return total
+
+
+def views(obs: list[list[Raw]]) -> float:
+    """Sum the temperatures through a view per row."""
+    total = 0.0
+    for view in row_views(TempestObservation, obs):
+        total += view.air_temperature or 0.0  # type: ignore[attr-defined]
+    return total
+
+
+def main() -> None:
+    """Measure per-row iteration time and peak memory."""
+    obs = [obs_st_row(i * 60) for i in range(ROWS)]
+    assert models(obs) == views(obs)
+    print(f"row_view: best of {REPEAT} x {NUMBER} walks of {ROWS} rows")
+    model_time = best(partial(models, obs))
+    view_time = best(partial(views, obs))
+    model_peak = peak(partial(models, obs))
+    view_peak = peak(partial(views, obs))
+    print(f"  models: {model_time / ROWS * 1e9:6.0f} ns/row  peak {model_peak:7d} B")
+    print(
+        f"  views : {view_time / ROWS * 1e9:6.0f} ns/row  peak {view_peak:7d} B"
+        f"  ({model_time / view_time:4.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
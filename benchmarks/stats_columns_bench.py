@@ -0,0 +1,71 @@
+"""Benchmark columnar station statistics against per-row models.
+
+Computes the mean daily high temperature over ten years of ``stats_day``
+rows, by decoding every row with ``StatsDay.from_array``, by building
+``StatsSet.to_columns()`` and averaging its column, and by averaging the
+column of an already built frame, as repeated queries do. Requires NumPy.
+
+Run with ``just bench-one stats_columns`` or
+``uv run python benchmarks/stats_columns_bench.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+from _payloads import stats_set
+
+from tempestwx._models.observation_frame import ObservationFrame
+from tempestwx._models.stats_day import StatsDay
+from tempestwx._models.stats_set import StatsSet
+
+NUMBER = 10
+REPEAT = 5
+DAYS = 10 * 365
+TOLERANCE = 1e-9
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def per_row(stats: StatsSet) -> float:
+    """Average the daily highs of a model built per row."""
+    highs = [
+        StatsDay.from_array(row[1:]).temperature_high for row in stats.stats_day or []
+    ]
+    valid = [h for h in highs if h is not None]
+    return sum(valid) / len(valid)
+
+
+def columnar(stats: StatsSet) -> float:
+    """Average the daily highs of the columnar view."""
+    return float(stats.to_columns("day").valid("temperature_high").mean())
+
+
+def query(frame: ObservationFrame) -> float:
+    """Average the daily highs of a built frame."""
+    return float(frame.valid("temperature_high").mean())
+
+
+def main() -> None:
+    """Measure both ways of computing the climatology."""
+    stats = StatsSet(**stats_set(DAYS))
+    assert abs(per_row(stats) - columnar(stats)) < TOLERANCE
+    print(f"stats_columns: best of {REPEAT} x {NUMBER} means over {DAYS} days")
+    row_time = best(partial(per_row, stats))
+    cases = {
+        "to_columns": partial(columnar, stats),
+        "built frame": partial(query, stats.to_columns("day")),
+    }
+    print(f"  per-row models: {row_time * 1e3:8.3f} ms")
+    for label, call in cases.items():
+        elapsed = best(call)
+        print(f"  {label:<14}: {elapsed * 1e3:8.3f} ms  ({row_time / elapsed:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark StrEnum value parsing on a forecast payload.
+
+Parses the ``conditions``, ``icon``, ``precip_icon`` and ``precip_type``
+strings of every hourly and daily entry of a 10-day forecast with
+``StrEnum._validate`` (the pydantic validator), as sent and in upper case
+(the case-insensitive path), and validates the whole forecast body.
+
+Run with ``just bench-one str_enum`` or
+``uv run python benchmarks/str_enum_bench.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from _payloads import better_forecast
+
+from tempestwx._client.processor import model_instance
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.units_default import Conditions, Icon, PrecipIcon, PrecipType
+
+NUMBER = 50
+REPEAT = 5
+ENUMS: dict[str, Any] = {
+    "conditions": Conditions,
+    "icon": Icon,
+    "precip_icon": PrecipIcon,
+    "precip_type": PrecipType,
+}
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def parse(values: list[tuple[Any, str]]) -> list[Any]:
+    """Parse every value with its enum's validator."""
+    return [enum._validate(value) for enum, value in values]
+
+
+def main() -> None:
+    """Measure enum parsing per value and whole-forecast validation."""
+    data = better_forecast()
+    entries = data["forecast"]["hourly"] + data["forecast"]["daily"]
+    values = [
+        (enum, entry[name])
+        for entry in entries
+        for name, enum in ENUMS.items()
+        if name in entry
+    ]
+    upper = [(enum, value.upper()) for enum, value in values]
+    assert parse(values) == parse(upper)
+    body = json.dumps(data).encode()
+    decode = model_instance(BetterForecast).decode
+    print(f"str_enum: best of {REPEAT} x {NUMBER}, {len(values)} enum values")
+    for label, items in (("as sent", values), ("upper case", upper)):
+        elapsed = best(partial(parse, items))
+        print(f"  {label:<10}: {elapsed / len(items) * 1e9:6.0f} ns/value")
+    print(f"  forecast  : {best(partial(decode, body)) * 1e3:6.2f} ms/body")
+
+
+if __name__ == "__main__":
+    main()
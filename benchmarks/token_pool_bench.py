@@ -0,0 +1,81 @@
+"""Benchmark per-task tenant token switching with ``TokenPool``.
+
+Runs 10,000 concurrent asyncio tasks against an in-memory async transport,
+first with the client's base token and then with every task bound to a
+different tenant via ``client.tenant()``. The difference is the per-task
+cost of tenant scoping and quota accounting.
+
+Run with ``just bench-one token_pool`` or
+``uv run python benchmarks/token_pool_bench.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from tempestwx import Tempest
+from tempestwx._auth import TokenPool
+from tempestwx._http import Request, Response, Transport
+
+TASKS = 10_000
+TENANTS = 1_000
+ROUNDS = 5
+
+
+class MemoryTransport(Transport):
+    """Async transport answering every request from memory."""
+
+    async def send(self, request: Request) -> Response:
+        """Return an empty successful response."""
+        return Response(url=request.url, headers={}, status_code=200, content={})
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return True
+
+    async def close(self) -> None:
+        """Close transport (no-op)."""
+        return
+
+
+async def run(client: Tempest, scoped: bool) -> float:
+    """Run one round of concurrent tasks and return elapsed seconds."""
+
+    async def plain() -> None:
+        await client.stations()
+
+    async def tenant(i: int) -> None:
+        with client.tenant(f"tenant-{i % TENANTS}"):
+            await client.stations()
+
+    start = time.perf_counter()
+    if scoped:
+        await asyncio.gather(*(tenant(i) for i in range(TASKS)))
+    else:
+        await asyncio.gather(*(plain() for _ in range(TASKS)))
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    """Compare base-token and tenant-scoped rounds."""
+    pool = TokenPool()
+    for i in range(TENANTS):
+        pool.add(f"tenant-{i}", f"token-{i}", quota=1_000_000)
+    client = Tempest(token="base", transport=MemoryTransport(), token_pool=pool)
+
+    baseline = min([await run(client, scoped=False) for _ in range(ROUNDS)])
+    scoped = min([await run(client, scoped=True) for _ in range(ROUNDS)])
+    overhead_us = (scoped - baseline) / TASKS * 1e6
+    print(f"token_pool: {TASKS} tasks, {TENANTS} tenants (best of {ROUNDS})")
+    print(f"  base token   : {baseline * 1e3:8.1f} ms")
+    print(f"  tenant scope : {scoped * 1e3:8.1f} ms")
+    print(
+        f"  overhead     : {overhead_us:8.2f} us/task "
+        f"({(scoped / baseline - 1) * 100:+.1f}%)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
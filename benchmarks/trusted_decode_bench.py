@@ -0,0 +1,54 @@
+"""Benchmark trusted (unvalidated) decoding against full validation.
+
+Decodes parsed JSON payloads of ``StationSet`` (50 stations), 240-hour
+``BetterForecast`` and ``StatsSet`` (one year of daily rows) with the
+processor used by the endpoints, once validating (``model_instance``) and
+once constructing them as a trusted client does (``ModelInstance.construct``).
+
+Run with ``just bench-one trusted_decode`` or
+``uv run python benchmarks/trusted_decode_bench.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from _payloads import better_forecast, station_set, stats_set
+
+from tempestwx._client.processor import model_instance
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.station_set import StationSet
+from tempestwx._models.stats_set import StatsSet
+
+NUMBER = 100
+REPEAT = 5
+
+
+def best(call: Callable[[], object]) -> float:
+    """Return the best time per call of ``call`` in seconds."""
+    return min(timeit.repeat(call, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    """Measure validated and trusted decoding throughput per model."""
+    cases: dict[str, tuple[Any, dict[str, Any]]] = {
+        "StationSet": (model_instance(StationSet), station_set(50)),
+        "BetterForecast": (model_instance(BetterForecast), better_forecast(240)),
+        "StatsSet": (model_instance(StatsSet), stats_set(365)),
+    }
+    print(f"trusted_decode: best of {REPEAT} x {NUMBER} decodes")
+    for name, (builder, data) in cases.items():
+        assert builder(data) == builder.construct(data)
+        validated = best(partial(builder, data))
+        trusted = best(partial(builder.construct, data))
+        print(
+            f"  {name:<15}: validated {1 / validated:8.0f}/s"
+            f"  trusted {1 / trusted:8.0f}/s  ({validated / trusted:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,21 @@
 """Authentication token management.
 
-Provides token types and thread-safe token storage using ContextVars.
+Provides token types and thread-safe token storage using ContextVars, plus
+``TokenPool`` for scoping per-tenant tokens and quotas to concurrent tasks.
 
 Clients typically interact with token management through the high-level
 ``Tempest`` client.
 """
 
+from .pool import QuotaExceededError, Tenant, TenantUsage, TokenPool
 from .token import AccessToken, Token
 
 __all__ = [
     "AccessToken",
     "Token",
+    # Multi-tenant pool
+    "QuotaExceededError",
+    "Tenant",
+    "TenantUsage",
+    "TokenPool",
 ]
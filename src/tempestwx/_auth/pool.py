@@ -0,0 +1,266 @@
+"""Multi-tenant token pool with per-task token scoping.
+
+This module provides ``TokenPool``, a registry of tenant access tokens that
+lets many concurrent tasks share a single client (and therefore a single
+transport and connection pool) while each acts on behalf of a different
+tenant. The active tenant is tracked in a ContextVar, so each asyncio task
+or thread sees only the tenant it entered, without mutating shared client
+state.
+
+Each tenant may carry a request quota enforced over a fixed time window. A
+request made while a tenant's quota is exhausted raises
+``QuotaExceededError`` before anything is sent.
+
+Classes:
+    Tenant: A tenant's token, quota, and usage counters.
+    TenantUsage: Snapshot of a tenant's usage counters.
+    TokenPool: Registry of tenants with ContextVar-based scoping.
+    QuotaExceededError: Raised when a tenant exceeds its request quota.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+
+
+class QuotaExceededError(Exception):
+    """A tenant has exhausted its request quota for the current window.
+
+    Attributes:
+        tenant_id: Tenant whose quota was exceeded.
+        retry_after: Seconds until the quota window resets.
+    """
+
+    def __init__(self, tenant_id: str, retry_after: float) -> None:
+        super().__init__(
+            f"Quota exceeded for tenant {tenant_id!r}; retry after {retry_after:.1f}s."
+        )
+        self.tenant_id = tenant_id
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class TenantUsage:
+    """Snapshot of a tenant's usage counters.
+
+    Attributes:
+        tenant_id: Tenant identifier.
+        total: Requests charged since the tenant was added.
+        rejected: Requests refused because the quota was exhausted.
+        window_requests: Requests charged in the current quota window.
+        quota: Requests allowed per window, or None if unlimited.
+    """
+
+    tenant_id: str
+    total: int
+    rejected: int
+    window_requests: int
+    quota: int | None
+
+
+class Tenant:
+    """A tenant's access token with quota accounting.
+
+    Args:
+        tenant_id: Tenant identifier.
+        token: Bearer token used for this tenant's requests.
+        quota: Requests allowed per window. None means unlimited.
+        window: Quota window length in seconds.
+        clock: Monotonic clock used for quota windows.
+    """
+
+    __slots__ = (
+        "_clock",
+        "_lock",
+        "_window_requests",
+        "_window_start",
+        "quota",
+        "rejected",
+        "tenant_id",
+        "token",
+        "total",
+        "window",
+    )
+
+    def __init__(
+        self,
+        tenant_id: str,
+        token: str,
+        quota: int | None = None,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if quota is not None and quota <= 0:
+            raise ValueError("quota must be a positive integer or None.")
+        if window <= 0:
+            raise ValueError("window must be positive.")
+        self.tenant_id = tenant_id
+        self.token = token
+        self.quota = quota
+        self.window = window
+        self.total = 0
+        self.rejected = 0
+        self._clock = clock
+        self._lock = Lock()
+        self._window_start = clock()
+        self._window_requests = 0
+
+    def __repr__(self) -> str:
+        options = [
+            f"tenant_id={self.tenant_id!r}",
+            f"quota={self.quota!r}",
+            f"window={self.window!r}",
+        ]
+        return type(self).__name__ + "(" + ", ".join(options) + ")"
+
+    def charge(self) -> None:
+        """Account for one request.
+
+        Raises:
+            QuotaExceededError: If the quota for the current window is used up.
+        """
+        with self._lock:
+            if self.quota is not None:
+                now = self._clock()
+                elapsed = now - self._window_start
+                if elapsed >= self.window:
+                    self._window_start = now
+                    self._window_requests = 0
+                    elapsed = 0.0
+                if self._window_requests >= self.quota:
+                    self.rejected += 1
+                    raise QuotaExceededError(self.tenant_id, self.window - elapsed)
+            self._window_requests += 1
+            self.total += 1
+
+    def usage(self) -> TenantUsage:
+        """Return a snapshot of this tenant's usage counters."""
+        with self._lock:
+            return TenantUsage(
+                tenant_id=self.tenant_id,
+                total=self.total,
+                rejected=self.rejected,
+                window_requests=self._window_requests,
+                quota=self.quota,
+            )
+
+
+class TokenPool:
+    """Registry of tenant tokens scoped per task via a ContextVar.
+
+    A pool is attached to a client with ``Tempest(token_pool=pool)``. Inside
+    ``pool.scope(tenant_id)`` (or ``client.tenant(tenant_id)``) the client
+    authenticates with that tenant's token and charges its quota. Scopes are
+    isolated per asyncio task and per thread, so thousands of concurrent tasks
+    can each act for a different tenant over one shared transport.
+
+    Args:
+        clock: Monotonic clock used for tenant quota windows.
+
+    Example:
+        >>> pool = TokenPool()
+        >>> pool.add("acme", "acme-token", quota=100, window=60)
+        >>> async with Tempest(asynchronous=True, token_pool=pool) as twx:
+        ...     with twx.tenant("acme"):
+        ...         stations = await twx.stations()
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._tenants: dict[str, Tenant] = {}
+        self._current: ContextVar[Tenant | None] = ContextVar(
+            "_tenant_cv", default=None
+        )
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        return tenant_id in self._tenants
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(tenants={len(self._tenants)})"
+
+    def add(
+        self,
+        tenant_id: str,
+        token: str,
+        *,
+        quota: int | None = None,
+        window: float = 60.0,
+    ) -> Tenant:
+        """Register (or replace) a tenant.
+
+        Args:
+            tenant_id: Tenant identifier.
+            token: Bearer token for the tenant.
+            quota: Requests allowed per window. None means unlimited.
+            window: Quota window length in seconds.
+
+        Returns:
+            The registered tenant.
+        """
+        tenant = Tenant(tenant_id, token, quota=quota, window=window, clock=self._clock)
+        self._tenants[tenant_id] = tenant
+        return tenant
+
+    def remove(self, tenant_id: str) -> None:
+        """Unregister a tenant. Scopes already entered keep their tenant."""
+        self._tenants.pop(tenant_id, None)
+
+    def get(self, tenant_id: str) -> Tenant:
+        """Return a registered tenant.
+
+        Raises:
+            KeyError: If the tenant is not registered.
+        """
+        try:
+            return self._tenants[tenant_id]
+        except KeyError:
+            raise KeyError(f"Unknown tenant: {tenant_id!r}") from None
+
+    def usage(self, tenant_id: str) -> TenantUsage:
+        """Return a snapshot of a tenant's usage counters."""
+        return self.get(tenant_id).usage()
+
+    def current(self) -> Tenant | None:
+        """Return the tenant bound to the current context, if any."""
+        return self._current.get()
+
+    def charge(self) -> None:
+        """Charge one request to the current tenant, if one is bound.
+
+        Raises:
+            QuotaExceededError: If the current tenant's quota is used up.
+        """
+        tenant = self._current.get()
+        if tenant is not None:
+            tenant.charge()
+
+    @contextmanager
+    def scope(self, tenant_id: str) -> Generator[Tenant]:
+        """Bind a tenant to the current context (task or thread).
+
+        Args:
+            tenant_id: Registered tenant to act for.
+
+        Yields:
+            The bound tenant.
+
+        Raises:
+            KeyError: If the tenant is not registered.
+        """
+        tenant = self.get(tenant_id)
+        cv_token = self._current.set(tenant)
+        try:
+            yield tenant
+        finally:
+            self._current.reset(cv_token)
+
+
+__all__ = ["QuotaExceededError", "Tenant", "TenantUsage", "TokenPool"]
@@ -0,0 +1,33 @@
+"""Crash-resumable backfills of observation history.
+
+Splits long ``obs_station`` / ``obs_device`` backfills into work units and
+runs them with bounded concurrency:
+
+- ``plan`` - split targets and a time range into ``WorkUnit`` chunks
+- ``Journal`` - durable (fsynced) JSONL record of completed units
+- ``WorkQueue`` - interface the runner claims units from
+- ``JournalQueue`` - in-process queue that skips journaled units on restart
+- ``LeaseQueue`` - SQLite queue with expiring leases, shared by worker
+  processes on one machine or a shared filesystem
+- ``BackfillRunner`` - fetches units, hands results to a sink, and reports
+  throughput and ETA
+"""
+
+from .journal import Journal
+from .lease import LeaseQueue
+from .plan import BackfillEndpoint, WorkUnit, plan
+from .queue import JournalQueue, WorkQueue
+from .runner import BackfillProgress, BackfillRunner, Sink
+
+__all__ = [
+    "BackfillEndpoint",
+    "BackfillProgress",
+    "BackfillRunner",
+    "Journal",
+    "JournalQueue",
+    "LeaseQueue",
+    "Sink",
+    "WorkQueue",
+    "WorkUnit",
+    "plan",
+]
@@ -0,0 +1,104 @@
+"""Durable completion journal for backfills.
+
+``Journal`` appends one JSON line per completed work unit and fsyncs it
+before returning, so a unit recorded as done survives a crash or deploy.
+Reopening the journal restores the set of completed keys; a line truncated
+by a crash mid-write is ignored (that unit simply runs again).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import IO, Any
+
+
+class Journal:
+    """Append-only JSONL journal of completed work unit keys.
+
+    Args:
+        path: Journal file; created if missing.
+        fsync: Flush each record to stable storage before returning.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, fsync: bool = True) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self._lock = Lock()
+        self._done: set[str] = set()
+        if self.path.exists():
+            self._done.update(self._replay())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: IO[str] | None = self.path.open("a", encoding="utf-8")
+        if self._file.tell() and not self._ends_with_newline():
+            # Terminate a record truncated by a crash so the next one parses
+            self._file.write("\n")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={str(self.path)!r}, done={len(self._done)})"
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._done
+
+    def __enter__(self) -> Journal:
+        """Enter context; the journal is closed on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
+        """Exit context and close the journal file."""
+        self.close()
+
+    def record(self, key: str, **info: Any) -> None:
+        """Durably record a unit as done.
+
+        Args:
+            key: Work unit key.
+            **info: Extra JSON-serializable details to store with the record.
+
+        Raises:
+            RuntimeError: If the journal is closed.
+        """
+        line = json.dumps({"key": key, "ts": time.time(), **info}) + "\n"
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("Journal is closed.")
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._done.add(key)
+
+    def done(self) -> frozenset[str]:
+        """Return the keys recorded as done."""
+        return frozenset(self._done)
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _ends_with_newline(self) -> bool:
+        with self.path.open("rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _replay(self) -> list[str]:
+        keys = []
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    keys.append(json.loads(line)["key"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return keys
+
+
+__all__ = ["Journal"]
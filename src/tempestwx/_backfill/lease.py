@@ -0,0 +1,239 @@
+"""SQLite lease queue shared by backfill workers.
+
+``LeaseQueue`` stores work units in a SQLite database that several processes
+(or machines mounting the same filesystem) open at once. Each worker runs its
+own ``Tempest`` client and ``BackfillRunner`` over the queue:
+
+- :meth:`LeaseQueue.claim` leases pending units to the calling worker for
+  ``lease_seconds`` inside an immediate transaction, so no two workers hold
+  the same unit.
+- The runner renews a lease every ``heartbeat`` seconds while its unit runs.
+- :meth:`LeaseQueue.complete` marks a unit done; it is never handed out again.
+- A worker that dies (or stalls) leaves its leases to expire; expired leases
+  are claimed again by the remaining workers. Completions and failures are
+  only recorded by the worker still holding the lease.
+
+Seeding with :meth:`LeaseQueue.add` is idempotent, so every worker may seed
+the same plan on startup.
+
+Note:
+    SQLite locking over network filesystems is only as reliable as the
+    filesystem's locks. The default rollback journal works on shared mounts;
+    ``wal=True`` is faster but only for workers on a single machine.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sqlite3
+import time
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any
+
+from .plan import WorkUnit
+from .queue import WorkQueue
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    key TEXT PRIMARY KEY,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS units_state ON units (state, lease_until);
+"""
+
+
+class LeaseQueue(WorkQueue):
+    """Work queue in a shared SQLite database with expiring row leases.
+
+    Args:
+        path: Database file; created if missing.
+        worker_id: Identifier recorded on leases. Defaults to host and pid.
+        lease_seconds: How long a claimed unit stays reserved for its worker
+            without a renewal.
+        heartbeat: Seconds between lease renewals while a unit runs.
+            Defaults to a third of ``lease_seconds``.
+        max_attempts: Failed attempts before a unit is left failed.
+        wal: Use write-ahead logging (single machine only).
+        timeout: Seconds to wait for a database lock held by another worker.
+        clock: Wall clock (Unix epoch seconds), shared by all workers.
+
+    Example:
+        >>> queue = LeaseQueue("/shared/backfill.db")
+        >>> queue.add(plan("obs_station", station_ids, start, end))
+        >>> await BackfillRunner(twx, queue).run()
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        worker_id: str | None = None,
+        lease_seconds: float = 300.0,
+        heartbeat: float | None = None,
+        max_attempts: int = 3,
+        wal: bool = False,
+        timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive.")
+        if heartbeat is not None and not 0 < heartbeat < lease_seconds:
+            raise ValueError("heartbeat must be positive and less than lease_seconds.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.path = os.fspath(path)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat = heartbeat if heartbeat is not None else lease_seconds / 3
+        self.max_attempts = max_attempts
+        self._clock = clock
+        # Shared with the runner's worker threads; transactions hold the lock
+        self._lock = Lock()
+        self._db = sqlite3.connect(
+            self.path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        if wal:
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        options = [
+            f"path={self.path!r}",
+            f"worker_id={self.worker_id!r}",
+            f"lease_seconds={self.lease_seconds!r}",
+        ]
+        return type(self).__name__ + "(" + ", ".join(options) + ")"
+
+    def __enter__(self) -> LeaseQueue:
+        """Enter context; the connection is closed on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
+        """Exit context and close the database connection."""
+        self.close()
+
+    def add(self, units: Iterable[WorkUnit]) -> int:
+        """Add units to the queue, ignoring ones already present.
+
+        Returns:
+            Number of units added.
+        """
+        with self._transaction():
+            before = self._db.total_changes
+            self._db.executemany(
+                "INSERT OR IGNORE INTO units (key) VALUES (?)",
+                ((u.key,) for u in units),
+            )
+            return self._db.total_changes - before
+
+    def claim(self, limit: int = 1) -> list[WorkUnit]:
+        """Lease up to ``limit`` pending (or expired) units to this worker."""
+        now = self._clock()
+        with self._transaction():
+            rows = self._db.execute(
+                "SELECT key FROM units WHERE state = 'pending'"
+                " OR (state = 'leased' AND lease_until <= ?)"
+                " ORDER BY rowid LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            self._db.executemany(
+                "UPDATE units SET state = 'leased', owner = ?, lease_until = ?"
+                " WHERE key = ?",
+                ((self.worker_id, now + self.lease_seconds, key) for (key,) in rows),
+            )
+        return [WorkUnit.from_key(key) for (key,) in rows]
+
+    def renew(self, unit: WorkUnit) -> bool:
+        """Extend this worker's lease on a unit.
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker).
+        """
+        with self._transaction():
+            cursor = self._db.execute(
+                "UPDATE units SET lease_until = ?"
+                " WHERE key = ? AND state = 'leased' AND owner = ?",
+                (self._clock() + self.lease_seconds, unit.key, self.worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, unit: WorkUnit) -> bool:
+        """Mark a unit done if this worker still holds its lease.
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker).
+        """
+        with self._transaction():
+            cursor = self._db.execute(
+                "UPDATE units SET state = 'done', lease_until = NULL, error = NULL"
+                " WHERE key = ? AND state = 'leased' AND owner = ?",
+                (unit.key, self.worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, unit: WorkUnit, error: str) -> bool:
+        """Return a unit to the queue, or leave it failed after ``max_attempts``.
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker).
+        """
+        with self._transaction():
+            cursor = self._db.execute(
+                "UPDATE units SET attempts = attempts + 1, error = ?,"
+                " lease_until = NULL, owner = NULL,"
+                " state = CASE WHEN attempts + 1 < ? THEN 'pending' ELSE 'failed' END"
+                " WHERE key = ? AND state = 'leased' AND owner = ?",
+                (error, self.max_attempts, unit.key, self.worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def total(self) -> int:
+        """Number of units in the queue."""
+        return int(self._query("SELECT COUNT(*) FROM units")[0][0])
+
+    def remaining(self) -> int:
+        """Number of units not done."""
+        return int(
+            self._query("SELECT COUNT(*) FROM units WHERE state != 'done'")[0][0]
+        )
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of units in each state."""
+        return dict(self._query("SELECT state, COUNT(*) FROM units GROUP BY state"))
+
+    @property
+    def failed(self) -> dict[WorkUnit, str]:
+        """Return units that used up their attempts, with their last error."""
+        rows = self._query("SELECT key, error FROM units WHERE state = 'failed'")
+        return {WorkUnit.from_key(key): error or "" for key, error in rows}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def _query(self, sql: str) -> list[Any]:
+        """Return all rows of a read-only query."""
+        with self._lock:
+            return self._db.execute(sql).fetchall()
+
+    @contextmanager
+    def _transaction(self) -> Generator[None]:
+        """Run a ``BEGIN IMMEDIATE`` transaction (takes the write lock up front)."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+
+__all__ = ["LeaseQueue"]
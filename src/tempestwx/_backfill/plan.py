@@ -0,0 +1,115 @@
+"""Backfill work units and planning.
+
+A backfill is split into ``WorkUnit``s: one endpoint call for one station or
+device over one time chunk. Units are immutable and identified by a stable
+string key, which journals and queues use to record completion.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+BackfillEndpoint = Literal["obs_station", "obs_device"]
+
+
+@dataclass(frozen=True, order=True)
+class WorkUnit:
+    """One endpoint call over one time chunk.
+
+    Attributes:
+        endpoint: ``"obs_station"`` or ``"obs_device"``.
+        target_id: Station id or device id.
+        start: Chunk start, Unix epoch seconds (inclusive).
+        end: Chunk end, Unix epoch seconds (inclusive).
+    """
+
+    endpoint: BackfillEndpoint
+    target_id: int
+    start: int
+    end: int
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the unit."""
+        return f"{self.endpoint}:{self.target_id}:{self.start}:{self.end}"
+
+    @classmethod
+    def from_key(cls, key: str) -> WorkUnit:
+        """Rebuild a unit from its key.
+
+        Raises:
+            ValueError: If the key is malformed.
+        """
+        endpoint, target_id, start, end = key.split(":")
+        if endpoint not in ("obs_station", "obs_device"):
+            raise ValueError(f"Unknown backfill endpoint: {endpoint!r}")
+        return cls(endpoint, int(target_id), int(start), int(end))  # type: ignore[arg-type]
+
+    def fetch(self, client: Any) -> Any:
+        """Call the unit's endpoint on a client.
+
+        Returns:
+            The endpoint result, or a coroutine for asynchronous clients.
+        """
+        if self.endpoint == "obs_station":
+            return client.obs_station(
+                self.target_id, start_time=self.start, end_time=self.end
+            )
+        return client.obs_device(
+            self.target_id, time_start=self.start, time_end=self.end
+        )
+
+
+def plan(
+    endpoint: BackfillEndpoint,
+    target_ids: Iterable[int],
+    start: int,
+    end: int,
+    chunk_seconds: int = 86_400,
+) -> list[WorkUnit]:
+    """Split a backfill into target x time-chunk work units.
+
+    Chunks are aligned to multiples of ``chunk_seconds`` (UTC), so the same
+    range always yields the same keys; the first and last chunks are
+    clipped to ``[start, end]``. Chunk ends are inclusive, as for the API's
+    time ranges, so each chunk ends one second before the next one starts
+    and no observation falls into two units.
+
+    Args:
+        endpoint: ``"obs_station"`` or ``"obs_device"``.
+        target_ids: Station or device ids.
+        start: Range start, Unix epoch seconds.
+        end: Range end, Unix epoch seconds.
+        chunk_seconds: Chunk length in seconds.
+
+    Returns:
+        Units ordered by chunk, then target, so early chunks of every target
+        finish first.
+
+    Raises:
+        ValueError: If the range or chunk length is invalid.
+    """
+    if endpoint not in ("obs_station", "obs_device"):
+        raise ValueError(f"Unknown backfill endpoint: {endpoint!r}")
+    if start <= 0 or end <= start:
+        raise ValueError("start must be positive and less than end.")
+    if chunk_seconds <= 0:
+        raise ValueError("chunk_seconds must be positive.")
+    targets = sorted(set(target_ids))
+    if any(t <= 0 for t in targets):
+        raise ValueError("target ids must be positive integers.")
+
+    units: list[WorkUnit] = []
+    chunk_start = start - start % chunk_seconds
+    while chunk_start < end:
+        chunk_end = chunk_start + chunk_seconds
+        lo = max(start, chunk_start)
+        hi = end if chunk_end >= end else chunk_end - 1
+        units.extend(WorkUnit(endpoint, t, lo, hi) for t in targets)
+        chunk_start = chunk_end
+    return units
+
+
+__all__ = ["BackfillEndpoint", "WorkUnit", "plan"]
@@ -0,0 +1,152 @@
+"""Work queues feeding the backfill runner.
+
+``WorkQueue`` is the interface the runner pulls units from. A queue hands
+out units with :meth:`WorkQueue.claim`, and is told the outcome of each with
+:meth:`WorkQueue.complete` or :meth:`WorkQueue.fail`. Queues whose claims
+expire set :attr:`WorkQueue.heartbeat`, and the runner keeps each claim alive
+with :meth:`WorkQueue.renew` while the unit runs. The runner calls a queue
+from worker threads, so implementations must be thread-safe. They decide how
+claims and completions are stored:
+
+- ``JournalQueue`` - a planned list of units in one process, with
+  completions recorded in a durable :class:`Journal`
+- ``LeaseQueue`` (in ``lease``) - units in a shared SQLite database, leased
+  to worker processes
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable
+from threading import Lock
+
+from .journal import Journal
+from .plan import WorkUnit
+
+
+class WorkQueue(ABC):
+    """Source of backfill work units.
+
+    Attributes:
+        heartbeat: Seconds between renewals of a claim while its unit runs,
+            or None if claims do not expire.
+    """
+
+    heartbeat: float | None = None
+
+    @abstractmethod
+    def claim(self, limit: int = 1) -> list[WorkUnit]:
+        """Take up to ``limit`` pending units; an empty list means no work is left."""
+
+    @abstractmethod
+    def complete(self, unit: WorkUnit) -> bool:
+        """Durably mark a claimed unit as done.
+
+        Returns:
+            False if the claim was lost and the outcome was not recorded.
+        """
+
+    @abstractmethod
+    def fail(self, unit: WorkUnit, error: str) -> bool:
+        """Report a failed attempt at a claimed unit.
+
+        The unit is made available again unless it has used up its attempts.
+
+        Returns:
+            False if the claim was lost and the outcome was not recorded.
+        """
+
+    def renew(self, unit: WorkUnit) -> bool:  # noqa: ARG002 - optional hook
+        """Keep the claim on a unit alive; False if it was lost."""
+        return True
+
+    @abstractmethod
+    def total(self) -> int:
+        """Number of units in the backfill, done or not."""
+
+    @abstractmethod
+    def remaining(self) -> int:
+        """Number of units not yet done (pending, claimed, or failed)."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release resources held by the queue."""
+
+
+class JournalQueue(WorkQueue):
+    """In-process queue of planned units, journaled for crash recovery.
+
+    Units already recorded in the journal are skipped, so rerunning the same
+    plan after a crash resumes where the previous run stopped.
+
+    Args:
+        units: Planned units.
+        journal: Journal of completed units, or a path to open one at.
+        max_attempts: Attempts per unit before it is left failed for this run.
+    """
+
+    def __init__(
+        self,
+        units: Iterable[WorkUnit],
+        journal: Journal | str,
+        *,
+        max_attempts: int = 3,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.journal = journal if isinstance(journal, Journal) else Journal(journal)
+        self.max_attempts = max_attempts
+        self._lock = Lock()
+        units = list(dict.fromkeys(units))
+        self._total = len(units)
+        self._pending = deque(u for u in units if u.key not in self.journal)
+        self._done = self._total - len(self._pending)
+        self._attempts: dict[WorkUnit, int] = {}
+        self.failed: dict[WorkUnit, str] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(total={self._total}, remaining={self.remaining()})"
+        )
+
+    def claim(self, limit: int = 1) -> list[WorkUnit]:
+        """Take up to ``limit`` pending units."""
+        claimed: list[WorkUnit] = []
+        with self._lock:
+            while self._pending and len(claimed) < limit:
+                claimed.append(self._pending.popleft())
+        return claimed
+
+    def complete(self, unit: WorkUnit) -> bool:
+        """Record a unit as done in the journal."""
+        self.journal.record(unit.key)
+        with self._lock:
+            self._attempts.pop(unit, None)
+            self._done += 1
+        return True
+
+    def fail(self, unit: WorkUnit, error: str) -> bool:
+        """Requeue a failed unit, or give up on it after ``max_attempts``."""
+        with self._lock:
+            attempts = self._attempts.get(unit, 0) + 1
+            self._attempts[unit] = attempts
+            if attempts < self.max_attempts:
+                self._pending.append(unit)
+            else:
+                self.failed[unit] = error
+        return True
+
+    def total(self) -> int:
+        """Number of planned units."""
+        return self._total
+
+    def remaining(self) -> int:
+        """Number of planned units not recorded as done."""
+        return self._total - self._done
+
+    def close(self) -> None:
+        """Close the journal."""
+        self.journal.close()
+
+
+__all__ = ["JournalQueue", "WorkQueue"]
@@ -0,0 +1,208 @@
+"""Bounded-concurrency backfill runner.
+
+``BackfillRunner`` pulls work units from a :class:`WorkQueue`, fetches each
+with an asynchronous ``Tempest`` client, hands the result to a sink, and only
+then marks the unit complete. A unit is therefore delivered at least once:
+a crash between the sink and the journal write re-runs that unit on restart,
+but no completed unit is ever lost.
+
+While a unit runs, its claim is renewed every ``queue.heartbeat`` seconds (for
+queues whose claims expire, such as ``LeaseQueue``). If the claim is lost
+anyway, e.g. while the event loop was blocked, another worker may deliver
+the same unit; only the worker still holding the claim records the outcome,
+and the other counts the unit as ``lost``.
+
+Queue calls (claims, renewals, and outcomes) may block on a database lock
+or an fsync, so they run in a worker thread rather than on the event loop. A
+claim or outcome already started is waited for even if the runner is
+cancelled, as the blocking call would have been.
+
+Progress (completed units, throughput, and ETA) is available at any time
+from :meth:`BackfillRunner.progress` and may be reported through a callback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from .plan import WorkUnit
+from .queue import WorkQueue
+
+T = TypeVar("T")
+
+# (unit, endpoint result) -> None, optionally awaitable
+Sink = Callable[[WorkUnit, Any], Awaitable[None] | None]
+
+
+@dataclass(frozen=True)
+class BackfillProgress:
+    """Snapshot of a backfill's progress.
+
+    Attributes:
+        total: Units in the backfill.
+        remaining: Units not yet done.
+        completed: Units completed by this runner.
+        failures: Failed attempts in this runner.
+        lost: Units whose claim was lost before their outcome was recorded.
+        elapsed: Seconds since the runner started.
+        throughput: Units completed per second by this runner.
+        eta: Estimated seconds until done, or None before any completion.
+    """
+
+    total: int
+    remaining: int
+    completed: int
+    failures: int
+    lost: int
+    elapsed: float
+    throughput: float
+    eta: float | None
+
+
+class BackfillRunner:
+    """Run backfill work units with bounded concurrency.
+
+    Args:
+        client: Asynchronous ``Tempest`` client.
+        queue: Source of work units.
+        sink: Receives each unit with its result; may be a coroutine function.
+            The unit is marked complete only after the sink returns.
+        concurrency: Units fetched at once.
+        on_progress: Called with a progress snapshot after each unit.
+        clock: Monotonic clock for throughput and ETA.
+
+    Raises:
+        ValueError: If the client is not asynchronous or ``concurrency`` < 1.
+
+    Example:
+        >>> units = plan("obs_station", station_ids, start, end)
+        >>> queue = JournalQueue(units, "backfill.jsonl")
+        >>> async with Tempest(asynchronous=True) as twx:
+        ...     await BackfillRunner(twx, queue, sink=store).run()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        queue: WorkQueue,
+        sink: Sink | None = None,
+        *,
+        concurrency: int = 4,
+        on_progress: Callable[[BackfillProgress], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not client.is_async:
+            raise ValueError("BackfillRunner requires an asynchronous client.")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        self.client = client
+        self.queue = queue
+        self.sink = sink
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+        self._clock = clock
+        self._started: float | None = None
+        self._completed = 0
+        self._failures = 0
+        self._lost = 0
+        self._stopping = False
+
+    def __repr__(self) -> str:
+        options = [
+            f"queue={self.queue!r}",
+            f"concurrency={self.concurrency!r}",
+        ]
+        return type(self).__name__ + "(" + ", ".join(options) + ")"
+
+    async def run(self) -> BackfillProgress:
+        """Run until the queue has no claimable work or :meth:`stop` is called.
+
+        Failures of a unit are reported to the queue. Anything else (e.g.
+        cancellation) stops all workers; units not yet complete stay pending
+        in the queue for the next run.
+
+        Returns:
+            Final progress snapshot.
+        """
+        self._stopping = False
+        self._started = self._clock()
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(self.concurrency):
+                workers.create_task(self._worker())
+        return await asyncio.to_thread(self.progress)
+
+    def stop(self) -> None:
+        """Finish in-flight units, then return from :meth:`run`."""
+        self._stopping = True
+
+    def progress(self) -> BackfillProgress:
+        """Return a progress snapshot."""
+        elapsed = self._clock() - self._started if self._started is not None else 0.0
+        throughput = self._completed / elapsed if elapsed > 0 else 0.0
+        remaining = self.queue.remaining()
+        return BackfillProgress(
+            total=self.queue.total(),
+            remaining=remaining,
+            completed=self._completed,
+            failures=self._failures,
+            lost=self._lost,
+            elapsed=elapsed,
+            throughput=throughput,
+            eta=remaining / throughput if throughput > 0 else None,
+        )
+
+    async def _worker(self) -> None:
+        while not self._stopping:
+            units = await self._call(self.queue.claim, 1)
+            if not units:
+                return
+            await self._run_unit(units[0])
+            if self.on_progress is not None:
+                self.on_progress(await asyncio.to_thread(self.progress))
+
+    async def _run_unit(self, unit: WorkUnit) -> None:
+        heartbeat = None
+        if self.queue.heartbeat is not None:
+            heartbeat = asyncio.create_task(self._renew(unit, self.queue.heartbeat))
+        try:
+            result = await unit.fetch(self.client)
+            if self.sink is not None:
+                delivered = self.sink(unit, result)
+                if inspect.isawaitable(delivered):
+                    await delivered
+        except Exception as exc:
+            self._failures += 1
+            if not await self._call(self.queue.fail, unit, repr(exc)):
+                self._lost += 1
+            return
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+        if await self._call(self.queue.complete, unit):
+            self._completed += 1
+        else:
+            self._lost += 1
+
+    async def _call(self, method: Callable[..., T], *args: Any) -> T:
+        """Run a queue method in a worker thread and finish it if cancelled."""
+        call = asyncio.ensure_future(asyncio.to_thread(method, *args))
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            await asyncio.wait([call])
+            raise
+
+    async def _renew(self, unit: WorkUnit, interval: float) -> None:
+        """Renew the claim on a unit every ``interval`` seconds until lost."""
+        while True:
+            await asyncio.sleep(interval)
+            if not await asyncio.to_thread(self.queue.renew, unit):
+                return
+
+
+__all__ = ["BackfillProgress", "BackfillRunner", "Sink"]
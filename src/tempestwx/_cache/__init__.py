@@ -0,0 +1,26 @@
+"""Response caches layered over the Tempest client.
+
+Provides caches that trade bounded staleness for memory-speed reads:
+
+- ``DeviceDayCache`` - completed ``obs_device`` days stored on disk, keyed
+  by device and station-local date
+- ``ForecastCache`` - Better Forecast responses keyed by station and units,
+  refreshed in the background before they expire (stale-while-revalidate)
+- ``StationCache`` - parsed station metadata, rebuilt only for stations whose
+  ``last_modified_epoch`` changed
+
+Caches wrap an existing ``Tempest`` client and share its transport.
+"""
+
+from .device_days import DeviceDayCache, DeviceDayCacheStats
+from .forecast import ForecastCache, ForecastCacheStats
+from .stations import StationCache, StationCacheStats
+
+__all__ = [
+    "DeviceDayCache",
+    "DeviceDayCacheStats",
+    "ForecastCache",
+    "ForecastCacheStats",
+    "StationCache",
+    "StationCacheStats",
+]
@@ -0,0 +1,14 @@
+"""Token scoping shared by the in-memory caches."""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def token_digest(token: str) -> bytes:
+    """Return the SHA-256 digest scoping cache entries to an access token.
+
+    Caches key entries by the digest rather than the token, so bearer tokens
+    are not kept alive by cache keys.
+    """
+    return hashlib.sha256(token.encode()).digest()
@@ -0,0 +1,248 @@
+"""On-disk cache of completed device observation days.
+
+This module provides ``DeviceDayCache``. ``obs_device(device_id, day_offset=N)``
+with ``N >= 1`` returns a station-local day that is already over, so its
+observations never change again. The cache stores those responses on disk,
+keyed by device id and the local date the offset resolves to in the station's
+time zone. Days are requested with explicit ``time_start``/``time_end`` bounds
+for that date, and a response is only stored if every observation falls
+inside them, so a file never holds another day than its key. A job reading
+the last 30 days of a device every night then makes one network call per new
+day instead of thirty.
+
+Files are key-addressed (SHA-256 of the cache key): each key is hashed and the raw JSON
+response is stored under ``<directory>/<hash[:2]>/<hash>.json``. Writes are
+atomic, so concurrent processes sharing a directory never see partial files.
+
+File I/O of asynchronous clients runs in a worker thread.
+
+Device time zones are resolved from the account's station metadata the
+first time a device is seen, or may be supplied up front.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from tempestwx._models.device_observation import DeviceObservation
+
+
+@dataclass(frozen=True)
+class DeviceDayCacheStats:
+    """Counters describing cache effectiveness.
+
+    Attributes:
+        hits: Days read from disk.
+        misses: Days fetched from the API and stored.
+        uncached: Requests passed through to the API without storing: the
+            current day, or a response with observations outside the day.
+    """
+
+    hits: int
+    misses: int
+    uncached: int
+
+
+class DeviceDayCache:
+    """Store completed ``obs_device`` days on disk.
+
+    Args:
+        client: ``Tempest`` client used to fetch observations and stations.
+        directory: Cache directory; created if missing.
+        timezones: Optional mapping of device id to IANA time zone name. Other
+            devices are resolved from ``client.stations()``.
+        clock: Wall clock (Unix epoch seconds) used to resolve day offsets.
+
+    Example:
+        >>> cache = DeviceDayCache(client, "~/.cache/tempestwx")
+        >>> days = [cache.get(98765, day_offset=n) for n in range(1, 31)]
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        directory: str | os.PathLike[str],
+        *,
+        timezones: Mapping[int, str] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.client = client
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._timezones = {k: ZoneInfo(v) for k, v in (timezones or {}).items()}
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+        self._uncached = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory={str(self.directory)!r})"
+
+    def get(self, device_id: int, day_offset: int = 1, *, raw: bool = False) -> Any:
+        """Return the observations of a device for one station-local day.
+
+        Offsets below 1 (today, which is still changing) are passed through
+        to the API without caching.
+
+        Args:
+            device_id: Unique device identifier. Must be positive.
+            day_offset: Days before today, in the station's time zone.
+            raw: Return the JSON content as a dict instead of a
+                ``DeviceObservation``.
+
+        Returns:
+            The observations (or None if the API returned no content) for
+            synchronous clients, or a coroutine yielding them for
+            asynchronous clients.
+
+        Raises:
+            ValueError: If ``device_id`` is not positive.
+            KeyError: If the device is not part of any station of the account.
+        """
+        if device_id <= 0:
+            raise ValueError("device_id must be a positive integer.")
+        if self.client.is_async:
+            return self._aget(device_id, day_offset, raw)
+        if day_offset < 1:
+            self._uncached += 1
+            return self._decode(self.client.obs_device.raw(device_id, day_offset), raw)
+        if device_id not in self._timezones:
+            self._index_stations(self.client.stations.raw())
+        day = self.local_date(device_id, day_offset)
+        path = self.path(device_id, day)
+        content = self._read(path)
+        if content is not None:
+            self._hits += 1
+            return self._decode(content, raw)
+        start, end = self.bounds(device_id, day)
+        content = self.client.obs_device.raw(device_id, day_offset, start, end)
+        if self._store(content, start, end):
+            self._write(path, content)
+        return self._decode(content, raw)
+
+    def local_date(self, device_id: int, day_offset: int) -> date:
+        """Return the station-local date a day offset resolves to now.
+
+        Raises:
+            KeyError: If the device's time zone is unknown.
+        """
+        today = datetime.fromtimestamp(self._clock(), self._timezone(device_id))
+        return today.date() - timedelta(days=day_offset)
+
+    def bounds(self, device_id: int, day: date) -> tuple[int, int]:
+        """Return the first and last epoch second of a station-local date.
+
+        Raises:
+            KeyError: If the device's time zone is unknown.
+        """
+        tz = self._timezone(device_id)
+        start = datetime.combine(day, datetime.min.time(), tz)
+        end = datetime.combine(day + timedelta(days=1), datetime.min.time(), tz)
+        return int(start.timestamp()), int(end.timestamp()) - 1
+
+    def path(self, device_id: int, day: date) -> Path:
+        """Return the cache file for a device and local date."""
+        key = f"obs_device/{device_id}/{day.isoformat()}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def stats(self) -> DeviceDayCacheStats:
+        """Return a snapshot of the cache counters."""
+        return DeviceDayCacheStats(
+            hits=self._hits, misses=self._misses, uncached=self._uncached
+        )
+
+    async def _aget(self, device_id: int, day_offset: int, raw: bool) -> Any:
+        if day_offset < 1:
+            self._uncached += 1
+            content = await self.client.obs_device.raw(device_id, day_offset)
+            return self._decode(content, raw)
+        if device_id not in self._timezones:
+            self._index_stations(await self.client.stations.raw())
+        day = self.local_date(device_id, day_offset)
+        path = self.path(device_id, day)
+        content = await asyncio.to_thread(self._read, path)
+        if content is not None:
+            self._hits += 1
+            return self._decode(content, raw)
+        start, end = self.bounds(device_id, day)
+        content = await self.client.obs_device.raw(device_id, day_offset, start, end)
+        if self._store(content, start, end):
+            await asyncio.to_thread(self._write, path, content)
+        return self._decode(content, raw)
+
+    def _timezone(self, device_id: int) -> tzinfo:
+        try:
+            return self._timezones[device_id]
+        except KeyError:
+            raise KeyError(f"Unknown device: {device_id!r}") from None
+
+    def _index_stations(self, content: dict[str, Any] | None) -> None:
+        """Learn device time zones from a raw ``stations`` response."""
+        for station in (content or {}).get("stations") or []:
+            tz_name = station.get("timezone")
+            if not tz_name:
+                continue
+            tz = ZoneInfo(tz_name)
+            for device in station.get("devices") or []:
+                if device.get("device_id") is not None:
+                    self._timezones.setdefault(device["device_id"], tz)
+
+    def _store(self, content: dict[str, Any] | None, start: int, end: int) -> bool:
+        """Count a fetched day and return whether it may be written.
+
+        Only responses whose observations all fall within ``start`` and
+        ``end`` are stored; others are counted as uncached.
+        """
+        if content is None:
+            self._misses += 1
+            return False
+        for row in content.get("obs") or []:
+            timestamp = row[0] if row else None
+            if not isinstance(timestamp, int | float) or not start <= timestamp <= end:
+                self._uncached += 1
+                return False
+        self._misses += 1
+        return True
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        try:
+            content: dict[str, Any] = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        return content
+
+    @staticmethod
+    def _write(path: Path, content: dict[str, Any]) -> None:
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(content, separators=(",", ":")).encode())
+            Path(tmp).replace(path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _decode(
+        content: dict[str, Any] | None, raw: bool
+    ) -> DeviceObservation | dict[str, Any] | None:
+        if raw or content is None:
+            return content
+        return DeviceObservation(**content)
+
+
+__all__ = ["DeviceDayCache", "DeviceDayCacheStats"]
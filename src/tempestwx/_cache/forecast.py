@@ -0,0 +1,332 @@
+"""Forecast cache with stale-while-revalidate refresh.
+
+This module provides ``ForecastCache``, an in-memory cache of
+``BetterForecast`` responses keyed by access token (as a SHA-256 digest),
+station id and unit set, so clients switching tokens (``token_as``) or
+tenants never read each other's forecasts. Entries go through three phases,
+measured from the time they were fetched:
+
+- Fresh (``age < ttl - refresh_ahead``): returned from memory.
+- Near expiry (``ttl - refresh_ahead <= age < ttl``): returned from memory
+  while a single background refresh per key fetches a replacement.
+- Expired (``age >= ttl``) or missing: fetched before returning, sharing any
+  refresh already in flight for the key.
+
+A returned forecast is therefore never older than ``ttl`` and, in the steady
+state of a dashboard reading the same stations, never waits on the network.
+The cache holds at most ``max_entries`` entries: beyond that, expired entries
+are dropped first, then the least recently fetched ones.
+
+Works with both synchronous clients (background refreshes run on a small
+thread pool, in a copy of the caller's context) and asynchronous clients
+(background refreshes run as tasks, and :meth:`ForecastCache.get` returns a
+coroutine).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.units_default import (
+    TEMPEST_DEFAULT_UNITS,
+    UnitsDistance,
+    UnitsPrecip,
+    UnitsPressure,
+    UnitsTemp,
+    UnitsWind,
+)
+
+from ._scope import token_digest
+
+# (token digest, station_id, units_temp, units_wind, units_pressure,
+#  units_precip, units_distance)
+ForecastKey = tuple[bytes, int, str, str, str, str, str]
+
+
+@dataclass
+class _Entry:
+    value: BetterForecast
+    fetched_at: float
+
+
+@dataclass(frozen=True)
+class ForecastCacheStats:
+    """Counters describing cache effectiveness.
+
+    Attributes:
+        hits: Lookups answered by a fresh entry.
+        stale_hits: Lookups answered by a near-expiry entry.
+        misses: Lookups that waited on the network.
+        refreshes: Background refreshes started.
+        refresh_errors: Refreshes that failed.
+        size: Number of cached entries.
+    """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    refresh_errors: int
+    size: int
+
+
+class ForecastCache:
+    """Cache ``forecast`` responses with stale-while-revalidate refresh.
+
+    Args:
+        client: ``Tempest`` client used to fetch forecasts.
+        ttl: Maximum age (seconds) of a forecast returned by the cache.
+        refresh_ahead: Seconds before expiry at which a background refresh
+            starts. Must be less than ``ttl``.
+        max_workers: Threads available for background refreshes of a
+            synchronous client.
+        max_entries: Maximum number of cached forecasts.
+        clock: Monotonic clock used to age entries.
+
+    Raises:
+        ValueError: If ``ttl``, ``refresh_ahead`` or ``max_entries`` are out
+            of range.
+
+    Example:
+        >>> cache = ForecastCache(client, ttl=600, refresh_ahead=120)
+        >>> forecast = cache.get(12345, units_temp="f")
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        ttl: float = 300.0,
+        refresh_ahead: float = 60.0,
+        max_workers: int = 4,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        if not 0 <= refresh_ahead < ttl:
+            raise ValueError("refresh_ahead must be >= 0 and less than ttl.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.client = client
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[ForecastKey, _Entry] = {}
+        self._lock = Lock()
+        self._inflight: dict[ForecastKey, Future[BetterForecast]] = {}
+        self._tasks: dict[ForecastKey, asyncio.Task[BetterForecast]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._max_workers = max_workers
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        options = [
+            f"ttl={self.ttl!r}",
+            f"refresh_ahead={self.refresh_ahead!r}",
+            f"size={len(self._entries)}",
+        ]
+        return type(self).__name__ + "(" + ", ".join(options) + ")"
+
+    def __enter__(self) -> ForecastCache:
+        """Enter context; the cache is closed on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
+        """Exit context and stop the background refresh pool."""
+        self.close()
+
+    def get(
+        self,
+        station_id: int,
+        *,
+        units_temp: UnitsTemp | str = TEMPEST_DEFAULT_UNITS.units_temp,
+        units_wind: UnitsWind | str = TEMPEST_DEFAULT_UNITS.units_wind,
+        units_pressure: UnitsPressure | str = TEMPEST_DEFAULT_UNITS.units_pressure,
+        units_precip: UnitsPrecip | str = TEMPEST_DEFAULT_UNITS.units_precip,
+        units_distance: UnitsDistance | str = TEMPEST_DEFAULT_UNITS.units_distance,
+    ) -> BetterForecast | Coroutine[None, None, BetterForecast]:
+        """Return a forecast no older than ``ttl``, from memory when possible.
+
+        Arguments mirror :meth:`Tempest.forecast`, with units passed by
+        keyword; equivalent unit spellings share a cache entry. Entries are
+        scoped to the client's current token (see ``token_as`` and
+        ``tenant``).
+
+        Returns:
+            The forecast for synchronous clients, or a coroutine yielding it
+            for asynchronous clients.
+
+        Raises:
+            ValueError: If ``station_id`` or any unit is invalid.
+        """
+        if station_id <= 0:
+            raise ValueError("station_id must be a positive integer.")
+        units = self.client._unit_values(
+            self.client._validate_units(
+                units_temp, units_wind, units_pressure, units_precip, units_distance
+            )
+        )
+        key: ForecastKey = (token_digest(self.client.token), station_id, *units)
+        if self.client.is_async:
+            return self._aget(key)
+        return self._get(key)
+
+    def invalidate(self, station_id: int | None = None) -> None:
+        """Drop cached entries for a station (for every token), or all if None."""
+        with self._lock:
+            if station_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[1] == station_id]:
+                    del self._entries[key]
+
+    def stats(self) -> ForecastCacheStats:
+        """Return a snapshot of the cache counters."""
+        return ForecastCacheStats(
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            refreshes=self._refreshes,
+            refresh_errors=self._refresh_errors,
+            size=len(self._entries),
+        )
+
+    def close(self) -> None:
+        """Stop the background refresh pool without waiting for it."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _lookup(self, key: ForecastKey) -> tuple[BetterForecast | None, bool]:
+        """Return ``(cached value, needs refresh)`` for a key.
+
+        The value is None if the key is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+        age = self._clock() - entry.fetched_at
+        if age >= self.ttl:
+            return None, False
+        if age >= self.ttl - self.refresh_ahead:
+            self._stale_hits += 1
+            return entry.value, True
+        self._hits += 1
+        return entry.value, False
+
+    def _store(self, key: ForecastKey, value: BetterForecast) -> BetterForecast:
+        now = self._clock()
+        with self._lock:
+            # Re-insert, so entries stay ordered by fetch time
+            self._entries.pop(key, None)
+            self._entries[key] = _Entry(value=value, fetched_at=now)
+            if len(self._entries) > self.max_entries:
+                self._prune(now)
+        return value
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries, then the oldest beyond ``max_entries``."""
+        expired = [
+            k for k, e in self._entries.items() if now - e.fetched_at >= self.ttl
+        ]
+        for key in expired:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def _fetch(self, key: ForecastKey) -> Any:
+        _, station_id, temp, wind, pressure, precip, distance = key
+        return self.client.forecast(station_id, temp, wind, pressure, precip, distance)
+
+    # Synchronous clients
+
+    def _get(self, key: ForecastKey) -> BetterForecast:
+        value, refresh = self._lookup(key)
+        if value is not None:
+            if refresh:
+                self._refresh(key, background=True)
+            return value
+        self._misses += 1
+        return self._refresh(key, background=False).result()
+
+    def _refresh(self, key: ForecastKey, background: bool) -> Future[BetterForecast]:
+        """Start (or join) the single in-flight refresh for a key."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="tempestwx-forecast-cache",
+                )
+            # Context variables (token_as, tenant, priority) apply in the pool
+            future = self._executor.submit(
+                copy_context().run, self._fetch_and_store, key
+            )
+            self._inflight[key] = future
+            if background:
+                self._refreshes += 1
+        return future
+
+    def _fetch_and_store(self, key: ForecastKey) -> BetterForecast:
+        try:
+            return self._store(key, self._fetch(key))
+        except Exception:
+            self._refresh_errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    # Asynchronous clients
+
+    async def _aget(self, key: ForecastKey) -> BetterForecast:
+        value, refresh = self._lookup(key)
+        if value is not None:
+            if refresh:
+                self._arefresh(key, background=True)
+            return value
+        self._misses += 1
+        return await asyncio.shield(self._arefresh(key, background=False))
+
+    def _arefresh(
+        self, key: ForecastKey, background: bool
+    ) -> asyncio.Task[BetterForecast]:
+        """Start (or join) the single in-flight refresh task for a key."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._afetch_and_store(key))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._task_done(key, t))
+            if background:
+                self._refreshes += 1
+        return task
+
+    async def _afetch_and_store(self, key: ForecastKey) -> BetterForecast:
+        return self._store(key, await self._fetch(key))
+
+    def _task_done(self, key: ForecastKey, task: asyncio.Task[BetterForecast]) -> None:
+        self._tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self._refresh_errors += 1
+
+
+__all__ = ["ForecastCache", "ForecastCacheStats"]
@@ -0,0 +1,234 @@
+"""Station metadata cache invalidated by ``last_modified_epoch``.
+
+This module provides ``StationCache``, which keeps parsed ``Station`` models
+between calls to ``stations()`` and ``station()``. Every refresh still asks
+the API for the station list, but a station is only validated into a new
+``Station`` (with its nested devices, items, and capabilities) when its
+``last_modified_epoch`` differs from the cached copy. Unchanged stations are
+returned as the very same objects, so indexes keyed on ``Station`` instances
+stay valid across refreshes. If no station changed, the previous
+``StationSet`` itself is returned.
+
+Cached stations are scoped to the client's current access token (see
+``token_as`` and ``tenant``), so accounts sharing a client never see each
+other's stations. Scopes are keyed by a SHA-256 digest of the token, and only
+the ``max_tokens`` most recently used ones are kept.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from tempestwx._models.station import Station
+from tempestwx._models.station_set import StationSet
+
+from ._scope import token_digest
+
+
+@dataclass(frozen=True)
+class StationCacheStats:
+    """Counters describing cache effectiveness.
+
+    Attributes:
+        reused: Stations returned from the cache unchanged.
+        rebuilt: Stations validated from the response.
+        removed: Stations dropped because the account no longer lists them.
+        size: Number of cached stations.
+    """
+
+    reused: int
+    rebuilt: int
+    removed: int
+    size: int
+
+
+@dataclass
+class _Scope:
+    """Cached stations of one access token."""
+
+    stations: dict[int, Station] = field(default_factory=dict)
+    all: StationSet | None = None
+
+
+class StationCache:
+    """Keep parsed station metadata, rebuilding only modified stations.
+
+    Stations without a ``station_id`` or ``last_modified_epoch`` cannot be
+    compared and are always rebuilt.
+
+    Args:
+        client: ``Tempest`` client used to fetch station metadata.
+        max_tokens: Access tokens whose stations are kept; the stations of
+            the least recently used token are dropped beyond it.
+
+    Raises:
+        ValueError: If ``max_tokens`` is less than 1.
+
+    Example:
+        >>> cache = StationCache(client)
+        >>> stations = cache.stations()
+        >>> stations.stations[0] is cache.stations().stations[0]
+        True
+    """
+
+    def __init__(self, client: Any, *, max_tokens: int = 64) -> None:
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1.")
+        self.client = client
+        self.max_tokens = max_tokens
+        self._scopes: dict[bytes, _Scope] = {}
+        self._lock = Lock()
+        self._reused = 0
+        self._rebuilt = 0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        return sum(len(scope.stations) for scope in self._scopes.values())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)})"
+
+    def stations(self) -> Coroutine[None, None, StationSet | None] | StationSet | None:
+        """Return metadata for all stations of the account.
+
+        Stations missing from the response are dropped from the cache.
+
+        Returns:
+            Station metadata for synchronous clients, or a coroutine
+            yielding it for asynchronous clients.
+        """
+        scope = self._scope()
+        content = self.client.stations.raw()
+        if self.client.is_async:
+            return self._finish(scope, content, complete=True)
+        return self._merge(scope, content, complete=True)
+
+    def station(
+        self, station_id: int
+    ) -> Coroutine[None, None, StationSet | None] | StationSet | None:
+        """Return metadata for a single station.
+
+        Args:
+            station_id: Unique station identifier. Must be a positive integer.
+
+        Returns:
+            Station metadata for synchronous clients, or a coroutine
+            yielding it for asynchronous clients.
+
+        Raises:
+            ValueError: If ``station_id`` is not positive.
+        """
+        scope = self._scope()
+        content = self.client.station.raw(station_id)
+        if self.client.is_async:
+            return self._finish(scope, content, complete=False)
+        return self._merge(scope, content, complete=False)
+
+    def get(self, station_id: int) -> Station | None:
+        """Return a station cached for the current token, without the API."""
+        scope = self._scopes.get(token_digest(self.client.token))
+        return scope.stations.get(station_id) if scope is not None else None
+
+    def invalidate(self, station_id: int | None = None) -> None:
+        """Drop a cached station (for every token), or all stations if None."""
+        with self._lock:
+            if station_id is None:
+                self._scopes.clear()
+                return
+            for scope in self._scopes.values():
+                scope.all = None
+                scope.stations.pop(station_id, None)
+
+    def stats(self) -> StationCacheStats:
+        """Return a snapshot of the cache counters."""
+        return StationCacheStats(
+            reused=self._reused,
+            rebuilt=self._rebuilt,
+            removed=self._removed,
+            size=len(self),
+        )
+
+    def _scope(self) -> _Scope:
+        """Return the cached stations of the client's current token."""
+        digest = token_digest(self.client.token)
+        with self._lock:
+            # Re-insert, so scopes stay ordered by last use
+            scope = self._scopes.pop(digest, None) or _Scope()
+            self._scopes[digest] = scope
+            while len(self._scopes) > self.max_tokens:
+                del self._scopes[next(iter(self._scopes))]
+            return scope
+
+    async def _finish(
+        self,
+        scope: _Scope,
+        content: Coroutine[None, None, dict[str, Any] | None],
+        complete: bool,
+    ) -> StationSet | None:
+        return self._merge(scope, await content, complete)
+
+    def _merge(
+        self, scope: _Scope, content: dict[str, Any] | None, complete: bool
+    ) -> StationSet | None:
+        """Merge a raw stations response into the cache.
+
+        Args:
+            scope: Cached stations of the token that fetched ``content``.
+            content: Raw response content.
+            complete: Whether the response lists every station of the
+                account (``stations()``) rather than a single one.
+
+        Returns:
+            A station set built from cached and rebuilt stations.
+        """
+        if content is None:
+            return None
+        raw_stations = content.get("stations")
+        if raw_stations is None:
+            return StationSet(**content)
+
+        with self._lock:
+            stations = [self._station(scope, raw) for raw in raw_stations]
+            if not complete:
+                return StationSet(**{**content, "stations": stations})
+
+            seen = {s.station_id for s in stations}
+            for station_id in [k for k in scope.stations if k not in seen]:
+                del scope.stations[station_id]
+                self._removed += 1
+
+            previous = scope.all
+            if (
+                previous is not None
+                and previous.stations is not None
+                and len(previous.stations) == len(stations)
+                and all(
+                    a is b for a, b in zip(previous.stations, stations, strict=True)
+                )
+            ):
+                return previous
+            scope.all = StationSet(**{**content, "stations": stations})
+            return scope.all
+
+    def _station(self, scope: _Scope, raw: dict[str, Any]) -> Station:
+        station_id = raw.get("station_id")
+        modified = raw.get("last_modified_epoch")
+        cached = scope.stations.get(station_id) if station_id is not None else None
+        if (
+            cached is not None
+            and modified is not None
+            and cached.last_modified_epoch == modified
+        ):
+            self._reused += 1
+            return cached
+        station = Station(**raw)
+        self._rebuilt += 1
+        if station.station_id is not None:
+            scope.stations[station.station_id] = station
+        return station
+
+
+__all__ = ["StationCache", "StationCacheStats"]
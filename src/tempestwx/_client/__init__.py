@@ -2,8 +2,14 @@
 
 Provides the unified ``Tempest`` client that aggregates all API endpoints
 into a single interface. This is the primary entry point for users.
+
+Also provides ``PollScheduler`` for cadence-aware polling of latest
+observations across many stations, and ``Batch`` for sending deferred
+endpoint calls concurrently from synchronous code.
 """
 
+from .batch import Batch
 from .client import Tempest
+from .polling import PollScheduler
 
-__all__ = ["Tempest"]
+__all__ = ["Batch", "Tempest", "PollScheduler"]
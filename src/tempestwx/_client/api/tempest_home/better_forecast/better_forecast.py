@@ -69,25 +69,19 @@ class TempestBetterForecast(TempestBase):
         if station_id <= 0:
             raise ValueError("station_id must be a positive integer.")
 
-        # Validate and convert all unit parameters
-        validated_temp = self._validate_enum_param("units_temp", units_temp, UnitsTemp)
-        validated_wind = self._validate_enum_param("units_wind", units_wind, UnitsWind)
-        validated_pressure = self._validate_enum_param(
-            "units_pressure", units_pressure, UnitsPressure
-        )
-        validated_precip = self._validate_enum_param(
-            "units_precip", units_precip, UnitsPrecip
-        )
-        validated_distance = self._validate_enum_param(
-            "units_distance", units_distance, UnitsDistance
+        # Validate and convert all unit parameters (memoized per combination)
+        temp, wind, pressure, precip, distance = self._unit_values(
+            self._validate_units(
+                units_temp, units_wind, units_pressure, units_precip, units_distance
+            )
         )
 
         return self._get(  # type: ignore[no-any-return]
             "better_forecast",
             station_id=station_id,
-            units_temp=validated_temp.value,
-            units_wind=validated_wind.value,
-            units_pressure=validated_pressure.value,
-            units_precip=validated_precip.value,
-            units_distance=validated_distance.value,
+            units_temp=temp,
+            units_wind=wind,
+            units_pressure=pressure,
+            units_precip=precip,
+            units_distance=distance,
         )
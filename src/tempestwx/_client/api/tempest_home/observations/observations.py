@@ -23,10 +23,12 @@ Classes:
 from __future__ import annotations
 
 import re as _re
+from functools import lru_cache
 
 from tempestwx._client.base import TempestBase
 from tempestwx._client.decorators import make_request
-from tempestwx._client.processor import model_instance
+from tempestwx._client.processor import device_observation_csv, model_instance
+from tempestwx._http import Priority
 from tempestwx._models.device_observation import DeviceObservation
 from tempestwx._models.station_observation_latest import (
     StationObservationLatest,
@@ -43,11 +45,43 @@ from tempestwx._models.units_default import (
     UnitsWind,
 )
 
+# Accept simple snake_case alphanum + underscore names
+_FIELD_NAME = _re.compile(r"[a-z0-9_]+")
+
+
+@lru_cache(maxsize=256)
+def _parse_obs_fields(obs_fields: str) -> tuple[str, ...]:
+    """Parse and validate a comma-separated ``obs_fields`` string.
+
+    Parsed field tuples are memoized per distinct string; invalid strings
+    raise and are never cached.
+
+    Args:
+        obs_fields: Comma-separated observation field names.
+
+    Returns:
+        Tuple of stripped field names.
+
+    Raises:
+        ValueError: If no field names are parsed or any name is invalid.
+    """
+    raw_fields = tuple(f.strip() for f in obs_fields.split(",") if f.strip())
+    if not raw_fields:
+        raise ValueError("obs_fields provided but no valid field names parsed.")
+
+    invalid = [f for f in raw_fields if not _FIELD_NAME.fullmatch(f)]
+    if invalid:
+        raise ValueError(
+            "Invalid field name(s) in obs_fields: "
+            f"{invalid}. Field names must be snake_case alphanumeric."
+        )
+    return raw_fields
+
 
 class TempestObservations(TempestBase):
     """Observations API endpoints."""
 
-    @make_request(model_instance(StationObservation))
+    @make_request(model_instance(StationObservation), priority=Priority.BULK)
     def obs_station(
         self,
         station_id: int,
@@ -109,40 +143,21 @@ class TempestObservations(TempestBase):
         if start_time is not None and end_time is not None and start_time > end_time:
             raise ValueError("start_time cannot be greater than end_time.")
 
-        # Validate and convert all unit parameters
-        if isinstance(bucket, int):
-            bucket_for_validate: Bucket | str = Bucket(bucket)
-        else:
-            bucket_for_validate = bucket
-
-        validate_bucket = self._validate_enum_param(
-            "bucket", bucket_for_validate, Bucket
-        )
-        validated_temp = self._validate_enum_param("units_temp", units_temp, UnitsTemp)
-        validated_wind = self._validate_enum_param("units_wind", units_wind, UnitsWind)
-        validated_pressure = self._validate_enum_param(
-            "units_pressure", units_pressure, UnitsPressure
-        )
-        validated_precip = self._validate_enum_param(
-            "units_precip", units_precip, UnitsPrecip
-        )
-        validated_distance = self._validate_enum_param(
-            "units_distance", units_distance, UnitsDistance
+        # Validate and convert bucket and unit parameters (memoized)
+        validate_bucket = self._validate_enum_param("bucket", bucket, Bucket)
+        (
+            validated_temp,
+            validated_wind,
+            validated_pressure,
+            validated_precip,
+            validated_distance,
+        ) = self._validate_units(
+            units_temp, units_wind, units_pressure, units_precip, units_distance
         )
 
-        # Basic obs_fields validation
+        # Basic obs_fields validation (memoized per distinct string)
         if obs_fields:
-            raw_fields = [f.strip() for f in obs_fields.split(",") if f.strip()]
-            if not raw_fields:
-                raise ValueError("obs_fields provided but no valid field names parsed.")
-
-            # Accept simple snake_case alphanum + underscore names
-            invalid = [f for f in raw_fields if not _re.fullmatch(r"[a-z0-9_]+", f)]
-            if invalid:
-                raise ValueError(
-                    "Invalid field name(s) in obs_fields: "
-                    f"{invalid}. Field names must be snake_case alphanumeric."
-                )
+            _parse_obs_fields(obs_fields)
 
         return self._get(  # type: ignore[no-any-return]
             f"observations/stn/{station_id}",
@@ -157,7 +172,9 @@ class TempestObservations(TempestBase):
             units_distance=validated_distance,
         )
 
-    @make_request(model_instance(DeviceObservation))
+    @make_request(
+        model_instance(DeviceObservation), device_observation_csv, Priority.BULK
+    )
     def obs_device(
         self,
         device_id: int,
@@ -182,7 +199,9 @@ class TempestObservations(TempestBase):
             format: Optional response format (e.g. "json" or "csv") if supported. Case
                 insensitive. If provided must be one of {"json","csv"}.
                 Format units (allowed: 'csv').
-                Defaults to JSON response if not provided.
+                Defaults to JSON response if not provided. CSV bodies are
+                streamed into the same ``DeviceObservation`` shape, with
+                ``obs`` rows in obs_st order.
 
         Returns:
             Device observations.
@@ -216,7 +235,7 @@ class TempestObservations(TempestBase):
             format=format,
         )
 
-    @make_request(model_instance(StationObservationLatest))
+    @make_request(model_instance(StationObservationLatest), priority=Priority.REALTIME)
     def obs_station_latest(
         self,
         station_id: int,
@@ -4,10 +4,17 @@ This module defines ``TempestBase``, the foundational class that all Tempest
 API endpoint clients inherit from. It provides:
 
 - Token management and context-based token overrides
+- Optional multi-tenant token pool with per-task scoping and quotas
+- Optional priority-aware request scheduler shared by all calls
+- Optional executor decoding large responses off the event loop
+- A managed thread pool running the ``future()`` form of endpoint calls
+- Trusted decoding (construction without validation), per client or scope
 - Settings integration (API URI, units, configuration)
 - HTTP method builders (_get, _post, _put, _delete)
 - Request URL construction and header building
 - Parameter validation for enum-based options
+- Memoization of validated parameters and of the normalized API base URI,
+  so repeated calls skip redundant work on the hot path
 - Integration with the transport layer for request execution
 
 The base class is not intended to be instantiated directly. Instead, it serves
@@ -21,18 +28,70 @@ Internal API:
 
 from __future__ import annotations
 
-from collections.abc import Coroutine
-from contextvars import ContextVar
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 from enum import Enum
-from typing import Any, TypeVar
-
-from tempestwx._http import Client, Request, Response, Transport
+from functools import lru_cache
+from typing import Any, TypeVar, cast
+
+from tempestwx._auth.pool import TokenPool
+from tempestwx._http import (
+    Client,
+    Priority,
+    Request,
+    RequestScheduler,
+    Response,
+    Transport,
+)
+from tempestwx._models.units_default import (
+    UnitsDistance,
+    UnitsPrecip,
+    UnitsPressure,
+    UnitsTemp,
+    UnitsWind,
+)
 from tempestwx.settings import Settings
 from tempestwx.settings_loader import load_settings
 
 # Type variable for generic enum validation (module-scoped)
 _E = TypeVar("_E", bound=Enum)
 
+# Validated unit parameters, in endpoint argument order
+ValidatedUnits = tuple[UnitsTemp, UnitsWind, UnitsPressure, UnitsPrecip, UnitsDistance]
+
+
+@lru_cache(maxsize=1024)
+def _coerce_enum(enum_class: type[_E], value: object) -> _E:
+    """Coerce a literal to an enum member, memoizing successful lookups.
+
+    Failed lookups raise and are therefore never cached.
+    """
+    return enum_class(value)
+
+
+def _units(
+    units_temp: UnitsTemp | str,
+    units_wind: UnitsWind | str,
+    units_pressure: UnitsPressure | str,
+    units_precip: UnitsPrecip | str,
+    units_distance: UnitsDistance | str,
+) -> ValidatedUnits:
+    """Validate the five unit parameters, in argument order."""
+    validate = TempestBase._validate_enum_param
+    return (
+        validate("units_temp", units_temp, UnitsTemp),
+        validate("units_wind", units_wind, UnitsWind),
+        validate("units_pressure", units_pressure, UnitsPressure),
+        validate("units_precip", units_precip, UnitsPrecip),
+        validate("units_distance", units_distance, UnitsDistance),
+    )
+
+
+# Validated unit tuples, memoized per combination of arguments
+_cached_units = lru_cache(maxsize=256)(_units)
+
 
 class TempestBase(Client):
     """Base client with core HTTP and configuration functionality.
@@ -54,6 +113,9 @@ class TempestBase(Client):
     """
 
     _token_cv: ContextVar[str] = ContextVar("_token_cv")
+    _priority_cv: ContextVar[Priority] = ContextVar("_priority_cv")
+    _trusted_cv: ContextVar[bool] = ContextVar("_trusted_cv")
+    _read_only_cv: ContextVar[bool] = ContextVar("_read_only_cv")
 
     def __init__(
         self,
@@ -61,6 +123,14 @@ class TempestBase(Client):
         transport: Transport | None = None,
         asynchronous: bool | None = None,
         settings: Settings | None = None,
+        *,
+        token_pool: TokenPool | None = None,
+        scheduler: RequestScheduler | None = None,
+        decode_executor: Executor | None = None,
+        decode_min_bytes: int = 16384,
+        max_workers: int = 8,
+        trusted: bool = False,
+        read_only: bool = False,
     ) -> None:
         """Initialize the base client with authentication and configuration.
 
@@ -73,7 +143,35 @@ class TempestBase(Client):
                 transport implementation to use.
             settings: Pre-constructed Settings object. If None, loads settings
                 from environment, .env file, and config.json via load_settings().
+            token_pool: Optional tenant token pool. While a tenant scope is
+                active, its token is used and each request is charged to its
+                quota.
+            scheduler: Optional request scheduler. Each request waits for a
+                slot of its priority class before being sent.
+            decode_executor: Optional thread or process pool. Asynchronous
+                clients decode responses of at least ``decode_min_bytes``
+                from their raw body on it instead of on the event loop, as
+                do batches and ``future()`` calls run on the loop of a
+                ``BridgeTransport`` (which otherwise decode such responses
+                in a worker thread).
+            decode_min_bytes: Smallest response body decoded on
+                ``decode_executor``; smaller ones are decoded in place.
+            max_workers: Threads of the executor running ``future()`` calls.
+                The executor is created on first use and shut down by
+                :meth:`close`.
+            trusted: Decode responses without validation by default, for
+                transports serving known-good data (e.g. a verified cache).
+            read_only: Decode responses into frozen, slotted read-only model
+                variants by default.
+
+        Raises:
+            ValueError: If ``decode_min_bytes`` is negative or ``max_workers``
+                is less than 1.
         """
+        if decode_min_bytes < 0:
+            raise ValueError("decode_min_bytes must be non-negative.")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
         super().__init__(transport, asynchronous)
         base_settings = settings or load_settings()
         self.settings = (
@@ -82,21 +180,36 @@ class TempestBase(Client):
             else base_settings
         )
         self._token = self.settings.token
+        self._token_pool = token_pool
+        self._scheduler = scheduler
+        self._decode_executor = decode_executor
+        self._decode_min_bytes = decode_min_bytes
+        self._max_workers = max_workers
+        self._trusted = trusted
+        self._read_only = read_only
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._closed = False
 
     @property
     def token(self) -> str:
         """Get the current access token, respecting context overrides.
 
         Returns the token from the current ContextVar context if set (via
-        token_as() context manager), otherwise returns the base token from
-        settings.
+        token_as() context manager), then the token of the tenant bound by
+        the token pool (via tenant()), otherwise the base token from settings.
 
         Returns:
             The active bearer token string.
         """
-        # ContextVar.get() requires non-None default, so use empty string as fallback
-        # and coalesce with self._token which may also be None
-        return self._token_cv.get(self._token or "")
+        token = self._token_cv.get(None)
+        if token is not None:
+            return token
+        if self._token_pool is not None:
+            tenant = self._token_pool.current()
+            if tenant is not None:
+                return tenant.token
+        return self._token or ""
 
     @token.setter
     def token(self, value: str) -> None:
@@ -122,11 +235,43 @@ class TempestBase(Client):
         ]
         return type(self).__name__ + "(" + ", ".join(options) + ")"
 
+    def close(self) -> None:
+        """Wait for pending ``future()`` calls, then close the transport.
+
+        Only closes the transport if this client created it (owns it).
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            self._closed = True
+        if executor is not None:
+            executor.shutdown(wait=True)
+        super().close()
+
+    def _submit(self, call: Callable[[], Any]) -> Future[Any]:
+        """Run a call on the managed executor in a copy of the current context.
+
+        Token, tenant and priority scopes active at submission apply to the
+        call.
+
+        Raises:
+            RuntimeError: If the client is closed.
+        """
+        with self._executor_lock:
+            if self._closed:
+                raise RuntimeError("Client is closed.")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="tempestwx-future",
+                )
+            return self._executor.submit(copy_context().run, call)
+
     def _create_headers(self, content_type: str = "application/json") -> dict[str, str]:
         """Build HTTP headers for API requests.
 
         Creates standard headers including Authorization bearer token and
-        Content-Type.
+        Content-Type. Headers are built per call and not cached, so tokens
+        are not retained after their clients are gone.
 
         Args:
             content_type: The MIME type for the Content-Type header.
@@ -135,10 +280,7 @@ class TempestBase(Client):
         Returns:
             Dictionary of HTTP headers ready for request.
         """
-        return {
-            "Authorization": f"Bearer {self.token!s}",
-            "Content-Type": content_type,
-        }
+        return {"Authorization": f"Bearer {self.token!s}", "Content-Type": content_type}
 
     @staticmethod
     def _validate_enum_param(
@@ -148,6 +290,8 @@ class TempestBase(Client):
     ) -> _E:
         """Validate and convert a parameter to its enum type.
 
+        Successful coercions of literals are memoized per enum class and value.
+
         Args:
             param_name: Name of the parameter (for error messages).
             value: The value to validate (enum instance or literal such as
@@ -165,13 +309,61 @@ class TempestBase(Client):
 
         # Attempt to coerce common literal types (e.g., str, int) to the enum
         try:
-            return enum_class(value)
+            return cast(_E, _coerce_enum(enum_class, value))
         except (ValueError, TypeError):
             valid_values = [e.value for e in enum_class]
             raise ValueError(
                 f"Invalid {param_name}: {value!r}. Valid: {valid_values}"
             ) from None
 
+    @staticmethod
+    def _validate_units(
+        units_temp: UnitsTemp | str,
+        units_wind: UnitsWind | str,
+        units_pressure: UnitsPressure | str,
+        units_precip: UnitsPrecip | str,
+        units_distance: UnitsDistance | str,
+    ) -> ValidatedUnits:
+        """Validate the five unit parameters shared by several endpoints.
+
+        The validated tuple is memoized per combination of arguments, so
+        repeated calls with the same units skip validation entirely.
+        Unhashable arguments bypass the cache.
+
+        Args:
+            units_temp: Temperature units.
+            units_wind: Wind units.
+            units_pressure: Pressure units.
+            units_precip: Precipitation units.
+            units_distance: Distance units.
+
+        Returns:
+            Tuple of validated enum members in argument order.
+
+        Raises:
+            ValueError: If any unit is not a valid member of its enum.
+        """
+        units = (units_temp, units_wind, units_pressure, units_precip, units_distance)
+        try:
+            return _cached_units(*units)
+        except TypeError:
+            # Unhashable argument: validating it uncached raises ValueError
+            return _units(*units)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _unit_values(units: ValidatedUnits) -> tuple[str, str, str, str, str]:
+        """Return the raw API values of validated units, memoized per tuple.
+
+        Args:
+            units: Validated units as returned by :meth:`_validate_units`.
+
+        Returns:
+            Raw unit strings in the same order.
+        """
+        temp, wind, pressure, precip, distance = units
+        return temp.value, wind.value, pressure.value, precip.value, distance.value
+
     def send(self, request: Request) -> Response | Coroutine[None, None, Response]:
         """Build request url and headers, and send with underlying transport.
 
@@ -179,20 +371,92 @@ class TempestBase(Client):
         for custom behavior in some endpoint e.g. for a subclass.
         It may also come in handy if a bugfix or a feature is not implemented
         in a timely manner, or in debugging related to the client or Web API.
+
+        With a request scheduler, the request first waits for a slot of its
+        priority: the one set by :meth:`Tempest.priority`, else the
+        endpoint's default, else ``Priority.INTERACTIVE``.
+
+        Raises:
+            QuotaExceededError: If a token pool tenant is bound and its quota
+                is used up. Nothing is sent in that case.
+        """
+        self._authorize(request)
+        if self._scheduler is None:
+            return self.transport.send(request)
+
+        priority = self._priority(request)
+        if self.transport.is_async:
+            return self._send_scheduled(self._scheduler, priority, request)
+        with self._scheduler.slot(priority):
+            return self.transport.send(request)
+
+    async def _send_via(self, transport: Transport, request: Request) -> Response:
+        """Like :meth:`send`, but over another asynchronous transport.
+
+        Used to run calls of a synchronous client as tasks on the event
+        loop of a :class:`~tempestwx._http.BridgeTransport`.
+
+        Args:
+            transport: Asynchronous transport to send with.
+            request: The request to send.
+
+        Raises:
+            QuotaExceededError: If a token pool tenant is bound and its quota
+                is used up. Nothing is sent in that case.
+        """
+        self._authorize(request)
+        if self._scheduler is None:
+            return await cast(Coroutine[None, None, Response], transport.send(request))
+        return await self._send_scheduled(
+            self._scheduler, self._priority(request), request, transport
+        )
+
+    def _authorize(self, request: Request) -> None:
+        """Charge the bound tenant, then set the absolute url and headers.
+
+        Also marks the request trusted (or read-only) if trusted (or
+        read-only) decoding is in effect.
         """
+        if self._token_pool is not None:
+            self._token_pool.charge()
+        if self._trusted_cv.get(self._trusted):
+            request.trusted = True
+        if self._read_only_cv.get(self._read_only):
+            request.read_only = True
         request.url = self._build_url(request.url)
         headers = self._create_headers()
         if request.headers is not None:
             headers.update(request.headers)
         request.headers = headers
-        return self.transport.send(request)
+
+    def _priority(self, request: Request) -> Priority:
+        """Resolve the scheduling class of a request."""
+        priority = self._priority_cv.get(None)
+        if priority is None:
+            priority = request.priority
+        if priority is None:
+            priority = Priority.INTERACTIVE
+        return priority
+
+    async def _send_scheduled(
+        self,
+        scheduler: RequestScheduler,
+        priority: Priority,
+        request: Request,
+        transport: Transport | None = None,
+    ) -> Response:
+        transport = transport or self.transport
+        async with scheduler.aslot(priority):
+            return await cast(Coroutine[None, None, Response], transport.send(request))
 
     def _build_url(self, url: str) -> str:
         """Build complete URL by prepending API base if needed.
 
         If the URL doesn't start with "https", prepends the configured API
         base URI from settings. This allows endpoint methods to use relative
-        paths while supporting absolute URLs when needed.
+        paths while supporting absolute URLs when needed. The normalized
+        base URI is computed once per settings object; joining is a plain
+        concatenation, so nothing is retained per path.
 
         Args:
             url: Either a relative path (e.g., "stations") or absolute URL.
@@ -200,9 +464,9 @@ class TempestBase(Client):
         Returns:
             Complete URL ready for HTTP request.
         """
-        if not url.startswith("https"):
-            url = self.settings.api_uri_normalized + url.lstrip("/")
-        return url
+        if url.startswith("https"):
+            return url
+        return self.settings.api_uri_normalized + url.lstrip("/")
 
     @staticmethod
     def _parse_url_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
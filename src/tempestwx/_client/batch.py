@@ -0,0 +1,168 @@
+"""Deferred, concurrent endpoint calls for synchronous code.
+
+This module provides ``Batch``, created with ``Tempest.batch()``. Inside the
+``with`` block, endpoint calls on the batch (``b.stations()``,
+``b.stats(1)``, ``b.forecast(2)``, ...) validate their arguments and build
+their requests immediately, but return a :class:`concurrent.futures.Future`
+instead of blocking. When the block exits, all queued calls are sent
+concurrently on a thread pool over the client's shared transport, and each
+future resolves to the model the endpoint would have returned.
+
+The ``token_as`` and ``tenant`` scopes active when a call is queued apply
+to that call, even though it is sent from a worker thread.
+
+If the client's transport is a ``BridgeTransport``, the calls run as tasks
+on the bridge's event loop instead, so a batch of any size multiplexes over
+one async connection pool without a thread per request.
+
+Example:
+    >>> with twx.batch() as b:
+    ...     stations = b.stations()
+    ...     stats = b.stats(12345)
+    ...     forecast = b.forecast(12345)
+    >>> render(stations.result(), stats.result(), forecast.result())
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import Context, copy_context
+from typing import Any
+
+from tempestwx._http import BridgeTransport, Transport
+
+from .endpoint import BoundEndpoint, PreparedCall
+
+
+class Batch:
+    """Queue endpoint calls and send them concurrently on exit.
+
+    Args:
+        client: Synchronous client whose endpoints are called.
+        max_workers: Maximum number of requests in flight at once.
+
+    Raises:
+        ValueError: If the client is asynchronous (use ``asyncio.gather``).
+    """
+
+    def __init__(self, client: Any, max_workers: int = 8) -> None:
+        if client.is_async:
+            raise ValueError("Batch requires a synchronous client.")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.client = client
+        self.max_workers = max_workers
+        self._queue: list[tuple[PreparedCall, Context, Future[Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(queued={len(self._queue)})"
+
+    def __getattr__(self, name: str) -> Any:
+        endpoint = getattr(self.client, name)
+        if not isinstance(endpoint, BoundEndpoint):
+            raise AttributeError(f"{name!r} is not an endpoint method")
+
+        def defer(*args: Any, **kwargs: Any) -> Future[Any]:
+            return self.add(endpoint.prepare(*args, **kwargs))
+
+        defer.__name__ = name
+        defer.__doc__ = endpoint.__doc__
+        return defer
+
+    def __enter__(self) -> Batch:
+        """Enter context; queued calls run on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
+        """Run queued calls, or cancel them if the block raised."""
+        if exc_type is not None:
+            self.cancel()
+        else:
+            self.run()
+
+    def add(self, call: PreparedCall) -> Future[Any]:
+        """Queue a prepared call.
+
+        Args:
+            call: Prepared call of the batch's client.
+
+        Returns:
+            A future resolving to the call's result once the batch runs.
+        """
+        future: Future[Any] = Future()
+        self._queue.append((call, copy_context(), future))
+        return future
+
+    def run(self) -> None:
+        """Send all queued calls concurrently and wait for them to finish.
+
+        Failures are stored on the corresponding futures and do not stop
+        other calls.
+        """
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+        transport = self.client.transport
+        if isinstance(transport, BridgeTransport):
+            transport.run(self._arun(transport.transport, queue))
+            return
+        if len(queue) == 1:
+            self._resolve(*queue[0])
+            return
+        workers = min(self.max_workers, len(queue))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="tempestwx-batch"
+        ) as executor:
+            for item in queue:
+                executor.submit(self._resolve, *item)
+
+    def cancel(self) -> None:
+        """Cancel all queued calls without sending them."""
+        queue, self._queue = self._queue, []
+        for _, _, future in queue:
+            future.cancel()
+
+    async def _arun(
+        self,
+        transport: Transport,
+        queue: list[tuple[PreparedCall, Context, Future[Any]]],
+    ) -> None:
+        """Run queued calls as tasks, at most ``max_workers`` at once."""
+        limit = asyncio.Semaphore(self.max_workers)
+
+        async def resolve(call: PreparedCall, future: Future[Any]) -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                async with limit:
+                    result = await call.via(transport)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.create_task(resolve(call, future), context=context)
+                for call, context, future in queue
+            )
+        )
+
+    @staticmethod
+    def _resolve(call: PreparedCall, context: Context, future: Future[Any]) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = context.run(call)
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+
+__all__ = ["Batch"]
@@ -52,9 +52,11 @@ Example:
 from __future__ import annotations
 
 from collections.abc import Generator
+from concurrent.futures import Executor
 from contextlib import contextmanager
 
-from tempestwx._http import Transport
+from tempestwx._auth.pool import Tenant, TokenPool
+from tempestwx._http import Priority, RequestScheduler, Transport
 from tempestwx.settings import Settings
 from tempestwx.settings_loader import load_settings
 
@@ -64,6 +66,7 @@ from .api import (
     TempestStations,
     TempestStats,
 )
+from .batch import Batch
 
 
 class Tempest(
@@ -131,6 +134,14 @@ class Tempest(
         transport: Transport | None = None,
         asynchronous: bool | None = None,
         settings: Settings | None = None,
+        *,
+        token_pool: TokenPool | None = None,
+        scheduler: RequestScheduler | None = None,
+        decode_executor: Executor | None = None,
+        decode_min_bytes: int = 16384,
+        max_workers: int = 8,
+        trusted: bool = False,
+        read_only: bool = False,
     ) -> None:
         """Initialize Tempest client.
 
@@ -145,6 +156,24 @@ class Tempest(
                 resolution via `load_settings()` if provided). Note: token in
                 settings typically comes from TEMPEST_ACCESS_TOKEN; config.json does
                 not store tokens.
+            token_pool: Optional multi-tenant token pool; see :meth:`tenant`.
+            scheduler: Optional request scheduler dispatching requests by
+                priority class; see :meth:`priority`.
+            decode_executor: Optional ``ThreadPoolExecutor`` or
+                ``ProcessPoolExecutor`` on which asynchronous clients validate
+                large responses into models, overlapping decoding with network
+                I/O; so do calls run on the loop of a ``BridgeTransport``.
+                The executor is owned by the caller.
+            decode_min_bytes: Smallest response body sent to
+                ``decode_executor``.
+            max_workers: Threads running the ``future()`` form of endpoint
+                calls of synchronous clients.
+            trusted: Build response models without validation by default;
+                see :meth:`trusted`.
+            read_only: Return read-only model variants by default; see
+                :meth:`read_only`. Unknown attributes of read-only variants
+                are dropped silently: ``Model.warn_unknown_attributes`` has
+                no effect on them.
         """
         if token is None:
             base_settings = settings or load_settings()
@@ -157,6 +186,13 @@ class Tempest(
             transport=transport,
             asynchronous=asynchronous,
             settings=settings,
+            token_pool=token_pool,
+            scheduler=scheduler,
+            decode_executor=decode_executor,
+            decode_min_bytes=decode_min_bytes,
+            max_workers=max_workers,
+            trusted=trusted,
+            read_only=read_only,
         )
 
     @contextmanager
@@ -180,3 +216,146 @@ class Tempest(
             yield self
         finally:
             self._token_cv.reset(cv_token)
+
+    @contextmanager
+    def tenant(self, tenant_id: str) -> Generator[Tenant]:
+        """Act for a tenant of the client's token pool within a context.
+
+        The scope is bound to the current asyncio task or thread, so
+        concurrent tasks may each act for a different tenant while sharing
+        this client and its transport. Requests are charged to the tenant's
+        quota. For async clients, await calls inside the context.
+
+        Args:
+            tenant_id: Tenant registered in the client's token pool.
+
+        Yields:
+            The bound tenant.
+
+        Raises:
+            RuntimeError: If the client was created without a token pool.
+            KeyError: If the tenant is not registered.
+
+        Examples:
+            >>> pool = TokenPool()
+            >>> pool.add("acme", "acme-token", quota=1000, window=3600)
+            >>> client = Tempest(token_pool=pool)
+            >>> with client.tenant("acme"):
+            ...     stations = client.stations()  # Uses acme-token
+        """
+        if self._token_pool is None:
+            raise RuntimeError("Client was created without a token_pool.")
+        with self._token_pool.scope(tenant_id) as tenant:
+            yield tenant
+
+    @contextmanager
+    def priority(self, priority: Priority) -> Generator[Tempest]:
+        """Send requests made within a context at a given priority.
+
+        Overrides the endpoints' default priority classes (latest
+        observations are ``REALTIME``, observation history is ``BULK``, and
+        everything else is ``INTERACTIVE``). Only has an effect when the
+        client has a request scheduler. For async clients, await calls
+        inside the context.
+
+        Args:
+            priority: Priority class to use.
+
+        Yields:
+            This client instance.
+
+        Examples:
+            >>> client = Tempest(scheduler=RequestScheduler(max_concurrency=8))
+            >>> with client.priority(Priority.BULK):
+            ...     stations = client.stations()
+        """
+        cv_token = self._priority_cv.set(Priority(priority))
+        try:
+            yield self
+        finally:
+            self._priority_cv.reset(cv_token)
+
+    @contextmanager
+    def trusted(self, enabled: bool = True) -> Generator[Tempest]:
+        """Decode responses within a context without validation.
+
+        Models are built by direct assignment, recursing into nested models,
+        instead of being validated by pydantic. Use only when
+        the responses are known to be valid, e.g. when the transport serves
+        them from a verified cache or a replay store: field validators do not
+        run and unknown attributes are not reported. For async clients,
+        await calls inside the context.
+
+        Args:
+            enabled: Whether trusted decoding is on; False turns it off
+                within the context for a client created with ``trusted=True``.
+
+        Yields:
+            This client instance.
+
+        Examples:
+            >>> client = Tempest(transport=replay_transport)
+            >>> with client.trusted():
+            ...     forecast = client.forecast(12345)
+        """
+        cv_token = self._trusted_cv.set(enabled)
+        try:
+            yield self
+        finally:
+            self._trusted_cv.reset(cv_token)
+
+    @contextmanager
+    def read_only(self, enabled: bool = True) -> Generator[Tempest]:
+        """Decode responses within a context into read-only model variants.
+
+        Endpoints returning models return their frozen, slot-backed
+        variants instead (see :func:`tempestwx._models._read_only.read_only`):
+        validated the same way, but cheaper to build and much smaller, for
+        response data held in large numbers. Unknown attributes are ignored
+        without a warning whatever ``Model.warn_unknown_attributes`` says;
+        decode with full models to detect new API fields. Read-only decoding takes precedence over trusted
+        decoding. For async clients, await calls inside the context.
+
+        Args:
+            enabled: Whether read-only decoding is on; False turns it off
+                within the context for a client created with
+                ``read_only=True``.
+
+        Yields:
+            This client instance.
+
+        Examples:
+            >>> with client.read_only():
+            ...     forecast = client.forecast(12345)
+            >>> forecast.forecast.hourly[0].air_temperature
+            10.5
+        """
+        cv_token = self._read_only_cv.set(enabled)
+        try:
+            yield self
+        finally:
+            self._read_only_cv.reset(cv_token)
+
+    def batch(self, max_workers: int = 8) -> Batch:
+        """Collect endpoint calls and send them concurrently.
+
+        Calls made on the batch inside its ``with`` block return futures;
+        all of them are sent concurrently, over this client's transport,
+        when the block exits. Arguments are validated when a call is queued.
+
+        Args:
+            max_workers: Maximum number of requests in flight at once.
+
+        Returns:
+            A batch to use as a context manager.
+
+        Raises:
+            ValueError: If the client is asynchronous.
+
+        Examples:
+            >>> with client.batch() as b:
+            ...     stations = b.stations()
+            ...     forecast = b.forecast(12345)
+            >>> stations.result()
+        """
+        return Batch(self, max_workers=max_workers)
@@ -7,21 +7,33 @@ endpoint methods.
 
 The decorator works with the ``send_and_process`` transport layer to execute
 requests and apply post-processing functions (like model instantiation) to
-the response data.
+the response data. Decorated methods become ``Endpoint`` descriptors, which
+also support ``prepare()`` for building a request once and re-sending it.
 """
 
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import partial, wraps
 from typing import Any
 
-from tempestwx._http import Request, Response
+from tempestwx._client.endpoint import Endpoint
+from tempestwx._http import LazyResponse, Priority, Request, Response
 from tempestwx._http.client import send_and_process as _send_and_process
 
 from .error_handler import handle_errors
 
 
-def make_request(post_func: Callable[[Any], Any]) -> Callable[..., Any]:
+def _deferred(response: Response) -> bool:
+    """Return whether the response body was not parsed as JSON yet."""
+    return isinstance(response, LazyResponse) and response.deferred
+
+
+def make_request(
+    post_func: Callable[[Any], Any],
+    csv_func: Callable[[bytes], Any] | None = None,
+    priority: Priority | None = None,
+) -> Callable[[Callable[..., Any]], Endpoint]:
     """Decorate an endpoint method to execute HTTP requests with processing.
 
     This decorator transforms an endpoint method that returns a request tuple
@@ -32,27 +44,92 @@ def make_request(post_func: Callable[[Any], Any]) -> Callable[..., Any]:
     3. Apply a post-processing function to the response content
 
     The post-processing function is typically used to deserialize JSON
-    response data into Pydantic model instances.
+    response data into Pydantic model instances. Processors with a
+    ``decode(body, trusted)`` method (see ``model_instance()``) are given
+    the raw body instead when the transport has not parsed it yet, so
+    the response is validated into the model without an intermediate
+    dictionary.
 
     Args:
         post_func: A callable that processes the response content. Takes
             the parsed JSON content (or None) and returns a transformed
             result (e.g., a Pydantic model instance). Commonly created
             via ``model_instance()`` or ``pass_through()``.
+        csv_func: Optional decoder for endpoints that can answer in CSV.
+            Called with the raw body when the response is not JSON.
+        priority: Default scheduling class of the endpoint's requests, used
+            when the client has a request scheduler.
 
     Returns:
         A decorator function that can be applied to endpoint methods.
         The decorated method will have the signature of the original
-        method but will execute the full request/response cycle.
+        method but will execute the full request/response cycle. It also
+        gains ``prepare(*args, **kwargs)``, returning a reusable
+        :class:`~tempestwx._client.endpoint.PreparedCall`, and
+        ``raw(*args, **kwargs)``, returning the undecoded content.
 
     Example:
         >>> @make_request(model_instance(StationSet))
         ... def stations(self) -> StationSet:
         ...     return self._get("stations")
     """
+    # Processors without a trusted or read-only form (e.g. pass_through)
+    # are used as is
+    trusted_func = getattr(post_func, "construct", post_func)
+    read_only_func = getattr(post_func, "read_only", post_func)
+    decode = getattr(post_func, "decode", None)
+    trusted_decode = partial(decode, trusted=True) if decode is not None else None
+
+    def processor(request: Request) -> Callable[[Any], Any]:
+        if request.read_only:
+            return read_only_func
+        return trusted_func if request.trusted else post_func
 
     def parse_response(request: Request, response: Response) -> Any:
         handle_errors(request, response)
-        return post_func(response.content)
-
-    return _send_and_process(parse_response)
+        if decode is not None and _deferred(response):
+            # JSON not parsed yet: decode the bytes straight into the model
+            if request.read_only:
+                return read_only_func(response.raw)
+            return decode(response.raw, request.trusted)
+        if response.content is None and csv_func is not None and response.raw:
+            return csv_func(response.raw)
+        return processor(request)(response.content)
+
+    def raw_response(request: Request, response: Response) -> Any:
+        handle_errors(request, response)
+        return response.content
+
+    def decode_step(
+        request: Request, response: Response
+    ) -> tuple[Callable[[Any], Any], Any]:
+        # Same as parse_response, but returns the decoder and its input so
+        # the caller may run it elsewhere; raw bytes are preferred because
+        # they pickle cheaply to a process pool
+        handle_errors(request, response)
+        if not _deferred(response) and response.content is None:
+            if csv_func is not None and response.raw:
+                return csv_func, response.raw
+            return post_func, None
+        if decode is not None and response.raw:
+            if request.read_only:
+                return read_only_func, response.raw
+            if request.trusted and trusted_decode is not None:
+                return trusted_decode, response.raw
+            return decode, response.raw
+        return processor(request), response.content
+
+    def decorator(function: Callable[..., Any]) -> Endpoint:
+        build = function
+        if priority is not None:
+
+            @wraps(function)
+            def build(*args: Any, **kwargs: Any) -> tuple[Request, tuple[Any, ...]]:
+                request, extra = function(*args, **kwargs)
+                request.priority = priority
+                return request, extra
+
+        call = _send_and_process(parse_response)(build)
+        return Endpoint(build, call, parse_response, raw_response, decode_step)
+
+    return decorator
@@ -0,0 +1,290 @@
+"""Endpoint descriptors and prepared calls.
+
+Endpoint methods decorated with ``make_request`` are exposed as ``Endpoint``
+descriptors. Accessed through a client instance they yield a
+``BoundEndpoint``, which behaves like a bound method and adds:
+
+- ``prepare(*args, **kwargs)`` - validate arguments and build the
+  ``Request`` once, returning a reusable ``PreparedCall``
+- ``raw(*args, **kwargs)`` - send the request and return the error-checked
+  JSON content without decoding it into a model
+- ``future(*args, **kwargs)`` - on synchronous clients, send the request on
+  the client's managed thread pool (or as a task on the loop of a
+  ``BridgeTransport``) and return a :class:`concurrent.futures.Future`
+  immediately
+
+A ``PreparedCall`` re-sends its request with fresh auth headers each time it
+is called and decodes the response into the endpoint's usual model type.
+Calls are synchronous or return a coroutine, following the client's
+transport, exactly like the endpoint method itself.
+
+Example:
+    >>> latest = client.obs_station_latest.prepare(12345)
+    >>> for _ in range(60):
+    ...     obs = latest()  # No validation or URL building per call
+    >>> futures = [client.forecast.future(sid) for sid in station_ids]
+    >>> for done in as_completed(futures):
+    ...     render(done.result())
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextvars import copy_context
+from dataclasses import replace
+from functools import update_wrapper
+from typing import Any
+
+from tempestwx._http import BridgeTransport, Request, Response, Transport
+
+# (client, *args, **kwargs) -> (Request, extra params for the response parser)
+RequestBuilder = Callable[..., tuple[Request, tuple[Any, ...]]]
+# (request, response, *extra) -> decoded result
+ResponseParser = Callable[..., Any]
+# (request, response, *extra) -> (decoder, decoder input), run off the loop
+DecodeStep = Callable[..., tuple[Callable[[Any], Any], Any]]
+
+
+def _offloads(client: Any) -> bool:
+    """Whether the client decodes responses on an executor."""
+    return client.is_async and getattr(client, "_decode_executor", None) is not None
+
+
+class Endpoint:
+    """Descriptor wrapping a request-building endpoint method.
+
+    Args:
+        build: The undecorated method returning ``(Request, extra)``.
+        call: The full request executor produced by ``send_and_process``.
+        parse: Response parser applied to ``(request, response, *extra)``.
+        raw: Parser returning the error-checked, undecoded response content.
+        decode: Optional split form of ``parse`` returning the decoder and
+            its input instead of calling it, used to decode on an executor.
+    """
+
+    def __init__(
+        self,
+        build: RequestBuilder,
+        call: Callable[..., Any],
+        parse: ResponseParser,
+        raw: ResponseParser,
+        decode: DecodeStep | None = None,
+    ) -> None:
+        self.build = build
+        self.call = call
+        self.parse = parse
+        self.raw = raw
+        self.decode = decode
+        update_wrapper(self, build)
+
+    def __repr__(self) -> str:
+        return f"<endpoint {self.build.__qualname__}>"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return BoundEndpoint(self, instance)
+
+    def __call__(self, client: Any, *args: Any, **kwargs: Any) -> Any:
+        """Call the endpoint for ``client`` (unbound form)."""
+        return BoundEndpoint(self, client)(*args, **kwargs)
+
+
+class BoundEndpoint:
+    """An endpoint bound to a client, callable like a bound method.
+
+    Args:
+        endpoint: The endpoint descriptor.
+        client: The client the endpoint is bound to.
+    """
+
+    __slots__ = ("client", "endpoint")
+
+    def __init__(self, endpoint: Endpoint, client: Any) -> None:
+        self.endpoint = endpoint
+        self.client = client
+
+    def __repr__(self) -> str:
+        return f"<bound endpoint {self.endpoint.build.__qualname__} of {self.client!r}>"
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose __name__, __wrapped__, ... of the endpoint
+        if name in self.__slots__:
+            raise AttributeError(name)
+        return getattr(self.endpoint, name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Send the request and return the decoded result (or a coroutine)."""
+        if _offloads(self.client):
+            return self.prepare(*args, **kwargs)()
+        return self.endpoint.call(self.client, *args, **kwargs)
+
+    def prepare(self, *args: Any, **kwargs: Any) -> PreparedCall:
+        """Validate arguments and build the request once for repeated sending.
+
+        Args:
+            *args: Positional endpoint arguments.
+            **kwargs: Keyword endpoint arguments.
+
+        Returns:
+            A reusable prepared call.
+
+        Raises:
+            ValueError: If the endpoint rejects the arguments.
+        """
+        request, extra = self.endpoint.build(self.client, *args, **kwargs)
+        return PreparedCall(
+            self.client, request, extra, self.endpoint.parse, self.endpoint.decode
+        )
+
+    def future(self, *args: Any, **kwargs: Any) -> Future[Any]:
+        """Send the request in the background and return a future at once.
+
+        Arguments are validated and the request is built immediately; the
+        call then runs on the client's managed thread pool, so the caller
+        can do other work (or use :func:`concurrent.futures.as_completed`)
+        while it is in flight. Token, tenant and priority scopes active
+        here apply to the call.
+
+        Args:
+            *args: Positional endpoint arguments.
+            **kwargs: Keyword endpoint arguments.
+
+        Returns:
+            A future resolving to the decoded result.
+
+        Raises:
+            ValueError: If the endpoint rejects the arguments, or the client
+                is asynchronous (use ``asyncio.create_task``).
+            RuntimeError: If the client is closed.
+        """
+        if self.client.is_async:
+            raise ValueError("future() requires a synchronous client.")
+        call = self.prepare(*args, **kwargs)
+        transport = self.client.transport
+        if isinstance(transport, BridgeTransport):
+            return transport.submit(
+                call.via(transport.transport), context=copy_context()
+            )
+        future: Future[Any] = self.client._submit(call)
+        return future
+
+    def raw(self, *args: Any, **kwargs: Any) -> Any:
+        """Send the request and return the JSON content without decoding it.
+
+        Useful for callers that decide per record whether model validation
+        is needed at all, such as caches.
+
+        Args:
+            *args: Positional endpoint arguments.
+            **kwargs: Keyword endpoint arguments.
+
+        Returns:
+            The response content (a dict, or None), or a coroutine yielding
+            it for asynchronous clients.
+
+        Raises:
+            ValueError: If the endpoint rejects the arguments.
+        """
+        request, extra = self.endpoint.build(self.client, *args, **kwargs)
+        return PreparedCall(self.client, request, extra, self.endpoint.raw)()
+
+
+class PreparedCall:
+    """A pre-built endpoint request that can be sent repeatedly.
+
+    Each call copies the prepared request and sends it through the client,
+    so auth headers (including ``token_as`` and tenant scopes) are resolved
+    at call time. The response is decoded exactly as the endpoint method
+    would decode it.
+
+    Args:
+        client: Client used to send the request.
+        request: Fully built request (absolute URL, filtered parameters).
+        extra: Extra parameters for the response parser.
+        parse: Response parser of the endpoint.
+        decode: Split form of ``parse`` used when the client has a
+            ``decode_executor``.
+    """
+
+    __slots__ = ("client", "decode", "extra", "parse", "request")
+
+    def __init__(
+        self,
+        client: Any,
+        request: Request,
+        extra: tuple[Any, ...],
+        parse: ResponseParser,
+        decode: DecodeStep | None = None,
+    ) -> None:
+        self.client = client
+        self.request = request
+        self.extra = extra
+        self.parse = parse
+        self.decode = decode
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.request.method} {self.request.url})"
+
+    def __call__(self) -> Any:
+        """Send the prepared request and decode the response.
+
+        For asynchronous clients the request is authorized (and a bound
+        tenant charged) when the coroutine is awaited, not when it is
+        created, so an unawaited call costs no quota.
+
+        Returns:
+            The decoded result for synchronous clients, or a coroutine
+            yielding it for asynchronous clients.
+        """
+        request = replace(self.request)
+        if self.client.is_async:
+            return self._finish(request)
+        return self.parse(request, self.client.send(request), *self.extra)
+
+    async def via(self, transport: Transport) -> Any:
+        """Send the prepared request over an asynchronous transport.
+
+        Lets calls of a synchronous client run as tasks on the event loop
+        of a :class:`~tempestwx._http.BridgeTransport`. Responses of at
+        least ``decode_min_bytes`` are decoded off the loop, on the
+        client's ``decode_executor`` if it has one and in a worker thread
+        otherwise, so decoding never holds up other requests on the loop.
+
+        Args:
+            transport: Asynchronous transport to send with.
+
+        Returns:
+            The decoded result.
+        """
+        request = replace(self.request)
+        response = await self.client._send_via(transport, request)
+        if len(response.raw) < self.client._decode_min_bytes:
+            return self.parse(request, response, *self.extra)
+        if self.decode is not None and self.client._decode_executor is not None:
+            return await self._offload(self.decode, request, response)
+        return await asyncio.to_thread(self.parse, request, response, *self.extra)
+
+    async def _finish(self, request: Request) -> Any:
+        result: Response = await self.client.send(request)
+        if (
+            self.decode is not None
+            and _offloads(self.client)
+            and len(result.raw) >= self.client._decode_min_bytes
+        ):
+            return await self._offload(self.decode, request, result)
+        return self.parse(request, result, *self.extra)
+
+    async def _offload(
+        self, decode: DecodeStep, request: Request, response: Response
+    ) -> Any:
+        """Decode a response on the client's ``decode_executor``."""
+        decoder, data = decode(request, response, *self.extra)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.client._decode_executor, decoder, data
+        )
+
+
+__all__ = ["BoundEndpoint", "Endpoint", "PreparedCall"]
@@ -0,0 +1,414 @@
+"""Adaptive polling scheduler for latest station observations.
+
+This module provides ``PollScheduler``, an asyncio scheduler that polls
+``obs_station_latest`` for many stations without using a fixed global timer.
+For each station it learns:
+
+- The reporting cadence (from explicit ``reporting_interval`` values, index 17
+  of ``TempestObservation``, or from the spacing of observed timestamps)
+- The timestamp of the most recent observation
+
+and schedules the next poll just after the next report is expected, plus a
+random jitter so that stations sharing a cadence do not poll in lockstep.
+Stations that stop reporting are backed off exponentially up to a ceiling.
+
+Pending polls are kept in a binary heap keyed by due time, so adding,
+rescheduling and popping a station are all O(log n) even when tens of
+thousands of stations are tracked.
+
+Example:
+    >>> async with Tempest(asynchronous=True) as client:
+    ...     scheduler = PollScheduler(client, on_observation=handle)
+    ...     for station_id in station_ids:
+    ...         scheduler.add(station_id)
+    ...     await scheduler.run()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import inspect
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from tempestwx._models.station_observation_latest import StationObservationLatest
+
+ObservationCallback = Callable[[int, StationObservationLatest], Awaitable[None] | None]
+
+# Smoothing factor for the reporting interval moving average
+_ALPHA = 0.5
+# Gaps longer than this many intervals are outages, not cadence samples
+_GAP_FACTOR = 3.0
+# Relative tolerance for two long spacings to confirm a slower cadence
+_CONFIRM_TOLERANCE = 0.1
+# Cap on the backoff exponent to keep 2**n bounded
+_MAX_EXPONENT = 16
+
+
+@dataclass
+class StationPollState:
+    """Polling state learned for a single station.
+
+    Attributes:
+        station_id: Station being polled.
+        interval: Estimated reporting interval in seconds.
+        last_obs: Epoch seconds of the newest observation seen, if any.
+        next_due: Epoch seconds at which the station is next polled.
+        stale_polls: Consecutive polls that returned no new observation.
+        failures: Consecutive polls that raised an error.
+        callback_errors: Total ``on_observation`` calls that raised.
+        last_callback_error: The most recent exception raised by
+            ``on_observation``, if any.
+    """
+
+    station_id: int
+    interval: float
+    last_obs: float | None = None
+    next_due: float = 0.0
+    stale_polls: int = 0
+    failures: int = 0
+    callback_errors: int = 0
+    last_callback_error: BaseException | None = None
+    _seq: int = -1
+    _long_delta: float | None = None
+
+
+class PollScheduler:
+    """Poll latest station observations aligned to each station's cadence.
+
+    Args:
+        client: Asynchronous ``Tempest`` client (``asynchronous=True``).
+        on_observation: Called with ``(station_id, observation)`` whenever a
+            poll returns a newer observation. May be a coroutine function.
+            The station is rescheduled before the call; exceptions it raises
+            are counted in :attr:`StationPollState.callback_errors` and do
+            not stop polling.
+        default_interval: Reporting interval (seconds) assumed until a
+            station's cadence has been learned.
+        min_interval: Lower bound for a learned interval (seconds).
+        max_interval: Upper bound for a learned interval (seconds).
+        report_delay: Seconds after the expected report time to poll, giving
+            the API time to ingest the observation. Also the step by which
+            re-polls of a late station are spaced, so it must be positive.
+        jitter: Maximum random delay (seconds) added to every poll.
+        offline_after: Number of missed intervals after which a station is
+            considered offline and backed off exponentially.
+        max_backoff: Ceiling (seconds) for offline and error backoff.
+        max_concurrency: Maximum number of polls in flight.
+        clock: Callable returning the current epoch seconds.
+        rng: Random generator used for jitter.
+
+    Raises:
+        ValueError: If ``client`` is not asynchronous, ``report_delay`` is not
+            positive or ``max_concurrency`` is less than 1.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        on_observation: ObservationCallback | None = None,
+        default_interval: float = 60.0,
+        min_interval: float = 10.0,
+        max_interval: float = 3600.0,
+        report_delay: float = 5.0,
+        jitter: float = 2.0,
+        offline_after: float = 5.0,
+        max_backoff: float = 900.0,
+        max_concurrency: int = 16,
+        clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        if not client.is_async:
+            raise ValueError("PollScheduler requires an asynchronous client.")
+        if report_delay <= 0:
+            raise ValueError("report_delay must be positive.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.client = client
+        self.on_observation = on_observation
+        self.default_interval = default_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.report_delay = report_delay
+        self.jitter = jitter
+        self.offline_after = offline_after
+        self.max_backoff = max_backoff
+        self.max_concurrency = max_concurrency
+        self._clock = clock
+        self._rng = rng or random.Random()  # nosec B311 - jitter, not crypto
+        self._states: dict[int, StationPollState] = {}
+        self._heap: list[tuple[float, int, int]] = []
+        self._seq = 0
+        self._wakeup: asyncio.Event | None = None
+        self._stopped = False
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, station_id: object) -> bool:
+        return station_id in self._states
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(stations={len(self._states)})"
+
+    def state(self, station_id: int) -> StationPollState:
+        """Return the learned polling state for a station.
+
+        Raises:
+            KeyError: If the station is not tracked.
+        """
+        return self._states[station_id]
+
+    def add(
+        self,
+        station_id: int,
+        *,
+        interval: float | None = None,
+        last_obs: float | None = None,
+    ) -> None:
+        """Start tracking a station.
+
+        Args:
+            station_id: Station to poll.
+            interval: Known reporting interval in seconds, if any.
+            last_obs: Epoch seconds of the newest known observation, if any.
+
+        Raises:
+            ValueError: If ``station_id`` is not positive.
+        """
+        if station_id <= 0:
+            raise ValueError("station_id must be a positive integer.")
+        state = StationPollState(
+            station_id=station_id,
+            interval=self._clamp(interval or self.default_interval),
+            last_obs=last_obs,
+        )
+        self._states[station_id] = state
+        now = self._clock()
+        if last_obs is None:
+            self._schedule(state, now + self._jitter())
+        else:
+            self._schedule(state, self._expected_due(state, now))
+
+    def remove(self, station_id: int) -> None:
+        """Stop tracking a station. Its pending heap entry is discarded lazily."""
+        self._states.pop(station_id, None)
+
+    def observe(
+        self,
+        station_id: int,
+        timestamp: float,
+        reporting_interval: float | None = None,
+    ) -> bool:
+        """Feed an observation timestamp into the cadence model.
+
+        Called automatically after each poll, but may also be called with
+        observations obtained elsewhere (e.g. ``obs_device`` rows carrying
+        ``reporting_interval``) to speed up learning.
+
+        Args:
+            station_id: Tracked station.
+            timestamp: Observation epoch seconds.
+            reporting_interval: Reporting interval in minutes, as carried by
+                device observations, if known.
+
+        Returns:
+            True if the observation is newer than the last one seen.
+        """
+        state = self._states[station_id]
+        if reporting_interval:
+            state.interval = self._clamp(reporting_interval * 60)
+        if state.last_obs is not None and timestamp <= state.last_obs:
+            return False
+        if not reporting_interval and state.last_obs is not None:
+            self._learn_interval(state, timestamp - state.last_obs)
+        state.last_obs = timestamp
+        return True
+
+    def _learn_interval(self, state: StationPollState, delta: float) -> None:
+        """Update the interval estimate from the spacing of two observations.
+
+        Short spacings feed a moving average. A long spacing is treated as an
+        outage unless the next spacing confirms it, in which case the station
+        has moved to a slower cadence.
+        """
+        if delta <= _GAP_FACTOR * state.interval:
+            state.interval = self._clamp(
+                state.interval + _ALPHA * (delta - state.interval)
+            )
+            state._long_delta = None
+        elif (
+            state._long_delta is not None
+            and abs(delta - state._long_delta) <= _CONFIRM_TOLERANCE * delta
+        ):
+            state.interval = self._clamp(delta)
+            state._long_delta = None
+        else:
+            state._long_delta = delta
+
+    def next_due(self) -> float | None:
+        """Return the due time of the earliest pending poll, if any."""
+        self._discard_stale_entries()
+        return self._heap[0][0] if self._heap else None
+
+    async def poll_due(self) -> int:
+        """Poll every station that is currently due, then return.
+
+        At most ``max_concurrency`` polls are in flight at once.
+
+        Returns:
+            Number of stations polled.
+        """
+        due = self._pop_due(self._clock())
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*(self._poll_bounded(state, semaphore) for state in due))
+        return len(due)
+
+    async def run(self) -> None:
+        """Poll stations as they become due until :meth:`stop` is called."""
+        self._stopped = False
+        self._wakeup = asyncio.Event()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        in_flight: set[asyncio.Task[None]] = set()
+        try:
+            while not self._stopped:
+                for state in self._pop_due(self._clock()):
+                    task = asyncio.create_task(self._poll_bounded(state, semaphore))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                due = self.next_due()
+                timeout = None if due is None else max(0.0, due - self._clock())
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    def stop(self) -> None:
+        """Ask a running :meth:`run` loop to exit after in-flight polls."""
+        self._stopped = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _poll_bounded(
+        self, state: StationPollState, semaphore: asyncio.Semaphore
+    ) -> None:
+        async with semaphore:
+            await self._poll(state)
+
+    async def _poll(self, state: StationPollState) -> None:
+        """Poll a single station and reschedule it."""
+        try:
+            latest = await self.client.obs_station_latest(state.station_id)
+        except Exception:  # any failure backs the station off
+            state.failures += 1
+            self._reschedule(state, self._clock() + self._backoff(state.failures))
+            return
+        state.failures = 0
+
+        if state.station_id not in self._states:
+            return  # removed while in flight
+
+        timestamp = _latest_timestamp(latest)
+        if timestamp is None or not self.observe(state.station_id, timestamp):
+            state.stale_polls += 1
+            now = self._clock()
+            self._reschedule(state, now + self._retry_delay(state, now))
+            return
+        state.stale_polls = 0
+        # Reschedule first so a failing callback cannot drop the station
+        self._reschedule(state, self._expected_due(state, self._clock()))
+        if self.on_observation is not None:
+            await _notify(self.on_observation, state, latest)
+
+    def _expected_due(self, state: StationPollState, now: float) -> float:
+        """Return the poll time just after the next expected report."""
+        if state.last_obs is None:
+            return now + self._jitter()
+        due = state.last_obs + state.interval + self.report_delay
+        return max(due, now) + self._jitter()
+
+    def _retry_delay(self, state: StationPollState, now: float) -> float:
+        """Return the delay before re-polling a station with no new data."""
+        overdue = now - (state.last_obs if state.last_obs is not None else now)
+        if state.last_obs is not None and overdue < self.offline_after * (
+            state.interval
+        ):
+            # Late report from a live station: check again soon
+            return min(state.interval, self.report_delay * state.stale_polls)
+        return self._backoff(state.stale_polls) + self._jitter()
+
+    def _backoff(self, attempts: int) -> float:
+        """Return an exponential backoff delay capped at ``max_backoff``."""
+        exponent = min(attempts, _MAX_EXPONENT)
+        return float(min(self.max_backoff, self.default_interval * 2**exponent))
+
+    def _reschedule(self, state: StationPollState, due: float) -> None:
+        if state.station_id in self._states:
+            self._schedule(state, due)
+
+    def _schedule(self, state: StationPollState, due: float) -> None:
+        """Push a heap entry; any previous entry for the state becomes stale."""
+        self._seq += 1
+        state._seq = self._seq
+        state.next_due = due
+        heapq.heappush(self._heap, (due, self._seq, state.station_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _pop_due(self, now: float) -> list[StationPollState]:
+        """Pop all live heap entries due at or before ``now``."""
+        due: list[StationPollState] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, station_id = heapq.heappop(self._heap)
+            state = self._states.get(station_id)
+            if state is not None and state._seq == seq:
+                due.append(state)
+        return due
+
+    def _discard_stale_entries(self) -> None:
+        while self._heap:
+            _, seq, station_id = self._heap[0]
+            state = self._states.get(station_id)
+            if state is not None and state._seq == seq:
+                return
+            heapq.heappop(self._heap)
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def _jitter(self) -> float:
+        return self._rng.uniform(0.0, self.jitter) if self.jitter > 0 else 0.0
+
+
+async def _notify(
+    callback: ObservationCallback,
+    state: StationPollState,
+    latest: StationObservationLatest,
+) -> None:
+    """Call ``callback``, recording any exception it raises on the state."""
+    try:
+        result = callback(state.station_id, latest)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as exc:  # a faulty callback must not stop polling
+        state.callback_errors += 1
+        state.last_callback_error = exc
+
+
+def _latest_timestamp(latest: StationObservationLatest | None) -> float | None:
+    """Return the newest observation timestamp in a latest-obs response."""
+    if latest is None or not latest.obs:
+        return None
+    timestamps = [ob.timestamp for ob in latest.obs if ob.timestamp is not None]
+    return max(timestamps) if timestamps else None
+
+
+__all__ = ["PollScheduler", "StationPollState"]
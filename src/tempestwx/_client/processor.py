@@ -5,14 +5,35 @@ This module provides small, composable helpers for shaping API response data:
 - `pass_through`: returns a value unchanged (useful as a default processor).
 - `model_instance`: factory that builds a callable to convert a mapping into
     an instance of a provided `Model` subclass, returning `None` for `None`.
+    The callable (a `ModelInstance`) is picklable and can also validate raw
+    JSON bytes directly, so it may run on a process pool, or construct the
+    model from trusted data without validation, or validate it into the
+    model's read-only variant.
+- `iter_obs_csv` / `obs_csv_columns`: stream a CSV observation body into
+    obs_st-ordered rows or per-field columns.
+- `device_observation_csv`: decode a CSV ``obs_device`` body into a
+    `DeviceObservation`.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from typing import Any, TypeVar
+import csv
+import io
+import json
+from collections.abc import Iterator, Mapping
+from itertools import chain
+from typing import Any, Generic, TypeVar
+from warnings import warn
+
+from pydantic import ValidationError
 
 from tempestwx._models import Model
+from tempestwx._models._construct import construct
+from tempestwx._models._read_only import ReadOnlyModel
+from tempestwx._models._read_only import read_only as _read_only
+from tempestwx._models._serializer import UnknownModelAttributeWarning
+from tempestwx._models.device_observation import DeviceObservation
+from tempestwx._models.obs_st import OBS_ST_FIELDS, Raw
 
 T = TypeVar("T")
 ModelT = TypeVar("ModelT", bound=Model)
@@ -40,9 +61,81 @@ def pass_through(value: T) -> T:
     return value
 
 
-def model_instance(
-    type_: type[ModelT],
-) -> Callable[[Mapping[str, Any] | None], ModelT | None]:
+class ModelInstance(Generic[ModelT]):
+    """Callable converting a mapping (or raw JSON body) into a model.
+
+    Instances are picklable, so the decoding step can run on a process
+    pool as well as in the calling thread.
+
+    Args:
+        type_: A Pydantic model class (not an instance) to instantiate.
+    """
+
+    __slots__ = ("type_",)
+
+    def __init__(self, type_: type[ModelT]) -> None:
+        self.type_ = type_
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.type_.__name__})"
+
+    def __call__(self, data: Mapping[str, Any] | None) -> ModelT | None:
+        """Instantiate the model from a mapping, or return None for None."""
+        return self.type_(**data) if data is not None else None
+
+    def construct(self, data: Mapping[str, Any] | None) -> ModelT | None:
+        """Build the model from trusted data without validation.
+
+        See :func:`tempestwx._models._construct.construct`.
+        """
+        return construct(self.type_, data) if data is not None else None
+
+    def read_only(self, data: Mapping[str, Any] | bytes | None) -> ReadOnlyModel | None:
+        """Validate a mapping or raw JSON body into the read-only variant.
+
+        See :func:`tempestwx._models._read_only.read_only`.
+        """
+        if data is None:
+            return None
+        variant = _read_only(self.type_)
+        if isinstance(data, bytes):
+            try:
+                return variant.validate_json(data)
+            except ValidationError as error:
+                if _not_json(error):
+                    return None
+                raise
+        return variant.validate(data)
+
+    def decode(self, body: bytes, trusted: bool = False) -> ModelT | None:
+        """Instantiate (or construct) the model from a raw JSON body.
+
+        Validation runs on the bytes directly (``model_validate_json``), so
+        no intermediate dictionary is built; unknown attributes are reported
+        in the same pass. Trusted bodies are parsed and then constructed.
+        Bodies that are not JSON (e.g. an HTML error page) decode to None,
+        as their parsed content would be.
+        """
+        if trusted:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                return None
+            return self.construct(data)
+        try:
+            return self.type_.model_validate_json(body)
+        except ValidationError as error:
+            if _not_json(error):
+                return None
+            raise
+
+
+def _not_json(error: ValidationError) -> bool:
+    """Return whether validation failed because the body is not JSON."""
+    return any(e["type"] == "json_invalid" and not e["loc"] for e in error.errors())
+
+
+def model_instance(type_: type[ModelT]) -> ModelInstance[ModelT]:
     """Create a function that instantiates a Pydantic model from a mapping.
 
     This factory function returns a callable that converts a dictionary or
@@ -57,9 +150,10 @@ def model_instance(
         type_: A Pydantic model class (not an instance) to instantiate.
 
     Returns:
-        A callable that takes an optional mapping and returns an optional
-        model instance. If the input is ``None``, returns ``None``. Otherwise,
-        unpacks the mapping as keyword arguments to construct the model.
+        A picklable callable that takes an optional mapping and returns an
+        optional model instance. If the input is ``None``, returns ``None``.
+        Otherwise, unpacks the mapping as keyword arguments to construct the
+        model. Its ``decode(body)`` method validates raw JSON bytes directly.
 
     Example:
         >>> from tempestwx._models.station_set import StationSet
@@ -68,4 +162,176 @@ def model_instance(
         >>> result = builder(data)  # Returns StationSet instance
         >>> result = builder(None)  # Returns None
     """
-    return lambda data: type_(**data) if data is not None else None
+    return ModelInstance(type_)
+
+
+_OBS_ST_INDEX = {name: i for i, name in enumerate(OBS_ST_FIELDS)}
+# Named-field spellings used elsewhere in the API for the same obs_st values
+_OBS_ST_ALIASES = {
+    "epoch": "timestamp",
+    "time_epoch": "timestamp",
+    "wind_avg": "wind_average",
+    "station_pressure": "pressure",
+    "brightness": "lux",
+    "precip": "rain_accumulation",
+    "precip_type": "precipitation_type",
+    "lightning_strike_avg_distance": "lightning_average_distance",
+    "report_interval": "reporting_interval",
+    # Column names of ``format=csv`` responses
+    "wind_dir": "wind_direction",
+    "temperature": "air_temperature",
+    "humidity": "relative_humidity",
+    "strike_distance": "lightning_average_distance",
+    "strike_count": "lightning_strike_count",
+    "local_daily_precip": "local_day_rain_accumulation",
+    "precip_final": "nearcast_rain_accumulation",
+    "local_daily_precip_final": "local_day_nearcast_rain_accumulation",
+    "precip_analysis_type": "precipitation_analysis_type",
+}
+# Per-row metadata columns of CSV responses, not part of obs_st
+_CSV_METADATA = frozenset({"device_id", "type", "bucket_step_minutes"})
+# Metadata columns that must be the same on every row
+_CSV_CHECKED = ("device_id", "type")
+_NULLS = frozenset({"", "null", "none"})
+
+
+def _csv_value(text: str) -> Raw:
+    """Convert one CSV cell to an int, float, None, or (failing that) str."""
+    text = text.strip()
+    if text.lower() in _NULLS:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def iter_obs_csv(
+    body: bytes, metadata: dict[str, Raw] | None = None
+) -> Iterator[list[Raw]]:
+    """Stream a CSV observation body into obs_st-ordered rows.
+
+    The body is parsed row by row with :mod:`csv`; no intermediate JSON or
+    list of lines is built. If the first row is a header, columns are
+    matched to obs_st fields by name (missing ones are None; unknown
+    columns are dropped with a warning), and the ``type`` and ``device_id``
+    columns of API responses are checked. Otherwise rows are assumed to be
+    in obs_st order already.
+
+    Args:
+        body: Raw CSV response body.
+        metadata: Optional dict receiving the ``device_id`` and ``type`` of
+            the rows, if the body has these columns.
+
+    Yields:
+        One 22-item obs_st array per data row.
+
+    Raises:
+        ValueError: If a row is of another type than ``obs_st`` (e.g. from
+            an Air or Sky device), or rows of several devices are mixed.
+
+    Warns:
+        UnknownModelAttributeWarning: When the header names columns that are
+            not obs_st fields.
+    """
+    reader = csv.reader(io.TextIOWrapper(io.BytesIO(body), encoding="utf-8"))
+    first = next(reader, None)
+    if first is None:
+        return
+    size = len(OBS_ST_FIELDS)
+    if first and isinstance(_csv_value(first[0]), str):
+        names = [h.strip().lower() for h in first]
+        index = [_OBS_ST_INDEX.get(_OBS_ST_ALIASES.get(name, name)) for name in names]
+        unknown = [
+            name
+            for name, i in zip(names, index, strict=True)
+            if i is None and name not in _CSV_METADATA
+        ]
+        if unknown:
+            columns = ", ".join(f"`{name}`" for name in unknown)
+            msg = (
+                f"CSV observations contain unknown columns: {columns}, "
+                "which were discarded. This warning may be safely ignored. "
+                "Please consider upgrading."
+            )
+            warn(msg, UnknownModelAttributeWarning, stacklevel=2)
+        meta = metadata if metadata is not None else {}
+        checked = [(name, names.index(name)) for name in _CSV_CHECKED if name in names]
+        for row in reader:
+            if not row:
+                continue
+            for name, column in checked:
+                if column < len(row):
+                    _check_csv_metadata(meta, name, _csv_value(row[column]))
+            values: list[Raw] = [None] * size
+            for i, text in zip(index, row, strict=False):
+                if i is not None:
+                    values[i] = _csv_value(text)
+            yield values
+        return
+    for row in chain((first,), reader):
+        if row:
+            values = [_csv_value(text) for text in row[:size]]
+            values.extend([None] * (size - len(values)))
+            yield values
+
+
+def _check_csv_metadata(metadata: dict[str, Raw], name: str, value: Raw) -> None:
+    """Record a row's metadata cell, rejecting rows that are not obs_st."""
+    if name == "type" and value != "obs_st":
+        raise ValueError(
+            f"CSV observations of type {value!r} cannot be decoded as obs_st."
+        )
+    previous = metadata.setdefault(name, value)
+    if previous != value:
+        raise ValueError(f"CSV observations mix {name} {previous!r} and {value!r}.")
+
+
+def obs_csv_columns(body: bytes) -> dict[str, list[Raw]]:
+    """Stream a CSV observation body into per-field columns.
+
+    Args:
+        body: Raw CSV response body.
+
+    Returns:
+        Mapping of obs_st field name to its column of values.
+    """
+    columns: list[list[Raw]] = [[] for _ in OBS_ST_FIELDS]
+    appends = [column.append for column in columns]
+    for row in iter_obs_csv(body):
+        for append, value in zip(appends, row, strict=True):
+            append(value)
+    return dict(zip(OBS_ST_FIELDS, columns, strict=True))
+
+
+def device_observation_csv(body: bytes) -> DeviceObservation | None:
+    """Decode a CSV ``obs_device`` body into a ``DeviceObservation``.
+
+    Rows are stored in ``obs`` in obs_st order, so they can be read exactly
+    like a JSON response (e.g. with ``TempestObservation.from_array``). The
+    device id is taken from the body's ``device_id`` column.
+
+    Args:
+        body: Raw CSV response body.
+
+    Returns:
+        Device observations, or None for an empty body.
+
+    Raises:
+        ValueError: If the rows are not obs_st observations of one device.
+    """
+    if not body.strip():
+        return None
+    metadata: dict[str, Raw] = {}
+    obs = list(iter_obs_csv(body, metadata))
+    device_id = metadata.get("device_id")
+    return DeviceObservation(
+        device_id=device_id if isinstance(device_id, int) else None,
+        type_="obs_st",
+        source="csv",
+        obs=obs,
+    )
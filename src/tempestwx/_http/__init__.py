@@ -6,7 +6,9 @@ by the Tempest API client. It abstracts over httpx to provide:
 - Request/Response dataclasses for structured HTTP operations
 - Transport interface supporting both sync and async operation modes
 - Concrete sync/async transport implementations using httpx
+- Blocking bridge transport running the async transport on a loop thread
 - HTTP error hierarchy with specific exception types for status codes
+- Priority-aware request scheduler sharing a concurrency and rate budget
 - Client base class with transport management
 - Decorator utilities for request processing
 
@@ -18,7 +20,8 @@ Internal API:
     ``Tempest`` client class instead.
 """
 
-from .base import Request, Response, Transport
+from .base import LazyResponse, Request, Response, Transport
+from .bridge import BridgeTransport
 from .client import Client, TransportConflictWarning
 from .concrete import AsyncTransport, SyncTransport
 from .error import (
@@ -34,10 +37,12 @@ from .error import (
     TooManyRequestsError,
     UnauthorisedError,
 )
+from .scheduler import Priority, PriorityStats, RequestScheduler
 from .wrapper import TransportWrapper
 
 __all__ = [
     # Core types
+    "LazyResponse",
     "Request",
     "Response",
     "Transport",
@@ -46,6 +51,7 @@ __all__ = [
     "TransportConflictWarning",
     # Concrete transports
     "AsyncTransport",
+    "BridgeTransport",
     "SyncTransport",
     # Error hierarchy
     "BadGatewayError",
@@ -59,6 +65,10 @@ __all__ = [
     "ServiceUnavailableError",
     "TooManyRequestsError",
     "UnauthorisedError",
+    # Scheduling
+    "Priority",
+    "PriorityStats",
+    "RequestScheduler",
     # Wrappers
     "TransportWrapper",
 ]
@@ -4,6 +4,7 @@ This module defines the foundational types for the HTTP transport layer:
 
 - Request: Dataclass encapsulating HTTP request parameters
 - Response: Dataclass encapsulating HTTP response data
+- LazyResponse: Response parsing its JSON content on first access
 - Transport: Abstract interface for sending requests (sync or async)
 
 These abstractions allow the SDK to remain independent of specific HTTP
@@ -12,11 +13,14 @@ libraries while supporting both synchronous and asynchronous operation modes.
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from collections.abc import Coroutine
 from dataclasses import dataclass
 from typing import Any
 
+from .scheduler import Priority
+
 
 @dataclass
 class Request:
@@ -34,6 +38,12 @@ class Request:
         data: Optional form data body.
         json: Optional JSON body (mutually exclusive with data/content).
         content: Optional raw string body.
+        priority: Scheduling class used when the client has a request
+            scheduler. None means the client's default.
+        trusted: Whether the response is known to be valid and may be
+            decoded without validation.
+        read_only: Whether the response is decoded into read-only model
+            variants.
     """
 
     method: str
@@ -43,6 +53,9 @@ class Request:
     data: dict[str, Any] | None = None
     json: dict[str, Any] | None = None
     content: str | None = None
+    priority: Priority | None = None
+    trusted: bool = False
+    read_only: bool = False
 
 
 @dataclass
@@ -51,18 +64,71 @@ class Response:
 
     Encapsulates the essential components of an HTTP response.
     Content is pre-parsed as JSON (or None if not JSON or parsing failed).
+    The undecoded body is kept for non-JSON formats such as CSV.
 
     Attributes:
         url: Final URL after any redirects.
         headers: Response HTTP headers.
         status_code: HTTP status code (200, 404, 500, etc.).
         content: Parsed JSON content as a dictionary, or None.
+        raw: Undecoded response body.
     """
 
     url: str
     headers: dict[str, str]
     status_code: int
     content: dict[str, Any] | None
+    raw: bytes = b""
+
+
+class LazyResponse(Response):
+    """Response whose JSON content is parsed from the raw body on first access.
+
+    Returned by the concrete transports, so that decoders reading the raw
+    body directly (e.g. into a model with ``model_validate_json``) never
+    build the intermediate dictionary. Reading ``content`` behaves exactly
+    as for :class:`Response`.
+
+    Args:
+        url: Final URL after any redirects.
+        headers: Response HTTP headers.
+        status_code: HTTP status code.
+        raw: Undecoded response body.
+        is_json: Whether the body may be JSON. False for e.g. CSV bodies,
+            whose content is None.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict[str, str],
+        status_code: int,
+        raw: bytes,
+        is_json: bool = True,
+    ) -> None:
+        self.url = url
+        self.headers = headers
+        self.status_code = status_code
+        self.raw = raw
+        self._content: dict[str, Any] | None = None
+        # Empty bodies have no content, as for a failed parse
+        self.deferred = is_json and bool(raw)
+
+    @property
+    def content(self) -> dict[str, Any] | None:
+        """Parsed JSON content as a dictionary, or None."""
+        if self.deferred:
+            self.deferred = False
+            try:
+                self._content = json.loads(self.raw)
+            except ValueError:
+                self._content = None
+        return self._content
+
+    @content.setter
+    def content(self, value: dict[str, Any] | None) -> None:
+        self.deferred = False
+        self._content = value
 
 
 class Transport(ABC):
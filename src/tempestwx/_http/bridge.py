@@ -0,0 +1,141 @@
+"""Blocking transport backed by a private event loop thread.
+
+This module provides ``BridgeTransport``, a synchronous transport that runs
+an :class:`AsyncTransport` on one background event loop thread. Blocking
+calls hand their coroutine to the loop with
+:func:`asyncio.run_coroutine_threadsafe` and wait for the result, so a
+synchronous ``Tempest`` client gets the connection multiplexing of
+``httpx.AsyncClient``. Batches and ``future()`` calls of a client using the
+bridge run as tasks on that loop instead of one OS thread per request.
+
+Example:
+    >>> with BridgeTransport() as bridge:
+    ...     twx = Tempest(transport=bridge)
+    ...     with twx.batch() as b:
+    ...         forecasts = [b.forecast(sid) for sid in station_ids]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from contextvars import Context
+from typing import Any, TypeVar
+
+from .base import Request, Response, Transport
+from .concrete import AsyncTransport
+
+T = TypeVar("T")
+
+
+class BridgeTransport(Transport):
+    """Send requests synchronously through an async transport on a loop thread.
+
+    The loop thread is started on construction and stopped by :meth:`close`,
+    which also closes the wrapped transport.
+
+    Args:
+        transport: Asynchronous transport run on the loop thread. A new
+            :class:`AsyncTransport` if not specified.
+    """
+
+    def __init__(self, transport: AsyncTransport | None = None) -> None:
+        self.transport = transport or AsyncTransport()
+        self._loop = asyncio.new_event_loop()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="tempestwx-bridge", daemon=True
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(transport={self.transport!r})"
+
+    def __enter__(self) -> BridgeTransport:
+        """Enter context; the loop thread is stopped on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
+        """Exit context and close the transport."""
+        self.close()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The private event loop."""
+        return self._loop
+
+    @property
+    def is_async(self) -> bool:
+        """Transport asynchronicity, always :class:`False`."""
+        return False
+
+    def send(self, request: Request) -> Response:
+        """Send a request on the loop thread and wait for the response.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            Response with parsed JSON content and the raw body.
+        """
+        return self.run(self.transport.send(request))
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop thread and wait for its result.
+
+        Raises:
+            RuntimeError: If the transport is closed, or when called from
+                the loop thread itself (which would deadlock).
+        """
+        return self.submit(coro).result()
+
+    def submit(
+        self, coro: Coroutine[Any, Any, T], *, context: Context | None = None
+    ) -> Future[T]:
+        """Schedule a coroutine on the loop thread without waiting.
+
+        Args:
+            coro: Coroutine to run.
+            context: Context the coroutine runs in, e.g. a copy of the
+                caller's so its token and tenant scopes apply. Defaults to
+                a copy of the loop thread's context.
+
+        Returns:
+            A future resolving to the coroutine's result. Cancelling it
+            cancels the coroutine.
+
+        Raises:
+            RuntimeError: If the transport is closed, or when called from
+                the loop thread itself.
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("BridgeTransport is closed.")
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("BridgeTransport cannot block its own loop thread.")
+        return asyncio.run_coroutine_threadsafe(_run_in(coro, context), self._loop)
+
+    def close(self) -> None:
+        """Close the wrapped transport and stop the loop thread."""
+        if self._closed:
+            return
+        try:
+            self.run(self.transport.close())
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+async def _run_in(coro: Coroutine[Any, Any, T], context: Context | None) -> T:
+    """Await a coroutine as a task running in ``context``."""
+    if context is None:
+        return await coro
+    return await asyncio.get_running_loop().create_task(coro, context=context)
+
+
+__all__ = ["BridgeTransport"]
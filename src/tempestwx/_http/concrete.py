@@ -5,7 +5,7 @@ that wrap httpx clients. Both transports:
 
 - Convert Request dataclasses to httpx request parameters
 - Execute HTTP requests via httpx.Client or httpx.AsyncClient
-- Parse JSON responses automatically
+- Parse JSON responses on first access of their content
 - Wrap results in Response dataclasses
 
 Note:
@@ -26,7 +26,20 @@ from typing import Any, cast
 from httpx import AsyncClient, Client
 from httpx import Response as HTTPXResponse
 
-from .base import Request, Response, Transport
+from .base import LazyResponse, Request, Response, Transport
+
+
+def is_csv(response: HTTPXResponse) -> bool:
+    """Return whether the httpx response has a CSV body.
+
+    Args:
+        response: The httpx Response object.
+
+    Returns:
+        True for ``text/csv`` content, which is not parsed as JSON.
+    """
+    content_type: str = response.headers.get("content-type", "")
+    return content_type.startswith("text/csv")
 
 
 def try_parse_json(response: HTTPXResponse) -> dict[str, Any] | None:
@@ -39,6 +52,8 @@ def try_parse_json(response: HTTPXResponse) -> dict[str, Any] | None:
         Parsed JSON as a dictionary, or None if response is not JSON or
         parsing fails.
     """
+    if is_csv(response):
+        return None
     try:
         return cast(dict[str, Any], response.json())
     except ValueError:
@@ -71,7 +86,7 @@ class SyncTransport(Transport):
             request: The request to send.
 
         Returns:
-            Response with parsed JSON content.
+            Response with the raw body, parsing JSON content on first access.
         """
         response = self.client.request(
             method=request.method,
@@ -82,11 +97,12 @@ class SyncTransport(Transport):
             json=request.json,
             content=request.content,
         )
-        return Response(
+        return LazyResponse(
             url=str(response.url),
             headers=dict(response.headers),
             status_code=response.status_code,
-            content=try_parse_json(response),
+            raw=response.content,
+            is_json=not is_csv(response),
         )
 
     @property
@@ -125,7 +141,7 @@ class AsyncTransport(Transport):
             request: The request to send.
 
         Returns:
-            Response with parsed JSON content.
+            Response with the raw body, parsing JSON content on first access.
         """
         response = await self.client.request(
             method=request.method,
@@ -136,11 +152,12 @@ class AsyncTransport(Transport):
             json=request.json,
             content=request.content,
         )
-        return Response(
+        return LazyResponse(
             url=str(response.url),
             headers=dict(response.headers),
             status_code=response.status_code,
-            content=try_parse_json(response),
+            raw=response.content,
+            is_json=not is_csv(response),
         )
 
     @property
@@ -0,0 +1,349 @@
+"""Priority-aware request scheduler.
+
+This module provides ``RequestScheduler``, which shares one concurrency and
+rate budget between classes of traffic sent over the same token and
+transport:
+
+- ``Priority.REALTIME`` - latency-sensitive polls. Always dispatched first,
+  and ``reserved`` concurrency slots are kept free for them, so they never
+  wait behind bulk requests already in flight.
+- ``Priority.INTERACTIVE`` and ``Priority.BULK`` - share the remaining slots
+  by weighted fair queuing: while both have requests queued, each receives
+  dispatches in proportion to its weight.
+
+An optional token bucket caps the request rate across all classes. The
+scheduler keeps per-class queue-depth and wait-time metrics.
+
+A scheduler is attached to a client with ``Tempest(scheduler=...)`` and
+serves both synchronous (threads) and asynchronous (tasks) callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """Request priority classes, most urgent first."""
+
+    REALTIME = 0
+    INTERACTIVE = 1
+    BULK = 2
+
+
+DEFAULT_WEIGHTS: Mapping[Priority, float] = {
+    Priority.INTERACTIVE: 4.0,
+    Priority.BULK: 1.0,
+}
+
+
+@dataclass(frozen=True)
+class PriorityStats:
+    """Snapshot of one priority class.
+
+    Attributes:
+        priority: The priority class.
+        queued: Requests currently waiting.
+        max_queued: Highest number of requests waiting at once.
+        in_flight: Requests currently holding a slot.
+        dispatched: Requests granted a slot so far.
+        mean_wait: Mean seconds between queueing and dispatch.
+        max_wait: Longest wait in seconds.
+    """
+
+    priority: Priority
+    queued: int
+    max_queued: int
+    in_flight: int
+    dispatched: int
+    mean_wait: float
+    max_wait: float
+
+
+class _Waiter:
+    """A queued request waiting for a slot."""
+
+    __slots__ = ("enqueued", "event", "future", "granted", "loop", "priority")
+
+    def __init__(
+        self,
+        priority: Priority,
+        enqueued: float,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self.priority = priority
+        self.enqueued = enqueued
+        self.granted = False
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future: asyncio.Future[None] | None = (
+            None if loop is None else loop.create_future()
+        )
+
+    def grant(self) -> None:
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if self.future is not None and not self.future.done():
+            self.future.set_result(None)
+
+
+class _ClassState:
+    """Queue and counters of one priority class."""
+
+    __slots__ = (
+        "dispatched",
+        "in_flight",
+        "max_queued",
+        "max_wait",
+        "queue",
+        "total_wait",
+        "vtime",
+        "weight",
+    )
+
+    def __init__(self, weight: float) -> None:
+        self.weight = weight
+        self.queue: deque[_Waiter] = deque()
+        self.vtime = 0.0
+        self.in_flight = 0
+        self.dispatched = 0
+        self.max_queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class RequestScheduler:
+    """Dispatch requests by priority over a shared concurrency and rate budget.
+
+    Args:
+        max_concurrency: Requests allowed in flight at once.
+        reserved: Slots only ``REALTIME`` requests may use. Must be less
+            than ``max_concurrency``.
+        rate: Requests per second across all classes, or None for no limit.
+        burst: Token bucket size for ``rate``. Defaults to ``max_concurrency``.
+        weights: Relative shares of ``INTERACTIVE`` and ``BULK``.
+        clock: Monotonic clock used for rate and wait-time accounting.
+
+    Example:
+        >>> scheduler = RequestScheduler(max_concurrency=8, reserved=2, rate=10)
+        >>> twx = Tempest(scheduler=scheduler)
+        >>> with twx.priority(Priority.BULK):
+        ...     history = twx.obs_station(12345, start_time=t0, end_time=t1)
+        >>> scheduler.stats()[Priority.REALTIME].max_wait
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        *,
+        reserved: int = 1,
+        rate: float | None = None,
+        burst: float | None = None,
+        weights: Mapping[Priority, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if not 0 <= reserved < max_concurrency:
+            raise ValueError("reserved must be >= 0 and less than max_concurrency.")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive or None.")
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        if any(w <= 0 for w in weights.values()):
+            raise ValueError("weights must be positive.")
+        self.max_concurrency = max_concurrency
+        self.reserved = reserved
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max_concurrency)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._classes = {p: _ClassState(weights.get(p, 1.0)) for p in Priority}
+        self._in_flight = 0
+        self._tokens = self.burst
+        self._refilled = clock()
+        self._timer: threading.Timer | None = None
+
+    def __repr__(self) -> str:
+        options = [
+            f"max_concurrency={self.max_concurrency!r}",
+            f"reserved={self.reserved!r}",
+            f"rate={self.rate!r}",
+        ]
+        return type(self).__name__ + "(" + ", ".join(options) + ")"
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Block the calling thread until a slot is granted.
+
+        Every successful call must be paired with :meth:`release`.
+        """
+        waiter = self._enqueue(priority, None)
+        if waiter.event is not None:
+            waiter.event.wait()
+
+    async def aacquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Wait in the current task until a slot is granted.
+
+        Every successful call must be paired with :meth:`release`. If the
+        task is cancelled while waiting, no slot is held.
+        """
+        waiter = self._enqueue(priority, asyncio.get_running_loop())
+        if waiter.granted or waiter.future is None:
+            return
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._release_locked(priority)
+                else:
+                    self._classes[priority].queue.remove(waiter)
+            raise
+
+    def release(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Return a slot acquired with the same priority."""
+        with self._lock:
+            self._release_locked(priority)
+
+    @contextmanager
+    def slot(self, priority: Priority = Priority.INTERACTIVE) -> Generator[None]:
+        """Hold a slot for the duration of the context (threads)."""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    @asynccontextmanager
+    async def aslot(
+        self, priority: Priority = Priority.INTERACTIVE
+    ) -> AsyncGenerator[None]:
+        """Hold a slot for the duration of the context (tasks)."""
+        await self.aacquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def stats(self) -> dict[Priority, PriorityStats]:
+        """Return per-class queue-depth and wait-time metrics."""
+        with self._lock:
+            return {
+                priority: PriorityStats(
+                    priority=priority,
+                    queued=len(state.queue),
+                    max_queued=state.max_queued,
+                    in_flight=state.in_flight,
+                    dispatched=state.dispatched,
+                    mean_wait=(
+                        state.total_wait / state.dispatched if state.dispatched else 0.0
+                    ),
+                    max_wait=state.max_wait,
+                )
+                for priority, state in self._classes.items()
+            }
+
+    def _enqueue(
+        self, priority: Priority, loop: asyncio.AbstractEventLoop | None
+    ) -> _Waiter:
+        priority = Priority(priority)
+        waiter = _Waiter(priority, self._clock(), loop)
+        with self._lock:
+            state = self._classes[priority]
+            if not state.queue and priority is not Priority.REALTIME:
+                # A class becoming active must not spend credit banked while idle
+                active = [
+                    s.vtime
+                    for p, s in self._classes.items()
+                    if s.queue and p is not Priority.REALTIME
+                ]
+                state.vtime = max(state.vtime, min(active, default=state.vtime))
+            state.queue.append(waiter)
+            state.max_queued = max(state.max_queued, len(state.queue))
+            self._dispatch()
+        return waiter
+
+    def _release_locked(self, priority: Priority) -> None:
+        self._in_flight -= 1
+        self._classes[priority].in_flight -= 1
+        self._dispatch()
+
+    def _pick(self) -> Priority | None:
+        """Return the class to dispatch next, or None if none may be."""
+        if self._in_flight >= self.max_concurrency:
+            return None
+        if self._classes[Priority.REALTIME].queue:
+            return Priority.REALTIME
+        if self._in_flight >= self.max_concurrency - self.reserved:
+            return None
+        best: Priority | None = None
+        for priority, state in self._classes.items():
+            if priority is Priority.REALTIME or not state.queue:
+                continue
+            if best is None or state.vtime < self._classes[best].vtime:
+                best = priority
+        return best
+
+    def _take_token(self) -> float:
+        """Take a rate token; return 0, or seconds until one is available."""
+        if self.rate is None:
+            return 0.0
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refilled) * self.rate
+        )
+        self._refilled = now
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        self._tokens -= 1
+        return 0.0
+
+    def _dispatch(self) -> None:
+        """Grant slots to queued requests while the budget allows (locked)."""
+        while (priority := self._pick()) is not None:
+            delay = self._take_token()
+            if delay > 0:
+                self._schedule_retry(delay)
+                return
+            state = self._classes[priority]
+            waiter = state.queue.popleft()
+            state.vtime += 1.0 / state.weight
+            state.in_flight += 1
+            state.dispatched += 1
+            wait = self._clock() - waiter.enqueued
+            state.total_wait += wait
+            state.max_wait = max(state.max_wait, wait)
+            self._in_flight += 1
+            waiter.grant()
+
+    def _schedule_retry(self, delay: float) -> None:
+        if self._timer is not None:
+            return
+        timer = threading.Timer(delay, self._on_timer)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._dispatch()
+
+
+__all__ = ["DEFAULT_WEIGHTS", "Priority", "PriorityStats", "RequestScheduler"]
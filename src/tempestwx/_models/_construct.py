@@ -0,0 +1,167 @@
+"""Trusted construction of models from known-good data.
+
+``construct(cls, data)`` builds a model the way ``model_construct`` does,
+assigning values directly without validation, but also recurses into nested
+models and lists of models and converts enum strings to their members. It
+is meant for payloads that were validated before, such as responses served
+from a verified cache or a replay store.
+
+The work per class (input key, default and value converter of each field)
+is computed once into a plan and reused for every instance.
+
+Warning:
+    No validation runs: field validators are skipped, unknown attributes are
+    neither reported nor kept, and values of the wrong type are stored as
+    they are. Use only on data that is known to validate.
+"""
+
+from __future__ import annotations
+
+import types
+from collections.abc import Callable, Mapping
+from enum import Enum
+from functools import cache
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from ._serializer import StrEnum
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+Converter = Callable[[Any], Any]
+
+_IMMUTABLE = (type(None), bool, int, float, str, bytes, tuple, frozenset, Enum)
+
+
+class _Plan:
+    """Construction plan of one model class."""
+
+    __slots__ = ("by_key", "defaults", "factories")
+
+    def __init__(
+        self,
+        defaults: dict[str, Any],
+        by_key: dict[str, tuple[str, Converter | None, bool]],
+        factories: tuple[tuple[str, Callable[[], Any]], ...],
+    ) -> None:
+        # Immutable defaults, in field order
+        self.defaults = defaults
+        # Input key -> (field name, converter, key is the field name of an
+        # aliased field)
+        self.by_key = by_key
+        # Fields whose default must be created per instance
+        self.factories = factories
+
+
+def construct(cls: type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    """Build a model from trusted data without validation.
+
+    Args:
+        cls: Model class to build.
+        data: Field values keyed by alias or field name, as in the API.
+
+    Returns:
+        A model instance, with nested models constructed the same way.
+    """
+    plan = _plan(cls)
+    by_key = plan.by_key
+    values = plan.defaults.copy()
+    fields_set: set[str] = set()
+    for key, value in data.items():
+        target = by_key.get(key)
+        if target is None:
+            continue
+        name, convert, by_name = target
+        if by_name and name in fields_set:
+            continue  # The alias takes precedence
+        fields_set.add(name)
+        values[name] = value if convert is None or value is None else convert(value)
+    for name, factory in plan.factories:
+        if name not in fields_set:
+            values[name] = factory()
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+@cache
+def _plan(cls: type[BaseModel]) -> _Plan:
+    """Return the construction plan of a model class, computed once."""
+    defaults: dict[str, Any] = {}
+    by_key: dict[str, tuple[str, Converter | None, bool]] = {}
+    factories = []
+    for name, info in cls.__pydantic_fields__.items():
+        convert = _converter(info.annotation)
+        alias = info.validation_alias or info.alias
+        if isinstance(alias, str) and alias != name:
+            by_key[alias] = (name, convert, False)
+            by_key.setdefault(name, (name, convert, True))
+        else:
+            by_key[name] = (name, convert, False)
+        default = info.default
+        if info.default_factory is not None or not isinstance(default, _IMMUTABLE):
+            # Fresh (copied) default per instance, as pydantic does
+            defaults[name] = None
+            factories.append((name, _default_factory(name, info.get_default)))
+        else:
+            defaults[name] = default
+    return _Plan(defaults, by_key, tuple(factories))
+
+
+def _default_factory(name: str, get_default: Callable[..., Any]) -> Callable[[], Any]:
+    """Return a callable producing a fresh default for a field."""
+
+    def factory() -> Any:
+        value = get_default(call_default_factory=True)
+        if value is PydanticUndefined:
+            raise ValueError(f"Missing required field: {name!r}")
+        return value
+
+    return factory
+
+
+def _converter(annotation: Any) -> Converter | None:
+    """Return a converter for values of a field type, or None if none is needed."""
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        return _converter(args[0]) if len(args) == 1 else None
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        return _list_converter(_converter(item))
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, BaseModel):
+        model = annotation
+        return lambda value: (
+            value if isinstance(value, model) else construct(model, value)
+        )
+    if issubclass(annotation, Enum):
+        return _enum_converter(annotation)
+    return None
+
+
+def _list_converter(convert: Converter | None) -> Converter | None:
+    """Return a converter applying ``convert`` to list items, if needed."""
+    if convert is None:
+        return None
+    return lambda values: [v if v is None else convert(v) for v in values]
+
+
+def _enum_converter(enum: type[Enum]) -> Converter:
+    """Return a converter looking enum members up by value first."""
+    members = dict(enum._value2member_map_)
+    fallback = enum._validate if issubclass(enum, StrEnum) else enum
+
+    def convert(value: Any) -> Any:
+        member = members.get(value)
+        return member if member is not None else fallback(value)
+
+    return convert
+
+
+__all__ = ["construct"]
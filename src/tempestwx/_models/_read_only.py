@@ -0,0 +1,149 @@
+"""Read-only, slot-backed variants of response models.
+
+``read_only(cls)`` returns a frozen dataclass with ``__slots__`` mirroring
+the fields of a model, with nested models replaced by their own read-only
+variants. It is validated by pydantic-core with the model's field types,
+aliases, strictness and field validators, but skips what full models carry
+per instance (``__dict__``, fields-set tracking, assignment validation), so
+it is cheaper to build and much smaller. Use it for response data held in
+large numbers.
+
+Instances cannot be modified, compare by value, pickle by model and field
+values, and convert back with ``to_model()``.
+
+Note:
+    Unknown attributes are ignored without a warning, and
+    ``Model.warn_unknown_attributes`` has no effect on the variants: reporting
+    them would need a before-validator, which makes pydantic-core build a
+    Python dict of every JSON object and roughly halves decoding speed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import types
+from collections.abc import Mapping
+from functools import cache
+from typing import Annotated, Any, ClassVar, Self, Union, cast, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from pydantic_core import PydanticUndefined, to_json
+
+# Model options that carry over to the dataclass validation
+_CONFIG_KEYS = ("strict", "populate_by_name", "str_strip_whitespace")
+
+
+class ReadOnlyModel:
+    """Base of the read-only model variants created by :func:`read_only`.
+
+    Attributes:
+        model: The full model class this variant mirrors.
+    """
+
+    __slots__ = ()
+
+    model: ClassVar[type[BaseModel]]
+    _adapter: ClassVar[TypeAdapter[Any]]
+
+    @classmethod
+    def validate_json(cls, body: bytes | str) -> Self:
+        """Validate a raw JSON body into an instance.
+
+        Args:
+            body: JSON document shaped like the model's API payload.
+
+        Returns:
+            The read-only instance.
+        """
+        return cast(Self, cls._adapter.validate_json(body))
+
+    @classmethod
+    def validate(cls, data: Mapping[str, Any]) -> Self:
+        """Validate a mapping into an instance.
+
+        Strict dataclass validation accepts JSON input only, so the mapping
+        is encoded first; prefer :meth:`validate_json` on raw bodies.
+
+        Args:
+            data: Field values keyed by alias or field name, as in the API.
+
+        Returns:
+            The read-only instance.
+        """
+        return cls.validate_json(to_json(data))
+
+    def to_model(self) -> BaseModel:
+        """Return the equivalent full (mutable, validated) model."""
+        return self.model.model_validate_json(self._adapter.dump_json(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Generated classes are not importable by name
+        values = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}  # type: ignore[arg-type]
+        return _rebuild, (self.model, values)
+
+
+def _rebuild(model: type[BaseModel], values: dict[str, Any]) -> ReadOnlyModel:
+    """Unpickle a read-only instance of ``model``."""
+    return read_only(model)(**values)
+
+
+@cache
+def read_only(cls: type[BaseModel]) -> type[ReadOnlyModel]:
+    """Return the read-only variant of a model class, created once.
+
+    Args:
+        cls: Model class to mirror.
+
+    Returns:
+        A frozen, slotted dataclass named ``ReadOnly<Model>`` deriving from
+        :class:`ReadOnlyModel`, with keyword-only fields.
+    """
+    fields = []
+    for name, info in cls.__pydantic_fields__.items():
+        annotation = _annotation(info.annotation)
+        alias = info.validation_alias or info.alias
+        if isinstance(alias, str) and alias != name:
+            annotation = Annotated[annotation, Field(alias=alias)]
+        if info.default_factory is not None:
+            default = dataclasses.field(default_factory=info.default_factory)  # type: ignore[arg-type]
+        elif info.default is PydanticUndefined:
+            default = dataclasses.field()
+        else:
+            default = dataclasses.field(default=info.default)
+        fields.append((name, annotation, default))
+    namespace: dict[str, Any] = {"model": cls}
+    for name, decorator in cls.__pydantic_decorators__.field_validators.items():
+        validate = field_validator(*decorator.info.fields, mode=decorator.info.mode)
+        # Stored bound to the model class; rebind to the variant
+        func = getattr(decorator.func, "__func__", decorator.func)
+        namespace[name] = validate(classmethod(func))
+    variant: type[ReadOnlyModel] = dataclasses.make_dataclass(
+        f"ReadOnly{cls.__name__}",
+        fields,
+        bases=(ReadOnlyModel,),
+        namespace=namespace,
+        frozen=True,
+        slots=True,
+        kw_only=True,
+    )
+    variant.__module__ = cls.__module__
+    config = {k: v for k, v in cls.model_config.items() if k in _CONFIG_KEYS}
+    variant.__pydantic_config__ = ConfigDict(**config)  # type: ignore[attr-defined,typeddict-item]
+    variant._adapter = TypeAdapter(variant)
+    return variant
+
+
+def _annotation(annotation: Any) -> Any:
+    """Return a field type with nested models replaced by read-only variants."""
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        return Union[tuple(_annotation(a) for a in get_args(annotation))]  # noqa: UP007
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        return list[_annotation(item)]  # type: ignore[misc]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return read_only(annotation)
+    return annotation
+
+
+__all__ = ["ReadOnlyModel", "read_only"]
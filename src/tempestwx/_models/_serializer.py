@@ -11,20 +11,26 @@ undocumented fields that may appear in future API versions.
 """
 
 from enum import Enum, EnumMeta
+from typing import Any, ClassVar
 from warnings import warn
 
-from pydantic import AliasChoices, AliasPath, BaseModel
-from pydantic_core import core_schema
+from pydantic import BaseModel, ConfigDict
+from pydantic_core import ValidationError, core_schema
 
 
 class StrEnumMeta(EnumMeta):
     """Metaclass for StrEnum that provides case-insensitive get.
 
-    This does not change values.
+    Each enum class gets lookup tables built once at class creation, so
+    parsing a value is a dictionary hit rather than a chain of failed
+    lookups. This does not change values or member names.
     """
 
+    _names_: dict[str, Any]
+    _lookup_: dict[str, Any]
+
     def __new__(mcs, cls, bases, classdict, **kwds):  # type: ignore[no-untyped-def]
-        """Override `__new__` to make all keys lowercase.
+        """Override `__new__` to build the case-folded lookup tables.
 
         Args:
             mcs: The metaclass.
@@ -34,13 +40,17 @@ class StrEnumMeta(EnumMeta):
             **kwds: Additional keyword arguments.
 
         Returns:
-            The enum class with lowercase member map keys.
+            The enum class with its name and value lookup tables.
         """
         enum_class = super().__new__(mcs, cls, bases, classdict, **kwds)
-        copied_member_map = dict(enum_class._member_map_)
-        enum_class._member_map_.clear()
-        for k, v in copied_member_map.items():
-            enum_class._member_map_[k.lower()] = v
+        members = enum_class._member_map_
+        names = {k.casefold(): v for k, v in members.items()}
+        # Later entries win: exact values, then folded values, then names
+        lookup = dict(names)
+        lookup.update({str(v.value).casefold(): v for v in members.values()})
+        lookup.update({v.value: v for v in members.values()})
+        enum_class._names_ = names
+        enum_class._lookup_ = lookup
         return enum_class
 
     def __getitem__(cls, name: str):  # type: ignore[no-untyped-def]
@@ -51,14 +61,22 @@ class StrEnumMeta(EnumMeta):
 
         Returns:
             The enum member.
+
+        Raises:
+            KeyError: If no member has that name.
         """
-        return super().__getitem__(name.lower())
+        member = cls._names_.get(name.casefold())
+        if member is None:
+            raise KeyError(name)
+        return member
 
 
 class StrEnum(str, Enum, metaclass=StrEnumMeta):  # noqa: UP042
     """Convert enumeration members to strings using their name.
 
-    Ignores case when getting items. This does not change values.
+    Ignores case when getting items and parsing values: a string matches
+    a member by exact value, then by value or name ignoring case. This does
+    not change values.
 
     Works with Pydantic strict mode by providing custom validation.
     """
@@ -71,9 +89,12 @@ class StrEnum(str, Enum, metaclass=StrEnumMeta):  # noqa: UP042
             value: The value to look up.
 
         Returns:
-            The enum member matching the value (case-insensitive).
+            The enum member matching the value (case-insensitive), or None
+            so that ``Enum`` raises ValueError.
         """
-        return cls[value.lower()]
+        if isinstance(value, str):
+            return cls._lookup_.get(value.casefold())
+        return None
 
     def __str__(self) -> str:
         return self.name
@@ -110,81 +131,86 @@ class StrEnum(str, Enum, metaclass=StrEnumMeta):  # noqa: UP042
 
         Returns:
             The validated enum instance.
+
+        Raises:
+            ValueError: If a string matches no member.
         """
         if isinstance(v, cls):
             return v
         if isinstance(v, str):
-            try:
-                return cls(v)
-            except ValueError:
-                # Try case-insensitive match using _missing_
-                return cls._missing_(v)  # type: ignore[no-untyped-call]
+            lookup = cls._lookup_
+            member = lookup.get(v)
+            if member is None:
+                member = lookup.get(v.casefold())
+            if member is None:
+                raise ValueError(f"{v!r} is not a valid {cls.__name__}")
+            return member
         return v
 
 
 class Model(BaseModel):
-    """Response model base."""
+    """Response model base.
+
+    Attributes:
+        warn_unknown_attributes: Whether validation warns about input keys
+            that match no field or alias; unknown keys are discarded either
+            way. Set ``Model.warn_unknown_attributes = False`` to skip the
+            warnings for all models, e.g. in production. Read-only variants
+            (``read_only(cls)``) never warn.
+    """
 
-    def __init__(self, **data) -> None:  # type: ignore[no-untyped-def]
-        """Initialize model and warn about unknown attributes.
+    warn_unknown_attributes: ClassVar[bool] = True
+
+    # Unknown attributes are collected into ``__pydantic_extra__`` during
+    # validation, so they are found in the same pass for keyword arguments
+    # and for ``model_validate_json`` alike. ``model_post_init`` reports them
+    # and drops the extras dict, and ``__setattr__`` rejects names that are
+    # not fields, which keeps the semantics of ``extra="ignore"``.
+    model_config = ConfigDict(extra="allow")
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Warn about and discard unknown attributes.
 
         Args:
-            **data: Field values for the model.
+            _context: Validation context (unused).
 
         Warns:
             UnknownModelAttributeWarning: When response contains undocumented fields.
         """
-        super().__init__(**data)
-
-        # Build a set of known keys that includes both field names and any
-        # accepted aliases used during validation (e.g., Field(alias="type")).
-        known_keys = set(self.__dict__.keys())
-
-        # Use class-level __pydantic_fields__ to avoid deprecation of
-        # model_fields
-        fields = type(self).__pydantic_fields__  # dict[str, FieldInfo]
-        for field_info in fields.values():
-            # Primary alias
-            alias = getattr(field_info, "alias", None)
-            if isinstance(alias, str):
-                known_keys.add(alias)
-
-            # validation_alias may be a string, AliasChoices, or AliasPath
-            v_alias = getattr(field_info, "validation_alias", None)
-            if v_alias is None:
-                pass
-            elif isinstance(v_alias, str):
-                known_keys.add(v_alias)
-            # Handle AliasChoices
-            elif isinstance(v_alias, AliasChoices):
-                for c in v_alias.choices:
-                    if isinstance(c, str):
-                        known_keys.add(c)
-                    elif (
-                        isinstance(c, AliasPath)
-                        and c.path
-                        and isinstance(c.path, (list, tuple))
-                        and isinstance(c.path[0], str)
-                    ):
-                        known_keys.add(c.path[0])
-            # Handle AliasPath (take top-level key if present)
-            elif (
-                isinstance(v_alias, AliasPath)
-                and v_alias.path
-                and isinstance(v_alias.path, (list, tuple))
-                and isinstance(v_alias.path[0], str)
-            ):
-                known_keys.add(v_alias.path[0])
-
-        unknowns = set(data.keys()) - known_keys
-        cls_name = self.__class__.__name__
-        for arg in unknowns:
-            msg = (
-                f"{cls_name} contains unknown attribute: `{arg}`, "
-                "which was discarded. This warning may be safely ignored. "
-                "Please consider upgrading."
-            )
-            warn(msg, UnknownModelAttributeWarning, stacklevel=5)
+        extra = self.__pydantic_extra__
+        object.__setattr__(self, "__pydantic_extra__", None)
+        if not extra:
+            return
+        if self.warn_unknown_attributes:
+            cls_name = self.__class__.__name__
+            for arg in extra:
+                msg = (
+                    f"{cls_name} contains unknown attribute: `{arg}`, "
+                    "which was discarded. This warning may be safely ignored. "
+                    "Please consider upgrading."
+                )
+                warn(msg, UnknownModelAttributeWarning, stacklevel=3)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field, rejecting unknown names as ``extra="ignore"`` does.
+
+        Raises:
+            ValidationError: If ``name`` is not a field of the model.
+        """
+        cls = type(self)
+        if (
+            name not in cls.__pydantic_fields__
+            and name not in cls.__class_vars__
+            and not name.startswith("_")
+        ):
+            error = {
+                "type": "no_such_attribute",
+                "loc": (name,),
+                "input": value,
+                "ctx": {"attribute": name},
+            }
+            raise ValidationError.from_exception_data(cls.__name__, [error])  # type: ignore[list-item]
+        super().__setattr__(name, value)
 
 
 class UnknownModelAttributeWarning(RuntimeWarning):
@@ -8,6 +8,7 @@ from ._serializer import Model
 from .better_forecast_current_conditions import BetterForecastCurrentConditions
 from .better_forecast_forecast import BetterForecastForecast
 from .better_forecast_units import BetterForecastUnits
+from .forecast_frame import PERIODS, ForecastFrame
 from .status import Status
 
 
@@ -29,11 +30,34 @@ class BetterForecast(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
         strict=True,
     )
 
+    def to_columns(self, period: str = "hourly") -> ForecastFrame:
+        """Return the hourly or daily entries as typed columns.
+
+        Requires NumPy (``pip install tempestwx[numpy]``). To skip building
+        the models, use ``ForecastFrame.from_forecast`` on the raw response.
+
+        Args:
+            period: ``"hourly"`` or ``"daily"``.
+
+        Returns:
+            One array and validity mask per entry field, with enum fields as
+            integer codes; see
+            :class:`~tempestwx._models.forecast_frame.ForecastFrame`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``period`` is unknown.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"period must be one of {', '.join(PERIODS)}.")
+        model, key = PERIODS[period]
+        entries = getattr(self.forecast, period, None) or []
+        return ForecastFrame.from_entries(model, [vars(e) for e in entries], key)
+
 
 __all__ = [
     "BetterForecast",
@@ -49,7 +49,6 @@ class BetterForecastCurrentConditions(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
         strict=True,
     )
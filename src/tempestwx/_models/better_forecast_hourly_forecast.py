@@ -37,7 +37,6 @@ class BetterForecastHourlyForecast(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
         strict=True,
     )
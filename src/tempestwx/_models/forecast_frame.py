@@ -0,0 +1,229 @@
+"""Columnar view of forecast entries.
+
+``ForecastFrame`` is an ``ObservationFrame`` of the ``hourly`` or ``daily``
+entries of a forecast: one typed NumPy array per field of
+``BetterForecastHourlyForecast`` or ``BetterForecastDailyForecast``. Enum
+fields (``conditions``, ``icon``, ``precip_icon``, ``precip_type``) are
+stored as small integer codes into a lookup table shared by all frames,
+the members of the enum in definition order.
+
+``ForecastFrame.from_forecast`` decodes raw response data (e.g. from
+``raw()``) without building a model per entry; ``BetterForecast.to_columns``
+converts a decoded forecast.
+
+NumPy is an optional dependency (``pip install tempestwx[numpy]``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from functools import cache
+from typing import TYPE_CHECKING, Any, get_args
+
+from ._serializer import Model, StrEnum
+from .better_forecast_daily_forecast import BetterForecastDailyForecast
+from .better_forecast_hourly_forecast import BetterForecastHourlyForecast
+from .observation_frame import ObservationFrame, _column, _numpy, _sort_rows
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Entry model and key field of each forecast period
+PERIODS: dict[str, tuple[type[Model], str]] = {
+    "hourly": (BetterForecastHourlyForecast, "time"),
+    "daily": (BetterForecastDailyForecast, "day_start_local"),
+}
+# Largest lookup table coded in int8
+_INT8_CODES = 127
+
+
+@cache
+def lookup_table(enum: type[StrEnum]) -> tuple[StrEnum, ...]:
+    """Return the shared lookup table of an enum: code ``i`` is entry ``i``."""
+    return tuple(enum)
+
+
+def _member(enum: type[StrEnum], value: object) -> StrEnum:
+    """Parse an enum value as model validation does."""
+    member = enum._validate(value)  # type: ignore[no-untyped-call]
+    if not isinstance(member, enum):
+        raise ValueError(f"{value!r} is not a valid {enum.__name__}")
+    return member
+
+
+@cache
+def _enum_fields(model: type[Model]) -> dict[str, type[StrEnum]]:
+    """Return the enum type of each enum field of an entry model."""
+    enums = {}
+    for name, info in model.__pydantic_fields__.items():
+        for arg in get_args(info.annotation):
+            if isinstance(arg, type) and issubclass(arg, StrEnum):
+                enums[name] = arg
+    return enums
+
+
+class ForecastFrame(ObservationFrame):
+    """Typed columns of forecast entries, with enums as integer codes.
+
+    Build with :meth:`from_forecast` or ``BetterForecast.to_columns()``.
+    Columns of enum fields hold codes into :meth:`lookup` (``int8`` or
+    ``int16``; nulls hold 0 and are False in the field's mask). Entries
+    are not otherwise validated.
+
+    Args:
+        columns: Column array per field name, in field order.
+        masks: Validity mask per field name (True where not null).
+        key: Field the entries are ordered by.
+        enums: Enum type per enum-coded field.
+    """
+
+    __slots__ = ("_enums",)
+
+    def __init__(
+        self,
+        columns: dict[str, NDArray[Any]],
+        masks: dict[str, NDArray[np.bool_]],
+        key: str,
+        enums: dict[str, type[StrEnum]],
+    ) -> None:
+        super().__init__(columns, masks, key)
+        self._enums = enums
+
+    @classmethod
+    def from_entries(
+        cls, model: type[Model], entries: Sequence[Mapping[str, Any]], key: str
+    ) -> ForecastFrame:
+        """Build a frame from raw forecast entries.
+
+        Args:
+            model: Entry model whose fields become columns.
+            entries: Entries as decoded from JSON. Entries out of ``key``
+                order are sorted by key.
+            key: Field the entries are ordered by.
+
+        Returns:
+            The columnar frame.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If an enum field holds an unknown value.
+        """
+        numpy = _numpy()
+        enums = _enum_fields(model)
+        columns: dict[str, NDArray[Any]] = {}
+        masks: dict[str, NDArray[np.bool_]] = {}
+        for name in model.__pydantic_fields__:
+            values = [entry.get(name) for entry in entries]
+            if name in enums:
+                columns[name], masks[name] = _codes(numpy, enums[name], values)
+            else:
+                columns[name], masks[name] = _column(numpy, values)
+        _sort_rows(numpy, columns, masks, key)
+        return cls(columns, masks, key, enums)
+
+    @classmethod
+    def from_forecast(
+        cls, data: Mapping[str, Any], period: str = "hourly"
+    ) -> ForecastFrame:
+        """Build a frame from a raw ``better_forecast`` response.
+
+        Args:
+            data: Response data, e.g. from ``raw()``.
+            period: ``"hourly"`` or ``"daily"``.
+
+        Returns:
+            The entries of ``forecast[period]`` as columns.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``period`` is unknown or an enum field holds an
+                unknown value.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"period must be one of {', '.join(PERIODS)}.")
+        model, key = PERIODS[period]
+        entries = (data.get("forecast") or {}).get(period) or []
+        return cls.from_entries(model, entries, key)
+
+    def lookup(self, name: str) -> tuple[StrEnum, ...]:
+        """Return the lookup table of an enum-coded field.
+
+        Raises:
+            KeyError: If the field is not enum-coded.
+        """
+        return lookup_table(self._enums[name])
+
+    def code(self, name: str, value: str) -> int:
+        """Return the code of an enum value in a field, for comparisons.
+
+        Args:
+            name: Enum-coded field name.
+            value: Enum member or value.
+
+        Returns:
+            Code of the member in the field's lookup table.
+
+        Raises:
+            KeyError: If the field is not enum-coded.
+            ValueError: If ``value`` is not a member of the field's enum.
+        """
+        enum = self._enums[name]
+        return lookup_table(enum).index(_member(enum, value))
+
+    def members(self, name: str) -> list[StrEnum | None]:
+        """Return the enum members of a field, with None for nulls."""
+        table = self.lookup(name)
+        return [
+            table[code] if ok else None
+            for code, ok in zip(
+                self[name].tolist(), self.mask(name).tolist(), strict=True
+            )
+        ]
+
+    def rows(self, start: int, stop: int) -> ForecastFrame:
+        """Return entries ``start`` to ``stop`` (exclusive) without copying."""
+        window = slice(start, stop)
+        return type(self)(
+            {name: c[window] for name, c in self._columns.items()},
+            {name: m[window] for name, m in self._masks.items()},
+            self._key,
+            self._enums,
+        )
+
+    def to_obs(self) -> list[list[Any]]:
+        """Return the entries as lists in field order, with enum members."""
+        obs = super().to_obs()
+        for i, name in enumerate(self.fields):
+            if name in self._enums:
+                table = self.lookup(name)
+                for row in obs:
+                    if row[i] is not None:
+                        row[i] = table[row[i]]
+        return obs
+
+
+def _codes(
+    numpy: Any, enum: type[StrEnum], values: Sequence[Any]
+) -> tuple[NDArray[Any], NDArray[np.bool_]]:
+    """Return the code array and validity mask of one enum column."""
+    table = lookup_table(enum)
+    # Each distinct value is parsed once
+    index: dict[Any, int] = {}
+    codes = []
+    for value in values:
+        if value is None:
+            codes.append(0)
+            continue
+        code = index.get(value)
+        if code is None:
+            code = index[value] = table.index(_member(enum, value))
+        codes.append(code)
+    dtype = numpy.int8 if len(table) <= _INT8_CODES else numpy.int16
+    mask = numpy.fromiter(
+        (v is not None for v in values), dtype=bool, count=len(values)
+    )
+    return numpy.array(codes, dtype=dtype), mask
+
+
+__all__ = ["ForecastFrame", "lookup_table"]
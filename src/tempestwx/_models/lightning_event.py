@@ -51,7 +51,6 @@ class LightningEvent(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
     )
 
@@ -102,7 +102,6 @@ class AirDailyObservation(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
     )
 
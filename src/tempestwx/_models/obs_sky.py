@@ -111,7 +111,6 @@ class SkyObservation(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
     )
 
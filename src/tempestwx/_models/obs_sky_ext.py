@@ -143,7 +143,6 @@ class SkyDailyObservation(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
     )
 
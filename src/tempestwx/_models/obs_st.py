@@ -1,12 +1,20 @@
 """Tempest Observation (obs_st) array model.
 
-Structured representation of the obs_st array returned by the API.
+Structured representation of the obs_st array returned by the API, and
+``ObsStColumns``, a struct-of-arrays form of many obs_st arrays decoded in
+one pass by ``TempestObservation.from_arrays``.
 """
 
 from __future__ import annotations
 
-from pydantic import ConfigDict
+from collections.abc import Iterable, Iterator, Sequence
+from functools import cache
+from itertools import zip_longest
+from typing import Any
 
+from pydantic import ConfigDict, TypeAdapter
+
+from ._construct import construct
 from ._serializer import Model
 
 # Type aliases for convenience
@@ -101,6 +109,34 @@ class TempestObservation(Model):
             precipitation_analysis_type=padded[21],
         )
 
+    @classmethod
+    def from_arrays(cls, arrays: Iterable[Sequence[Raw]]) -> ObsStColumns:
+        """Decode many raw obs_st arrays into columns in one pass.
+
+        Equivalent to calling :meth:`from_array` on every array, but values
+        are validated a column at a time (values that are already numbers
+        are kept as they are) and no model is built per row; rows are
+        created on demand by :class:`ObsStColumns`.
+
+        Args:
+            arrays: Raw arrays with up to 22 observation values each, e.g.
+                ``DeviceObservation.obs`` of an ``obs_st`` device.
+
+        Returns:
+            One column per obs_st field.
+
+        Raises:
+            pydantic.ValidationError: If a value is not valid for its field.
+        """
+        rows = list(arrays)
+        cells = list(zip_longest(*rows))[: len(OBS_ST_FIELDS)]
+        padding = (None,) * len(rows)
+        columns = {
+            name: _obs_st_column(name, cells[i] if i < len(cells) else padding)
+            for i, name in enumerate(OBS_ST_FIELDS)
+        }
+        return ObsStColumns(columns, len(rows))
+
     def to_array(self) -> list[int | float | None]:
         """Convert the entry back to the obs_st array ordering.
 
@@ -135,9 +171,95 @@ class TempestObservation(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
     )
 
 
-__all__ = ["TempestObservation"]
+# Field names in obs_st array order
+OBS_ST_FIELDS: tuple[str, ...] = tuple(TempestObservation.__pydantic_fields__)
+_INT_FIELDS = frozenset({"precipitation_type", "precipitation_analysis_type"})
+_NUMBERS = (int, float, type(None))
+_INTEGERS = (int, type(None))
+
+
+@cache
+def _adapter(name: str) -> TypeAdapter[Any]:
+    """Return a validator of single values of an obs_st field."""
+    annotation: Any = TempestObservation.__pydantic_fields__[name].annotation
+    return TypeAdapter(annotation)
+
+
+def _obs_st_column(name: str, cells: Sequence[Raw]) -> list[Numeric]:
+    """Validate one column of obs_st cells, as ``from_array`` would."""
+    allowed = _INTEGERS if name in _INT_FIELDS else _NUMBERS
+    # bool is a subclass of int but is converted by validation
+    if all(type(v) in allowed for v in cells):
+        return list(cells)  # type: ignore[arg-type]
+    validate = _adapter(name).validate_python
+    return [validate(v) for v in cells]
+
+
+class ObsStColumns:
+    """Struct-of-arrays obs_st observations: one list per field.
+
+    Built by :meth:`TempestObservation.from_arrays`. Columns are read by
+    field name; ``TempestObservation`` rows are only built when requested
+    with :meth:`row` or :meth:`rows`.
+
+    Args:
+        columns: Values per obs_st field, in array order.
+        length: Number of observations.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, columns: dict[str, list[Numeric]], length: int) -> None:
+        self._columns = columns
+        self._length = length
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names, in obs_st array order."""
+        return tuple(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __getitem__(self, name: str) -> list[Numeric]:
+        """Return the column of a field."""
+        return self._columns[name]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={self._length})"
+
+    def row(self, index: int) -> TempestObservation:
+        """Build the observation at ``index`` (negative indices allowed).
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+        """
+        if not -self._length <= index < self._length:
+            raise IndexError("observation index out of range")
+        # Values were validated per column already
+        data = {name: column[index] for name, column in self._columns.items()}
+        return construct(TempestObservation, data)
+
+    def rows(self) -> Iterator[TempestObservation]:
+        """Yield the observations in order, building each on demand."""
+        for values in zip(*self._columns.values(), strict=True):
+            yield construct(
+                TempestObservation, dict(zip(self._columns, values, strict=True))
+            )
+
+    def to_arrays(self) -> list[list[Numeric]]:
+        """Return the observations as obs_st arrays."""
+        return [list(values) for values in zip(*self._columns.values(), strict=True)]
+
+
+__all__ = ["OBS_ST_FIELDS", "ObsStColumns", "TempestObservation"]
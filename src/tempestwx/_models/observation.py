@@ -84,7 +84,6 @@ class Observation(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         strict=True,
     )
 
@@ -0,0 +1,250 @@
+"""Columnar view of station observations.
+
+``ObservationFrame`` holds the ``obs`` rows of a ``StationObservation`` as
+one typed NumPy array per field named in ``ob_fields``, with a boolean
+validity mask per field for nulls. Rows are kept in order of a key column
+(``timestamp`` by default; rows given out of order are sorted when the frame
+is built), so key ranges are sliced without copying and keys are found by
+binary search.
+
+NumPy is an optional dependency (``pip install tempestwx[numpy]``); it is
+imported when a frame is first built.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from itertools import zip_longest
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+TIMESTAMP = "timestamp"
+
+
+def _numpy() -> ModuleType:
+    """Import NumPy, explaining how to install it if it is missing."""
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError as exc:
+        raise ImportError(
+            "ObservationFrame requires NumPy. Install it with "
+            "`pip install tempestwx[numpy]`."
+        ) from exc
+    return numpy
+
+
+class ObservationFrame:
+    """Typed columns of observation rows, one per field.
+
+    Build with :meth:`from_obs` or ``StationObservation.to_frame()``. Integer
+    fields are ``int64``, other numeric fields ``float64`` and text fields
+    NumPy strings; null cells hold 0 (or ``""``) and are False in the
+    field's mask.
+
+    Args:
+        columns: Column array per field name, in field order.
+        masks: Validity mask per field name (True where not null).
+        key: Field the rows are ordered by, used by :meth:`index` and
+            :meth:`between`.
+    """
+
+    __slots__ = ("_columns", "_key", "_masks")
+
+    def __init__(
+        self,
+        columns: dict[str, NDArray[Any]],
+        masks: dict[str, NDArray[np.bool_]],
+        key: str = TIMESTAMP,
+    ) -> None:
+        self._columns = columns
+        self._masks = masks
+        self._key = key
+
+    @classmethod
+    def from_obs(
+        cls,
+        ob_fields: Sequence[str],
+        obs: Sequence[Sequence[Any]],
+        key: str = TIMESTAMP,
+    ) -> ObservationFrame:
+        """Build a frame from rows aligned to ``ob_fields``.
+
+        Args:
+            ob_fields: Field name of each row position.
+            obs: Observation rows. Short rows are padded with nulls; cells
+                beyond ``ob_fields`` are dropped. Rows out of ``key`` order
+                are sorted by key (stably, null keys first).
+            key: Field the rows are ordered by.
+
+        Returns:
+            The columnar frame.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If a field name is repeated.
+        """
+        numpy = _numpy()
+        if len(set(ob_fields)) != len(ob_fields):
+            raise ValueError("ob_fields must not repeat field names.")
+        cells = list(zip_longest(*obs)) if obs else []
+        columns: dict[str, NDArray[Any]] = {}
+        masks: dict[str, NDArray[np.bool_]] = {}
+        for i, name in enumerate(ob_fields):
+            values = cells[i] if i < len(cells) else (None,) * len(obs)
+            columns[name], masks[name] = _column(numpy, values)
+        _sort_rows(numpy, columns, masks, key)
+        return cls(columns, masks, key)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names, in ``ob_fields`` order."""
+        return tuple(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column and mask arrays."""
+        arrays = [*self._columns.values(), *self._masks.values()]
+        return sum(int(a.nbytes) for a in arrays)
+
+    @property
+    def key(self) -> str:
+        """Field the rows are ordered by."""
+        return self._key
+
+    @property
+    def timestamps(self) -> NDArray[Any]:
+        """The key column (``timestamp`` unless another key was given).
+
+        Raises:
+            KeyError: If the frame has no key field.
+        """
+        return self._columns[self._key]
+
+    def __len__(self) -> int:
+        return len(next(iter(self._masks.values()), ()))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __getitem__(self, name: str) -> NDArray[Any]:
+        """Return the column of a field (nulls hold 0 or ``""``)."""
+        return self._columns[name]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, fields={list(self.fields)})"
+
+    def mask(self, name: str) -> NDArray[np.bool_]:
+        """Return the validity mask of a field (True where not null)."""
+        return self._masks[name]
+
+    def valid(self, name: str) -> NDArray[Any]:
+        """Return the non-null values of a field (a copy)."""
+        return self._columns[name][self._masks[name]]
+
+    def index(self, timestamp: int | float | str) -> int:
+        """Return the row of an observation time, by binary search.
+
+        Args:
+            timestamp: Observation epoch time, or another key value.
+
+        Returns:
+            Row position of the observation.
+
+        Raises:
+            KeyError: If no row has that key value.
+        """
+        timestamps = self.timestamps
+        i = int(timestamps.searchsorted(timestamp))
+        if i == len(timestamps) or timestamps[i] != timestamp:
+            raise KeyError(timestamp)
+        return i
+
+    def between(
+        self,
+        start: int | float | str | None = None,
+        end: int | float | str | None = None,
+    ) -> ObservationFrame:
+        """Return the rows with ``start <= key < end`` without copying.
+
+        Args:
+            start: First key value (epoch time) included; None for the first
+                row.
+            end: First key value excluded; None for past the last row.
+
+        Returns:
+            A frame whose columns and masks are views of this frame's.
+        """
+        timestamps = self.timestamps
+        lo = 0 if start is None else int(timestamps.searchsorted(start))
+        hi = len(timestamps) if end is None else int(timestamps.searchsorted(end))
+        return self.rows(lo, max(lo, hi))
+
+    def rows(self, start: int, stop: int) -> ObservationFrame:
+        """Return rows ``start`` to ``stop`` (exclusive) without copying."""
+        window = slice(start, stop)
+        return type(self)(
+            {name: c[window] for name, c in self._columns.items()},
+            {name: m[window] for name, m in self._masks.items()},
+            self._key,
+        )
+
+    def to_obs(self) -> list[list[Any]]:
+        """Return the rows as nested lists, with None for nulls."""
+        columns = [
+            [v if ok else None for v, ok in zip(c.tolist(), m.tolist(), strict=True)]
+            for c, m in zip(self._columns.values(), self._masks.values(), strict=True)
+        ]
+        return [list(row) for row in zip(*columns, strict=True)]
+
+
+def _column(
+    numpy: Any, values: Sequence[Any]
+) -> tuple[NDArray[Any], NDArray[np.bool_]]:
+    """Return the typed array and validity mask of one column of cells."""
+    mask = numpy.fromiter(
+        (v is not None for v in values), dtype=bool, count=len(values)
+    )
+    kinds = {type(v) for v in values if v is not None}
+    if not kinds <= {int, float, bool}:
+        text = ["" if v is None else str(v) for v in values]
+        return numpy.array(text, dtype=str), mask
+    if float in kinds:
+        # None becomes NaN; store 0 instead so masked cells are uniform
+        column = numpy.array(values, dtype=numpy.float64)
+        column[~mask] = 0.0
+        return column, mask
+    column = numpy.array([0 if v is None else v for v in values], dtype=numpy.int64)
+    return column, mask
+
+
+def _sort_rows(
+    numpy: Any,
+    columns: dict[str, NDArray[Any]],
+    masks: dict[str, NDArray[np.bool_]],
+    key: str,
+) -> None:
+    """Reorder the rows of ``columns`` and ``masks`` by the key column.
+
+    Null keys sort first. Columns already in key order are left as they are.
+    """
+    keys = columns.get(key)
+    if keys is None:
+        return
+    valid = masks[key]
+    present = keys[valid]
+    if not (valid[1:] < valid[:-1]).any() and not (present[1:] < present[:-1]).any():
+        return
+    order = numpy.lexsort((keys, valid))
+    for name, column in columns.items():
+        columns[name] = column[order]
+        masks[name] = masks[name][order]
+
+
+__all__ = ["ObservationFrame"]
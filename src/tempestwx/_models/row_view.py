@@ -0,0 +1,162 @@
+"""Lazy views of rows of raw observation arrays.
+
+``row_view(cls)`` returns a class of small ``__slots__`` objects that hold
+only the shared list of raw arrays (e.g. ``DeviceObservation.obs`` or
+``StatsSet.stats_day``) and a row index. Each field of the array model
+``cls`` (``TempestObservation``, ``SkyObservation``, ``StatsDay``...) is a
+property reading its documented array position, so a view offers the same
+attribute names as the model without copying or validating the row. Models
+whose rows may start with a label (the day of a ``stats_day`` row) define
+``array_start(row)``, and their views count positions from there.
+
+``row_views(cls, rows)`` iterates over all rows as views.
+
+Note:
+    Values are returned as they appear in the array: nothing is validated or
+    coerced, and positions past the end of a short row read as None. Use
+    ``to_model()`` for a validated model.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from functools import cache
+from typing import Any, ClassVar
+
+from ._serializer import Model
+
+Raw = str | int | float | None
+
+
+class RowView:
+    """Base of the row view classes created by :func:`row_view`.
+
+    Args:
+        rows: Shared raw arrays, in API order.
+        index: Position of the viewed row in ``rows``.
+
+    Attributes:
+        model: The array model class whose fields this view exposes.
+        fields: Field names, in array order.
+    """
+
+    __slots__ = ("_index", "_rows")
+
+    model: ClassVar[type[Model]]
+    fields: ClassVar[tuple[str, ...]]
+
+    @staticmethod
+    def _start(row: Sequence[Raw]) -> int:  # noqa: ARG004 - overridden per model
+        """Return the position of the first field in a row."""
+        return 0
+
+    def __init__(self, rows: Sequence[Sequence[Raw]], index: int) -> None:
+        self._rows = rows
+        self._index = index
+
+    @property
+    def index(self) -> int:
+        """Position of the viewed row."""
+        return self._index
+
+    def to_array(self) -> list[Raw]:
+        """Return a copy of the row, padded with None to every field."""
+        row = self._rows[self._index]
+        start = self._start(row)
+        values = list(row[start : start + len(self.fields)])
+        return values + [None] * (len(self.fields) - len(values))
+
+    def to_model(self) -> Model:
+        """Return the row validated into the model (``model.from_array``)."""
+        from_array: Callable[[list[Raw]], Model] = self.model.from_array  # type: ignore[attr-defined]
+        return from_array(self.to_array())
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_array() == other.to_array()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={value!r}"
+            for name, value in zip(self.fields, self.to_array(), strict=True)
+        )
+        return f"{type(self).__name__}({values})"
+
+
+def _field(position: int) -> property:
+    """Return a property reading one array position of the viewed row."""
+
+    def get(self: RowView) -> Any:
+        row = self._rows[self._index]
+        return row[position] if position < len(row) else None
+
+    return property(get)
+
+
+def _offset_field(position: int, start: Callable[[Sequence[Raw]], int]) -> property:
+    """Return a property reading one field of a row that may lead with a label."""
+
+    def get(self: RowView) -> Any:
+        row = self._rows[self._index]
+        i = start(row) + position
+        return row[i] if i < len(row) else None
+
+    return property(get)
+
+
+@cache
+def row_view(cls: type[Model]) -> type[RowView]:
+    """Return the row view class of an array model, created once.
+
+    Args:
+        cls: Model with a ``from_array`` constructor whose fields are
+            declared in array order.
+
+    Returns:
+        A ``RowView`` subclass named ``<Model>View`` with one read-only
+        property per field.
+
+    Raises:
+        ValueError: If ``cls`` has no ``from_array`` constructor.
+    """
+    if not callable(getattr(cls, "from_array", None)):
+        raise ValueError(f"{cls.__name__} is not an array model.")
+    fields = tuple(cls.__pydantic_fields__)
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__doc__": f"Lazy view of a raw {cls.__name__} array.",
+        "model": cls,
+        "fields": fields,
+    }
+    # Index map: the documented array position of each field
+    start = getattr(cls, "array_start", None)
+    if start is None:
+        namespace.update({name: _field(i) for i, name in enumerate(fields)})
+    else:
+        namespace["_start"] = staticmethod(start)
+        namespace.update(
+            {name: _offset_field(i, start) for i, name in enumerate(fields)}
+        )
+    return type(f"{cls.__name__}View", (RowView,), namespace)
+
+
+def row_views(cls: type[Model], rows: Sequence[Sequence[Raw]]) -> Iterator[RowView]:
+    """Yield a view of every row of ``rows`` as the array model ``cls``.
+
+    Args:
+        cls: Array model, e.g. ``TempestObservation``.
+        rows: Raw arrays, e.g. ``DeviceObservation.obs``.
+
+    Yields:
+        One view per row, in order.
+    """
+    view = row_view(cls)
+    for i in range(len(rows)):
+        yield view(rows, i)
+
+
+__all__ = ["RowView", "row_view", "row_views"]
@@ -15,7 +15,6 @@ class StationMeta(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         strict=True,
     )
 
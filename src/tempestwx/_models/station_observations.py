@@ -5,6 +5,7 @@ from __future__ import annotations
 from pydantic import ConfigDict, Field
 
 from ._serializer import Model
+from .observation_frame import ObservationFrame
 from .station_units import StationUnits
 from .status import Status
 
@@ -24,10 +25,27 @@ class StationObservation(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
         strict=True,
     )
 
+    def to_frame(self) -> ObservationFrame:
+        """Return ``obs`` as typed columns keyed by ``ob_fields``.
+
+        Requires NumPy (``pip install tempestwx[numpy]``).
+
+        Returns:
+            One array and validity mask per field; see
+            :class:`~tempestwx._models.observation_frame.ObservationFrame`.
+
+        Raises:
+            ValueError: If ``obs`` is present without ``ob_fields``.
+        """
+        if self.ob_fields is None:
+            if self.obs:
+                raise ValueError("obs cannot be read without ob_fields.")
+            return ObservationFrame.from_obs((), [])
+        return ObservationFrame.from_obs(self.ob_fields, self.obs or [])
+
 
 __all__ = ["StationObservation"]
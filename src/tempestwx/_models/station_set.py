@@ -16,7 +16,6 @@ class StationSet(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         strict=True,
     )
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from pydantic import ConfigDict
 
 from ._serializer import Model
@@ -76,6 +78,23 @@ class StatsDay(Model):
     # Precipitation analysis: 0=none, 1=Nearcast on, 2=Nearcast off
     precipitation_analysis_type: int | None = None
 
+    @staticmethod
+    def array_start(array: Sequence[RawValue]) -> int:
+        """Return the position of the first value of a raw stats row.
+
+        ``stats_day`` rows of the API start with their local day (e.g.
+        ``"2024-01-01"``) ahead of the 33 values; rows of the other periods
+        start with the values.
+        """
+        first = array[0] if array else None
+        if not isinstance(first, str):
+            return 0
+        try:
+            float(first)
+        except ValueError:
+            return 1
+        return 0
+
     @classmethod
     def from_array(cls, array: list[RawValue]) -> StatsDay:
         """Create a StatsDay from a raw API array.
@@ -171,7 +190,6 @@ class StatsDay(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
     )
 
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from pydantic import ConfigDict, Field
+from functools import cache
+from typing import Any
+
+from pydantic import ConfigDict, Field, TypeAdapter
 
 from tempestwx._models.status import Status
 
 from ._serializer import Model
+from .observation_frame import ObservationFrame
+from .stats_day import StatsDay
+
+STATS_PERIODS = ("day", "week", "month", "year")
+# Label column of StatsSet.to_columns frames
+TIME = "time"
 
 
 class StatsSet(Model):
@@ -46,10 +55,73 @@ class StatsSet(Model):
     model_config = ConfigDict(
         populate_by_name=True,
         validate_assignment=True,
-        extra="ignore",
         str_strip_whitespace=True,
         strict=True,
     )
 
+    def to_columns(self, period: str = "day") -> ObservationFrame:
+        """Return the stats of a period as typed columns.
+
+        Requires NumPy (``pip install tempestwx[numpy]``). Values are
+        coerced as by ``StatsDay.from_array`` and stored in one array per
+        ``StatsDay`` field instead of a model per row.
+
+        Args:
+            period: ``"day"``, ``"week"``, ``"month"`` or ``"year"``, for
+                ``stats_day`` to ``stats_year``.
+
+        Returns:
+            A frame with a ``time`` label column followed by the 33
+            ``StatsDay`` fields, keyed by ``time``. Labels are the first
+            value of the matching ``stats_*_time`` entry, or else a leading
+            text cell of the row itself (the day in ``stats_day``), which is
+            not read as a value.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``period`` is unknown.
+            pydantic.ValidationError: If a value is not valid for its field.
+        """
+        if period not in STATS_PERIODS:
+            raise ValueError(f"period must be one of {', '.join(STATS_PERIODS)}.")
+        rows: list[list[str | int | float | None]] = (
+            getattr(self, f"stats_{period}") or []
+        )
+        times: list[list[str | None]] = (
+            getattr(self, f"stats_{period}_time", None) or []
+        )
+        obs = []
+        for i, row in enumerate(rows):
+            label = times[i][0] if i < len(times) and times[i] else None
+            start = StatsDay.array_start(row)
+            if start and label is None:
+                label = str(row[0])
+            cells = row[start : start + len(STATS_DAY_FIELDS)]
+            if any(isinstance(v, str) for v in cells):
+                cells = [
+                    _stats_value(name, v)
+                    for name, v in zip(STATS_DAY_FIELDS, cells, strict=False)
+                ]
+            obs.append([label, *cells])
+        return ObservationFrame.from_obs((TIME, *STATS_DAY_FIELDS), obs, key=TIME)
+
+
+# Field names in stats_day array order
+STATS_DAY_FIELDS: tuple[str, ...] = tuple(StatsDay.__pydantic_fields__)
+
+
+@cache
+def _adapter(name: str) -> TypeAdapter[Any]:
+    """Return a validator of single values of a StatsDay field."""
+    annotation: Any = StatsDay.__pydantic_fields__[name].annotation
+    return TypeAdapter(annotation)
+
+
+def _stats_value(name: str, value: str | int | float | None) -> Any:
+    """Coerce one stats cell as ``StatsDay.from_array`` would."""
+    if isinstance(value, str):
+        return _adapter(name).validate_python(value)
+    return value
+
 
-__all__ = ["StatsSet"]
+__all__ = ["STATS_PERIODS", "StatsSet"]
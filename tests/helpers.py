@@ -0,0 +1,115 @@
+"""Payloads and test doubles shared by the unit tests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from tempestwx._http import Request, Response, Transport
+from tempestwx._models.observation import Observation
+from tempestwx._models.station_observation_latest import StationObservationLatest
+
+STATUS = {"status_code": 0, "status_message": "SUCCESS"}
+STATIONS: dict[str, Any] = {
+    "status": STATUS,
+    "stations": [
+        {
+            "station_id": 7,
+            "name": "Home",
+            "station_meta": {"elevation": 85.0},
+            "devices": [
+                {"device_id": 1, "device_type": "HB"},
+                {"device_id": 2, "device_type": "ST", "device_meta": {"agl": 2}},
+            ],
+            "capabilities": [{"device_id": 2, "capability": "wind"}],
+        }
+    ],
+}
+
+
+class StaticTransport(Transport):
+    """Transport answering every request with the same parsed content."""
+
+    def __init__(self, content: dict[str, Any]) -> None:
+        """Initialize with the response content."""
+        self.content = content
+
+    def send(self, request: Request) -> Response:
+        """Return the content."""
+        return Response(
+            url=request.url, headers={}, status_code=200, content=self.content
+        )
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return False
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        """Start the clock at ``now``."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+class FakeAsyncClient:
+    """Async client stub with scripted station endpoints.
+
+    Args:
+        delay: Seconds each ``obs_station`` call sleeps before returning.
+        errors: Exception raised by the n-th call (counting from 1).
+
+    Attributes:
+        calls: Arguments of every call, in order.
+        timestamps: Latest observation time per station returned by
+            ``obs_station_latest`` (missing or None for no observation).
+        fail: Stations whose ``obs_station_latest`` calls raise.
+    """
+
+    is_async = True
+
+    def __init__(
+        self, *, delay: float = 0.0, errors: dict[int, BaseException] | None = None
+    ) -> None:
+        """Initialize with no recorded calls."""
+        self.delay = delay
+        self.errors = errors or {}
+        self.calls: list[tuple[Any, ...]] = []
+        self.timestamps: dict[int, float | None] = {}
+        self.fail: set[int] = set()
+
+    def _record(self, *args: Any) -> None:
+        self.calls.append(args)
+        error = self.errors.get(len(self.calls))
+        if error is not None:
+            raise error
+
+    async def obs_station(
+        self,
+        station_id: int,
+        start_time: int | None = None,
+        end_time: int | None = None,
+    ) -> dict[str, Any]:
+        """Return a marker for the requested chunk."""
+        self._record(station_id, start_time, end_time)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return {"station_id": station_id, "start": start_time}
+
+    async def obs_station_latest(self, station_id: int) -> StationObservationLatest:
+        """Return the scripted latest observation for a station."""
+        self._record(station_id)
+        if station_id in self.fail:
+            raise RuntimeError("offline")
+        ts = self.timestamps.get(station_id)
+        obs = [] if ts is None else [Observation(timestamp=ts)]
+        return StationObservationLatest(station_id=station_id, obs=obs)
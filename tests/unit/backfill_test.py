@@ -0,0 +1,149 @@
+"""Tests for the crash-resumable backfill runner."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tempestwx._backfill import (
+    BackfillProgress,
+    BackfillRunner,
+    Journal,
+    JournalQueue,
+    WorkUnit,
+    plan,
+)
+from tests.helpers import FakeAsyncClient
+
+DAY = 86_400
+START = 1_700_000_000
+
+
+class Crash(BaseException):
+    """Simulated process death (not caught as a unit failure)."""
+
+
+def test_plan_aligns_chunks() -> None:
+    units = plan("obs_station", [2, 1, 2], START, START + 2 * DAY)
+    assert len(units) == 6
+    assert units[0] == WorkUnit("obs_station", 1, START, START - START % DAY + DAY - 1)
+    assert units[-1].end == START + 2 * DAY
+    assert WorkUnit.from_key(units[3].key) == units[3]
+    with pytest.raises(ValueError):
+        plan("obs_station", [1], START, START)
+
+
+def test_plan_chunks_do_not_overlap() -> None:
+    units = plan("obs_device", [1], START, START + 3 * DAY)
+    assert [u.start for u in units[1:]] == [u.end + 1 for u in units[:-1]]
+    assert (units[0].start, units[-1].end) == (START, START + 3 * DAY)
+    aligned = plan("obs_device", [1], 10 * DAY, 12 * DAY)
+    assert [(u.start, u.end) for u in aligned] == [
+        (10 * DAY, 11 * DAY - 1),
+        (11 * DAY, 12 * DAY),
+    ]
+
+
+def test_journal_survives_truncated_record(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    with Journal(path) as journal:
+        journal.record("a")
+    with path.open("a") as f:
+        f.write('{"key": "b", "t')  # crash mid-write
+    with Journal(path) as journal:
+        assert journal.done() == {"a"}
+        journal.record("c")
+    assert Journal(path).done() == {"a", "c"}
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_where_it_stopped(tmp_path: Path) -> None:
+    units = plan("obs_station", [1, 2, 3], START, START + 4 * DAY)
+    journal = tmp_path / "backfill.jsonl"
+    stored: list[WorkUnit] = []
+
+    crashing = FakeAsyncClient(errors={6: Crash()})
+    runner = BackfillRunner(
+        crashing, JournalQueue(units, str(journal)), sink=lambda u, _: stored.append(u)
+    )
+    with pytest.raises(BaseExceptionGroup):
+        await runner.run()
+    assert 0 < len(stored) < len(units)
+
+    client = FakeAsyncClient()
+    queue = JournalQueue(units, str(journal))
+    assert queue.remaining() == len(units) - len(stored)
+    progress = await BackfillRunner(client, queue, concurrency=3).run()
+    assert progress.remaining == 0
+    assert progress.completed == len(units) - len(stored)
+    # No chunk that was journaled is fetched again
+    fetched = {(u.target_id, u.start) for u in stored}
+    assert fetched.isdisjoint((sid, start) for sid, start, _ in client.calls)
+
+
+@pytest.mark.asyncio
+async def test_failures_retry_and_progress(tmp_path: Path) -> None:
+    now = [0.0]
+    units = plan("obs_station", [1], START, START + 4 * DAY)
+
+    class Flaky:
+        """Client failing the first attempt at every chunk."""
+
+        is_async = True
+
+        def __init__(self) -> None:
+            """Initialize with no chunks seen."""
+            self.seen: set[int | None] = set()
+
+        async def obs_station(
+            self, _: int, start_time: int | None = None, **__: Any
+        ) -> Any:
+            """Fail once per chunk, advancing the fake clock."""
+            now[0] += 1.0
+            if start_time not in self.seen:
+                self.seen.add(start_time)
+                raise RuntimeError("transient")
+            return {}
+
+    snapshots: list[BackfillProgress] = []
+    queue = JournalQueue(units, str(tmp_path / "j.jsonl"), max_attempts=2)
+    runner = BackfillRunner(
+        Flaky(),
+        queue,
+        concurrency=1,
+        on_progress=snapshots.append,
+        clock=lambda: now[0],
+    )
+    progress = await runner.run()
+    assert (progress.completed, progress.failures) == (len(units), len(units))
+    assert progress.throughput == pytest.approx(len(units) / now[0])
+    assert snapshots[-1].eta == 0
+    assert queue.failed == {}
+
+
+@pytest.mark.asyncio
+async def test_queue_calls_run_off_the_loop(tmp_path: Path) -> None:
+    units = plan("obs_station", [1, 2], START, START + DAY)
+    threads: set[str] = set()
+
+    class RecordingQueue(JournalQueue):
+        """Journal queue recording the threads it is called from."""
+
+        def claim(self, limit: int = 1) -> list[WorkUnit]:
+            """Record the thread and claim."""
+            threads.add(threading.current_thread().name)
+            return super().claim(limit)
+
+        def complete(self, unit: WorkUnit) -> bool:
+            """Record the thread and complete."""
+            threads.add(threading.current_thread().name)
+            return super().complete(unit)
+
+    queue = RecordingQueue(units, str(tmp_path / "j.jsonl"))
+    progress = await BackfillRunner(FakeAsyncClient(), queue).run()
+    assert progress.completed == len(units)
+    assert threads
+    assert threading.main_thread().name not in threads
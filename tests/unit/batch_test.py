@@ -0,0 +1,91 @@
+"""Tests for deferred endpoint batches."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._http import NotFoundError, Request, Response, Transport
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.station_set import StationSet
+from tempestwx._models.stats_set import StatsSet
+
+
+class BarrierTransport(Transport):
+    """Transport that only answers once ``parties`` requests are in flight."""
+
+    def __init__(self, parties: int) -> None:
+        """Initialize with the number of concurrent requests to wait for."""
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.tokens: list[str] = []
+
+    def send(self, request: Request) -> Response:
+        """Wait for the other requests, then return an empty body."""
+        self.barrier.wait()
+        self.tokens.append((request.headers or {})["Authorization"])
+        if request.url.endswith("/404"):
+            content = {"status": {"status_code": 404, "status_message": "Not found"}}
+            return Response(
+                url=request.url, headers={}, status_code=404, content=content
+            )
+        return Response(url=request.url, headers={}, status_code=200, content={})
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return False
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+def test_calls_across_mixins_run_concurrently() -> None:
+    # Each request blocks until all three are in flight at once
+    client = Tempest(token="t", transport=BarrierTransport(3))
+    with client.batch() as b:
+        stations = b.stations()
+        stats = b.stats(1)
+        forecast = b.forecast(2)
+        assert not stations.done()
+    assert isinstance(stations.result(), StationSet)
+    assert isinstance(stats.result(), StatsSet)
+    assert isinstance(forecast.result(), BetterForecast)
+
+
+def test_errors_and_scopes_are_per_call() -> None:
+    transport = BarrierTransport(2)
+    client = Tempest(token="base", transport=transport)
+    with client.batch() as b:
+        ok = b.stations()
+        with client.token_as("other"):
+            missing = b.station(404)
+    assert isinstance(ok.result(), StationSet)
+    with pytest.raises(NotFoundError):
+        missing.result()
+    assert sorted(transport.tokens) == ["Bearer base", "Bearer other"]
+
+
+def test_validation_and_cancellation() -> None:
+    client = Tempest(token="t", transport=BarrierTransport(1))
+    with pytest.raises(ValueError), client.batch() as b:
+        pending = b.stations()
+        b.station(0)
+    assert pending.cancelled()
+    with pytest.raises(AttributeError):
+        client.batch().token_as  # noqa: B018
+
+
+def test_requires_sync_client() -> None:
+    class AsyncTransport(BarrierTransport):
+        """Async flavor of the barrier transport."""
+
+        @property
+        def is_async(self) -> bool:
+            """Return transport asynchronicity mode."""
+            return True
+
+    client = Tempest(token="t", transport=AsyncTransport(1))
+    with pytest.raises(ValueError):
+        client.batch()
@@ -0,0 +1,142 @@
+"""Tests for the blocking bridge over the async transport."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._http import AsyncTransport, BridgeTransport, NotFoundError, Request
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.station_set import StationSet
+
+
+class Server:
+    """Async mock handler tracking concurrency and serving threads."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        """Initialize with the time each request takes."""
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.threads: set[str] = set()
+        self.tokens: list[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer after ``delay``; ``/404`` paths are not found."""
+        self.threads.add(threading.current_thread().name)
+        self.tokens.append(request.headers["Authorization"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if request.url.path.endswith("/404"):
+            status = {"status_code": 404, "status_message": "Not found"}
+            return httpx.Response(404, json={"status": status})
+        return httpx.Response(200, json={})
+
+    def bridge(self) -> BridgeTransport:
+        """Return a bridge sending to this handler."""
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self))
+        return BridgeTransport(AsyncTransport(client))
+
+
+def test_blocking_calls_run_on_the_loop_thread() -> None:
+    server = Server(delay=0)
+    with server.bridge() as bridge:
+        client = Tempest(token="t", transport=bridge)
+        assert not client.is_async
+        assert isinstance(client.stations(), StationSet)
+        assert isinstance(client.stations.prepare()(), StationSet)
+    assert server.threads == {"tempestwx-bridge"}
+
+
+def test_batch_runs_as_tasks_on_one_thread() -> None:
+    server = Server()
+    threads = threading.active_count()
+    with server.bridge() as bridge:
+        client = Tempest(token="t", transport=bridge)
+        with client.batch(max_workers=50) as b:
+            forecasts = [b.forecast(i) for i in range(1, 21)]
+            with client.token_as("other"):
+                missing = b.station(404)
+        assert threading.active_count() == threads + 1
+    assert all(isinstance(f.result(), BetterForecast) for f in forecasts)
+    with pytest.raises(NotFoundError):
+        missing.result()
+    assert server.max_in_flight == 21
+    assert server.threads == {"tempestwx-bridge"}
+    assert server.tokens.count("Bearer other") == 1
+
+
+def test_batch_respects_max_workers() -> None:
+    server = Server()
+    with server.bridge() as bridge:
+        client = Tempest(token="t", transport=bridge)
+        with client.batch(max_workers=3) as b:
+            for i in range(1, 10):
+                b.forecast(i)
+    assert server.max_in_flight == 3
+
+
+def test_futures_use_the_loop() -> None:
+    server = Server()
+    with server.bridge() as bridge:
+        client = Tempest(token="base", transport=bridge)
+        with client.token_as("other"):
+            first = client.stations.future()
+        second = client.forecast.future(1)
+        assert isinstance(first.result(timeout=5), StationSet)
+        assert isinstance(second.result(timeout=5), BetterForecast)
+        assert client._executor is None
+    assert sorted(server.tokens) == ["Bearer base", "Bearer other"]
+    assert server.max_in_flight == 2
+
+
+def test_large_responses_are_decoded_off_the_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    threads: list[str] = []
+    validate = StationSet.model_validate_json
+
+    def recording(body: bytes) -> StationSet:
+        threads.append(threading.current_thread().name)
+        return validate(body)
+
+    monkeypatch.setattr(StationSet, "model_validate_json", recording)
+    with Server(delay=0).bridge() as bridge, ThreadPoolExecutor(1) as executor:
+        for min_bytes, pool in [(0, None), (0, executor), (10**6, None)]:
+            client = Tempest(
+                token="t",
+                transport=bridge,
+                decode_executor=pool,
+                decode_min_bytes=min_bytes,
+            )
+            assert isinstance(client.stations.future().result(timeout=5), StationSet)
+    assert len(threads) == 3
+    assert threads[0] not in ("tempestwx-bridge", threading.main_thread().name)
+    assert threads[1].startswith("ThreadPoolExecutor")  # decode_executor
+    assert threads[2] == "tempestwx-bridge"  # small body, decoded in place
+
+
+def test_close() -> None:
+    bridge = Server().bridge()
+    bridge.close()
+    bridge.close()
+    assert not bridge.loop.is_running()
+    with pytest.raises(RuntimeError, match="closed"):
+        bridge.send(Request("GET", "https://example.com"))
+
+
+def test_loop_thread_cannot_block_on_itself() -> None:
+    with Server().bridge() as bridge:
+
+        async def nested() -> None:
+            bridge.send(Request("GET", "https://example.com"))
+
+        with pytest.raises(RuntimeError, match="own loop thread"):
+            bridge.run(nested())
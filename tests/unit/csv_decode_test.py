@@ -0,0 +1,107 @@
+"""Tests for the CSV observation decoder."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._client.processor import (
+    device_observation_csv,
+    iter_obs_csv,
+    obs_csv_columns,
+)
+from tempestwx._http import SyncTransport
+from tempestwx._models._serializer import UnknownModelAttributeWarning
+from tempestwx._models.device_observation import DeviceObservation
+from tempestwx._models.obs_st import OBS_ST_FIELDS, TempestObservation
+
+HEADER_CSV = (
+    b"timestamp,wind_avg,air_temperature,precip_type,unknown\r\n"
+    b"1700000000,1.5,21.25,0,x\r\n"
+    b"1700000060,,21.5,1,y\r\n"
+)
+# Header and first row of a ``format=csv`` obs_device response
+API_CSV = (
+    b"device_id,type,bucket_step_minutes,timestamp,wind_lull,wind_avg,"
+    b"wind_gust,wind_dir,wind_interval,pressure,temperature,humidity,lux,uv,"
+    b"solar_radiation,precip,precip_type,strike_distance,strike_count,battery,"
+    b"report_interval,local_daily_precip,precip_final,local_daily_precip_final,"
+    b"precip_analysis_type\n"
+    b"98765,obs_st,1,1700000000,0.4,1.2,2.1,245,3,1012.3,18.6,71,12345,1.4,103,"
+    b"0.02,1,12,2,2.71,1,0.5,0.6,0.7,1\n"
+)
+
+
+def test_header_columns_are_mapped_to_obs_st_order() -> None:
+    with pytest.warns(UnknownModelAttributeWarning, match="`unknown`"):
+        rows = list(iter_obs_csv(HEADER_CSV))
+    assert len(rows) == 2
+    assert all(len(row) == len(OBS_ST_FIELDS) for row in rows)
+    obs = TempestObservation.from_array(rows[0])
+    assert obs.timestamp == 1_700_000_000
+    assert obs.wind_average == 1.5
+    assert obs.air_temperature == 21.25
+    assert obs.precipitation_type == 0
+    assert rows[1][OBS_ST_FIELDS.index("wind_average")] is None
+
+
+def test_api_header_maps_every_field(recwarn: pytest.WarningsRecorder) -> None:
+    (row,) = iter_obs_csv(API_CSV)
+    assert not recwarn.list
+    assert None not in row
+    obs = TempestObservation.from_array(row)
+    assert obs.timestamp == 1_700_000_000
+    assert obs.wind_direction == 245
+    assert obs.air_temperature == 18.6
+    assert obs.relative_humidity == 71
+    assert obs.lightning_average_distance == 12
+    assert obs.lightning_strike_count == 2
+    assert obs.local_day_rain_accumulation == 0.5
+    assert obs.nearcast_rain_accumulation == 0.6
+    assert obs.local_day_nearcast_rain_accumulation == 0.7
+    assert obs.precipitation_analysis_type == 1
+
+
+def test_api_metadata_is_checked() -> None:
+    result = device_observation_csv(API_CSV)
+    assert isinstance(result, DeviceObservation)
+    assert (result.device_id, result.type_) == (98765, "obs_st")
+    header, row = API_CSV.splitlines()
+    air = header + b"\n" + row.replace(b",obs_st,", b",obs_air,")
+    with pytest.raises(ValueError, match="obs_air"):
+        device_observation_csv(air)
+    mixed = API_CSV + row.replace(b"98765,", b"12345,")
+    with pytest.raises(ValueError, match="device_id"):
+        list(iter_obs_csv(mixed))
+
+
+def test_headerless_rows_are_positional() -> None:
+    rows = list(iter_obs_csv(b"1700000000,0.1,0.2\n\n1700000060,0.3\n"))
+    assert rows[0][:4] == [1_700_000_000, 0.1, 0.2, None]
+    assert rows[1][:2] == [1_700_000_060, 0.3]
+    columns = obs_csv_columns(b"1700000000,0.1\n1700000060,0.3\n")
+    assert columns["timestamp"] == [1_700_000_000, 1_700_000_060]
+    assert columns["wind_lull"] == [0.1, 0.3]
+
+
+def test_empty_body() -> None:
+    assert device_observation_csv(b"") is None
+    assert list(iter_obs_csv(b"")) == []
+
+
+def test_obs_device_csv_end_to_end() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["format"] == "csv"
+        return httpx.Response(
+            200, content=HEADER_CSV, headers={"content-type": "text/csv"}
+        )
+
+    transport = SyncTransport(httpx.Client(transport=httpx.MockTransport(handler)))
+    client = Tempest(token="t", transport=transport)
+    with pytest.warns(UnknownModelAttributeWarning):
+        result = client.obs_device(10, format="CSV")
+    assert isinstance(result, DeviceObservation)
+    assert result.source == "csv"
+    assert result.obs is not None
+    assert result.obs[1][0] == 1_700_000_060
@@ -0,0 +1,129 @@
+"""Tests for decoding responses on an executor."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import pickle
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._client.processor import model_instance
+from tempestwx._http import AsyncTransport
+from tempestwx._http.error import NotFoundError
+from tempestwx._models.station_set import StationSet
+
+STATIONS = {
+    "status": {"status_code": 0, "status_message": "SUCCESS"},
+    "stations": [{"station_id": i, "name": f"Station {i}"} for i in range(200)],
+}
+BODY = json.dumps(STATIONS).encode()
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the functions submitted to it."""
+
+    def __init__(self) -> None:
+        """Create a single-thread pool."""
+        super().__init__(max_workers=1)
+        self.submitted: list[Callable[..., Any]] = []
+        self.threads: list[str] = []
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Record and submit a call."""
+        self.submitted.append(fn)
+
+        def run() -> Any:
+            self.threads.append(threading.current_thread().name)
+            return fn(*args, **kwargs)
+
+        return super().submit(run)
+
+
+def make_client(body: bytes = BODY, status: int = 200, **options: Any) -> Tempest:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status, content=body, headers={"content-type": "application/json"}
+        )
+
+    transport = AsyncTransport(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return Tempest(token="t", transport=transport, **options)
+
+
+def test_model_instance_is_picklable() -> None:
+    builder = pickle.loads(pickle.dumps(model_instance(StationSet)))
+    result = builder.decode(BODY)
+    assert isinstance(result, StationSet)
+    assert result.stations is not None
+    assert len(result.stations) == 200
+    assert builder(None) is None
+
+
+def test_negative_threshold_rejected() -> None:
+    with pytest.raises(ValueError, match="decode_min_bytes"):
+        Tempest(token="t", decode_min_bytes=-1)
+
+
+@pytest.mark.asyncio
+async def test_large_response_decoded_on_executor() -> None:
+    with RecordingExecutor() as executor:
+        client = make_client(decode_executor=executor, decode_min_bytes=0)
+        result = await client.stations()
+    assert isinstance(result, StationSet)
+    assert result.stations is not None
+    assert result.stations[5].station_id == 5
+    assert len(executor.submitted) == 1
+    assert executor.threads and executor.threads[0] != threading.main_thread().name
+
+
+@pytest.mark.asyncio
+async def test_small_response_decoded_in_place() -> None:
+    with RecordingExecutor() as executor:
+        client = make_client(decode_executor=executor, decode_min_bytes=len(BODY) + 1)
+        result = await client.stations()
+        prepared = await client.stations.prepare()()
+    assert isinstance(result, StationSet)
+    assert isinstance(prepared, StationSet)
+    assert executor.submitted == []
+
+
+@pytest.mark.asyncio
+async def test_errors_raised_before_offloading() -> None:
+    body = json.dumps({"status": {"status_code": 404, "status_message": "NOT FOUND"}})
+    with RecordingExecutor() as executor:
+        client = make_client(
+            body.encode(), 404, decode_executor=executor, decode_min_bytes=0
+        )
+        with pytest.raises(NotFoundError):
+            await client.stations()
+    assert executor.submitted == []
+
+
+@pytest.mark.asyncio
+async def test_raw_is_not_offloaded() -> None:
+    with RecordingExecutor() as executor:
+        client = make_client(decode_executor=executor, decode_min_bytes=0)
+        content = await client.stations.raw()
+    assert content == STATIONS
+    assert executor.submitted == []
+
+
+@pytest.mark.asyncio
+async def test_process_pool_decoding() -> None:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        client = make_client(decode_executor=executor, decode_min_bytes=0)
+        result = await client.stations()
+    assert isinstance(result, StationSet)
+    assert result.stations is not None
+    assert result.stations[-1].name == "Station 199"
@@ -0,0 +1,157 @@
+"""Tests for the on-disk device day cache."""
+
+from __future__ import annotations
+
+from collections.abc import Coroutine
+from datetime import date
+from pathlib import Path
+from typing import Any, cast
+from urllib.parse import urlparse
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._cache import DeviceDayCache, DeviceDayCacheStats
+from tempestwx._http import Request, Response, Transport
+from tempestwx._models.device_observation import DeviceObservation
+
+# 2024-03-10 12:00 UTC, still 2024-03-10 in Honolulu
+NOW = 1_710_072_000.0
+DAY = 86_400.0
+
+
+class DeviceTransport(Transport):
+    """Transport serving one station and per-offset device observations."""
+
+    def __init__(self, asynchronous: bool = False) -> None:
+        """Initialize with no recorded requests."""
+        self.paths: list[str] = []
+        self.params: list[dict[str, Any]] = []
+        # Seconds added to served timestamps, e.g. to serve another day
+        self.shift = 0.0
+        self._async = asynchronous
+
+    def _respond(self, request: Request) -> Response:
+        path = urlparse(request.url).path
+        self.paths.append(path)
+        if path.endswith("/stations"):
+            content: dict[str, Any] = {
+                "stations": [
+                    {
+                        "station_id": 1,
+                        "timezone": "Pacific/Honolulu",
+                        "devices": [{"device_id": 10}],
+                    }
+                ]
+            }
+        else:
+            params = request.params or {}
+            self.params.append(params)
+            timestamp = NOW - params["day_offset"] * DAY + self.shift
+            content = {"device_id": 10, "obs": [[timestamp, 1.0]]}
+        return Response(url=request.url, headers={}, status_code=200, content=content)
+
+    def send(self, request: Request) -> Any:
+        """Return the canned response (or a coroutine for async mode)."""
+        if self._async:
+
+            async def respond() -> Response:
+                return self._respond(request)
+
+            return respond()
+        return self._respond(request)
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return self._async
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+def device_calls(transport: DeviceTransport) -> int:
+    return sum("/observations/device/" in p for p in transport.paths)
+
+
+def test_past_days_fetched_once(tmp_path: Path) -> None:
+    now = [NOW]
+    transport = DeviceTransport()
+    client = Tempest(token="t", transport=transport)
+    cache = DeviceDayCache(client, tmp_path, clock=lambda: now[0])
+
+    first = [cache.get(10, day_offset=n) for n in range(1, 31)]
+    assert all(isinstance(d, DeviceObservation) for d in first)
+    assert device_calls(transport) == 30
+    assert cache.local_date(10, 1) == date(2024, 3, 9)
+
+    # A fresh cache over the same directory hits the disk only
+    again = DeviceDayCache(client, tmp_path, clock=lambda: now[0])
+    assert [again.get(10, day_offset=n) for n in range(1, 31)] == first
+    assert device_calls(transport) == 30
+
+    # A day later only the newly completed day is fetched
+    now[0] += DAY
+    [again.get(10, day_offset=n) for n in range(1, 31)]
+    assert device_calls(transport) == 31
+    assert again.stats().hits == 59
+
+
+def test_today_and_raw(tmp_path: Path) -> None:
+    transport = DeviceTransport()
+    cache = DeviceDayCache(
+        Tempest(token="t", transport=transport),
+        tmp_path,
+        timezones={10: "UTC"},
+        clock=lambda: NOW,
+    )
+    cache.get(10, day_offset=0)
+    cache.get(10, day_offset=0)
+    assert device_calls(transport) == 2
+    assert not any(p.endswith("/stations") for p in transport.paths)
+    raw = cache.get(10, day_offset=2, raw=True)
+    assert raw == {"device_id": 10, "obs": [[NOW - 2 * DAY, 1.0]]}
+    assert cache.stats().uncached == 2
+    with pytest.raises(KeyError):
+        cache.get(99, day_offset=1)
+
+
+def test_days_outside_the_key_are_not_stored(tmp_path: Path) -> None:
+    transport = DeviceTransport()
+    cache = DeviceDayCache(
+        Tempest(token="t", transport=transport),
+        tmp_path,
+        timezones={10: "Pacific/Honolulu"},
+        clock=lambda: NOW,
+    )
+    # 2024-03-09 00:00 to 23:59:59 in Honolulu (UTC-10)
+    start, end = 1_709_978_400, 1_710_064_799
+    assert cache.bounds(10, date(2024, 3, 9)) == (start, end)
+    cache.get(10, day_offset=1)
+    assert transport.params[-1]["time_start"] == start
+    assert transport.params[-1]["time_end"] == end
+
+    transport.shift = DAY  # the server resolved the offset to another day
+    shifted = cache.get(10, day_offset=2, raw=True)
+    assert shifted["obs"][0][0] == NOW - DAY
+    assert not cache.path(10, date(2024, 3, 8)).exists()
+    transport.shift = 0.0
+    assert cache.get(10, day_offset=2, raw=True)["obs"][0][0] == NOW - 2 * DAY
+    assert cache.path(10, date(2024, 3, 8)).exists()
+    assert cache.stats() == DeviceDayCacheStats(hits=0, misses=2, uncached=1)
+
+
+@pytest.mark.asyncio
+async def test_async_client(tmp_path: Path) -> None:
+    transport = DeviceTransport(asynchronous=True)
+    cache = DeviceDayCache(
+        Tempest(token="t", transport=transport), tmp_path, clock=lambda: NOW
+    )
+
+    async def get(offset: int) -> DeviceObservation:
+        result = cache.get(10, day_offset=offset)
+        return await cast(Coroutine[None, None, DeviceObservation], result)
+
+    first = await get(3)
+    assert await get(3) == first
+    assert device_calls(transport) == 1
@@ -0,0 +1,171 @@
+"""Tests for the stale-while-revalidate forecast cache."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from contextvars import ContextVar
+from typing import Any, cast
+
+import pytest
+
+from tempestwx._cache import ForecastCache
+from tempestwx._client.base import TempestBase
+from tempestwx._models.better_forecast import BetterForecast
+from tests.helpers import FakeClock
+
+TOKEN: ContextVar[str] = ContextVar("TOKEN", default="t")
+
+
+class FakeForecastClient:
+    """Client stub counting forecast fetches."""
+
+    _validate_units = staticmethod(TempestBase._validate_units)
+    _unit_values = staticmethod(TempestBase._unit_values)
+
+    def __init__(self, asynchronous: bool = False) -> None:
+        """Initialize with zero fetches."""
+        self.is_async = asynchronous
+        self.calls: list[tuple[Any, ...]] = []
+        self.tokens: list[str] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    @property
+    def token(self) -> str:
+        """Return the token of the current context, like ``token_as``."""
+        return TOKEN.get()
+
+    def forecast(self, station_id: int, *units: str) -> Any:
+        """Return a forecast tagged with the fetch count."""
+        self.calls.append((station_id, *units))
+        self.tokens.append(self.token)
+        value = BetterForecast(location_name=f"fetch-{len(self.calls)}")
+        if self.is_async:
+
+            async def fetch() -> BetterForecast:
+                await asyncio.sleep(0)
+                return value
+
+            return fetch()
+        self.release.wait(timeout=5)
+        return value
+
+
+def test_sync_fresh_stale_and_expired_phases() -> None:
+    clock = FakeClock()
+    client = FakeForecastClient()
+    with ForecastCache(client, ttl=100, refresh_ahead=20, clock=clock) as cache:
+        first = cache.get(1)
+        assert isinstance(first, BetterForecast)
+        assert cache.get(1) is first  # fresh
+        assert len(client.calls) == 1
+
+        clock.now = 85.0  # near expiry: served stale, refreshed in background
+        client.release.clear()
+        assert cache.get(1) is first
+        assert cache.get(1) is first  # still a single refresh in flight
+        client.release.set()
+        for _ in range(100):
+            if len(cache) and cache.get(1) is not first:
+                break
+            threading.Event().wait(0.01)
+        assert len(client.calls) == 2
+
+        clock.now = 500.0  # expired: fetched before returning
+        third = cache.get(1)
+        assert isinstance(third, BetterForecast)
+        assert third.location_name == "fetch-3"
+        stats = cache.stats()
+        assert stats.misses == 2
+        assert stats.refreshes == 1
+
+
+def test_equivalent_units_share_an_entry() -> None:
+    client = FakeForecastClient()
+    with ForecastCache(client, clock=FakeClock()) as cache:
+        cache.get(1, units_temp="F")
+        cache.get(1, units_temp="f")
+        cache.get(1, units_temp="c")
+    assert len(client.calls) == 2
+    assert client.calls[0][1] == "f"
+
+
+def test_entries_are_scoped_to_the_token() -> None:
+    clock = FakeClock()
+    client = FakeForecastClient()
+    with ForecastCache(client, ttl=100, refresh_ahead=20, clock=clock) as cache:
+        mine = cache.get(1)
+        reset = TOKEN.set("other")
+        try:
+            theirs = cache.get(1)
+            assert theirs is not mine
+            clock.now = 85.0  # background refresh runs with the caller's token
+            assert cache.get(1) is theirs
+            for _ in range(100):
+                if len(client.tokens) == 3 and cache.get(1) is not theirs:
+                    break
+                threading.Event().wait(0.01)
+        finally:
+            TOKEN.reset(reset)
+        assert client.tokens == ["t", "other", "other"]
+        assert cache.get(1) is mine
+        cache.invalidate(1)
+        assert len(cache) == 0
+
+
+def test_entries_are_bounded_and_keep_no_token() -> None:
+    clock = FakeClock()
+    client = FakeForecastClient()
+    with ForecastCache(
+        client, ttl=100, refresh_ahead=0, max_entries=2, clock=clock
+    ) as cache:
+        cache.get(1)
+        clock.now = 50.0
+        cache.get(2)
+        clock.now = 120.0  # entry 1 expired, entry 2 still fresh
+        cache.get(3)
+        assert len(cache) == 2
+        assert cache.get(2).location_name == "fetch-2"  # type: ignore[union-attr]
+        cache.get(4)  # nothing expired: the oldest entry (2) is dropped
+        assert len(cache) == 2
+        assert {k[1] for k in cache._entries} == {3, 4}
+        assert all(TOKEN.get() not in k for k in cache._entries)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        ForecastCache(FakeForecastClient(), ttl=10, refresh_ahead=10)
+    with pytest.raises(ValueError):
+        ForecastCache(FakeForecastClient(), max_entries=0)
+    cache = ForecastCache(FakeForecastClient())
+    with pytest.raises(ValueError):
+        cache.get(0)
+    with pytest.raises(ValueError):
+        cache.get(1, units_wind="furlongs")
+
+
+@pytest.mark.asyncio
+async def test_async_single_refresh_per_key() -> None:
+    clock = FakeClock()
+    client = FakeForecastClient(asynchronous=True)
+    cache = ForecastCache(client, ttl=100, refresh_ahead=20, clock=clock)
+
+    async def get() -> BetterForecast:
+        return await cast(Coroutine[None, None, BetterForecast], cache.get(7))
+
+    results = await asyncio.gather(*(get() for _ in range(10)))
+    assert len(client.calls) == 1
+    assert all(r is results[0] for r in results)
+
+    clock.now = 90.0
+    stale = await get()
+    assert stale is results[0]
+    await asyncio.sleep(0.01)
+    fresh = await get()
+    assert fresh is not stale
+    assert len(client.calls) == 2
+
+    cache.invalidate(7)
+    assert len(cache) == 0
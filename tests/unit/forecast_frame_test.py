@@ -0,0 +1,81 @@
+"""Tests for the columnar forecast frame."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.better_forecast_hourly_forecast import (
+    BetterForecastHourlyForecast,
+)
+from tempestwx._models.forecast_frame import ForecastFrame, lookup_table
+from tempestwx._models.units_default import Conditions, Icon, PrecipType
+
+np = pytest.importorskip("numpy")
+
+HOURLY: list[dict[str, Any]] = [
+    {"time": 3600, "conditions": "Clear", "icon": "clear-day", "air_temperature": 12},
+    {
+        "time": 7200,
+        "conditions": "Rain Likely",
+        "icon": "rainy",
+        "air_temperature": 11.5,
+        "precip_type": "rain",
+        "wind_avg_color": "#aaa",
+    },
+    {"time": 10800, "conditions": "Clear", "air_temperature": None},
+]
+FORECAST: dict[str, Any] = {
+    "forecast": {
+        "hourly": HOURLY,
+        "daily": [{"day_start_local": 0, "conditions": "Cloudy", "day_num": 1}],
+    }
+}
+
+
+def test_enums_are_coded() -> None:
+    frame = ForecastFrame.from_forecast(FORECAST)
+    assert frame.key == "time"
+    assert frame.fields == tuple(BetterForecastHourlyForecast.__pydantic_fields__)
+    assert frame["conditions"].dtype == np.int8
+    assert frame.lookup("conditions") is lookup_table(Conditions)
+    assert frame["conditions"].tolist() == [
+        frame.code("conditions", "Clear"),
+        frame.code("conditions", Conditions.rain_likely),
+        frame.code("conditions", "Clear"),
+    ]
+    assert frame.members("icon") == [Icon.clear_day, Icon.rainy, None]
+    assert frame.members("precip_type") == [None, PrecipType.rain, None]
+    assert frame["air_temperature"].dtype == np.float64
+    assert frame.valid("air_temperature").tolist() == [12.0, 11.5]
+    rainy = frame["conditions"] == frame.code("conditions", "Rain Likely")
+    assert frame["time"][rainy].tolist() == [7200]
+    with pytest.raises(ValueError, match="Conditions"):
+        frame.code("conditions", "Hail")
+
+
+def test_matches_models() -> None:
+    forecast = BetterForecast(**FORECAST)
+    frame = forecast.to_columns()
+    assert frame.to_obs() == ForecastFrame.from_forecast(FORECAST).to_obs()
+    hourly = forecast.forecast.hourly  # type: ignore[union-attr]
+    assert frame.to_obs() == [list(vars(h).values()) for h in hourly or []]
+    window = frame.between(7200)
+    assert isinstance(window, ForecastFrame)
+    assert window.members("conditions") == [Conditions.rain_likely, Conditions.clear]
+    daily = forecast.to_columns("daily")
+    assert daily.key == "day_start_local"
+    assert daily.members("conditions") == [Conditions.cloudy]
+    assert len(ForecastFrame.from_forecast({}, "daily")) == 0
+    reversed_hours = {"forecast": {"hourly": HOURLY[::-1]}}
+    assert ForecastFrame.from_forecast(reversed_hours).to_obs() == frame.to_obs()
+
+
+def test_rejects_bad_input() -> None:
+    with pytest.raises(ValueError, match="period"):
+        ForecastFrame.from_forecast(FORECAST, "weekly")
+    bad = {"forecast": {"hourly": [{"time": 1, "conditions": "Hail"}]}}
+    with pytest.raises(ValueError, match="'Hail' is not a valid Conditions"):
+        ForecastFrame.from_forecast(bad)
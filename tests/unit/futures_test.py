@@ -0,0 +1,98 @@
+"""Tests for the ``future()`` form of endpoint calls."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import as_completed
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._http import NotFoundError, Request, Response, Transport
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.station_set import StationSet
+
+
+class GateTransport(Transport):
+    """Transport whose requests wait until the gate is opened."""
+
+    def __init__(self) -> None:
+        """Create a closed gate."""
+        self.gate = threading.Event()
+        self.tokens: list[str] = []
+        self.threads: set[str] = set()
+
+    def send(self, request: Request) -> Response:
+        """Wait for the gate, then return an empty body (or a 404)."""
+        assert self.gate.wait(timeout=5)
+        self.tokens.append((request.headers or {})["Authorization"])
+        self.threads.add(threading.current_thread().name)
+        if request.url.endswith("/404"):
+            content = {"status": {"status_code": 404, "status_message": "Not found"}}
+            return Response(
+                url=request.url, headers={}, status_code=404, content=content
+            )
+        return Response(url=request.url, headers={}, status_code=200, content={})
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return False
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+def test_future_returns_immediately_and_composes_with_as_completed() -> None:
+    transport = GateTransport()
+    client = Tempest(token="t", transport=transport, max_workers=4)
+    futures = [client.forecast.future(i) for i in range(1, 4)]
+    futures.append(client.stations.future())
+    assert not any(f.done() for f in futures)
+    transport.gate.set()
+    results = [f.result() for f in as_completed(futures, timeout=5)]
+    assert sum(isinstance(r, BetterForecast) for r in results) == 3
+    assert sum(isinstance(r, StationSet) for r in results) == 1
+    assert threading.current_thread().name not in transport.threads
+    client.close()
+
+
+def test_scopes_and_errors_are_per_call() -> None:
+    transport = GateTransport()
+    transport.gate.set()
+    client = Tempest(token="base", transport=transport)
+    with client.token_as("other"):
+        missing = client.station.future(404)
+    ok = client.stations.future()
+    with pytest.raises(NotFoundError):
+        missing.result(timeout=5)
+    assert isinstance(ok.result(timeout=5), StationSet)
+    assert sorted(transport.tokens) == ["Bearer base", "Bearer other"]
+    client.close()
+
+
+def test_arguments_validated_at_submission() -> None:
+    client = Tempest(token="t", transport=GateTransport())
+    with pytest.raises(ValueError, match="station_id"):
+        client.station.future(-1)
+    assert client._executor is None
+
+
+def test_close_waits_for_pending_calls() -> None:
+    transport = GateTransport()
+    client = Tempest(token="t", transport=transport)
+    future = client.stations.future()
+    threading.Timer(0.05, transport.gate.set).start()
+    client.close()
+    assert future.done()
+    assert isinstance(future.result(), StationSet)
+    with pytest.raises(RuntimeError, match="closed"):
+        client.stations.future()
+
+
+def test_async_client_rejected() -> None:
+    client = Tempest(token="t", asynchronous=True)
+    with pytest.raises(ValueError, match="synchronous"):
+        client.stations.future()
+    with pytest.raises(ValueError, match="max_workers"):
+        Tempest(token="t", max_workers=0)
@@ -0,0 +1,122 @@
+"""Tests for decoding raw JSON bodies straight into models."""
+
+from __future__ import annotations
+
+import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._client.processor import model_instance
+from tempestwx._http import (
+    AsyncTransport,
+    LazyResponse,
+    Request,
+    Response,
+    SyncTransport,
+)
+from tempestwx._models._serializer import UnknownModelAttributeWarning
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.station_set import StationSet
+from tests.helpers import STATIONS, STATUS
+
+FORECAST: dict[str, Any] = {
+    "status": STATUS,
+    "forecast": {"hourly": [{"time": 1, "conditions": "Clear", "new_field": 2}]},
+    "other": 1,
+}
+HTML = {"content-type": "text/html"}
+
+
+class RecordingTransport(SyncTransport):
+    """Sync transport keeping the last response it returned."""
+
+    last: Response
+
+    def send(self, request: Request) -> Response:
+        """Send the request and record the response."""
+        self.last = super().send(request)
+        return self.last
+
+
+def client_for(content: bytes, content_type: str = "application/json") -> Tempest:
+    """Return a client whose transport answers with ``content``."""
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=content, headers={"content-type": content_type}
+        )
+
+    transport = RecordingTransport(httpx.Client(transport=httpx.MockTransport(handler)))
+    return Tempest(token="t", transport=transport)
+
+
+def test_decode_matches_keyword_validation() -> None:
+    builder = model_instance(StationSet)
+    assert builder.decode(json.dumps(STATIONS).encode()) == builder(STATIONS)
+
+
+def test_decode_warns_in_single_pass() -> None:
+    with pytest.warns(UnknownModelAttributeWarning) as record:
+        forecast = model_instance(BetterForecast).decode(json.dumps(FORECAST).encode())
+    messages = sorted(str(r.message) for r in record)
+    assert len(messages) == 2
+    assert "`other`" in messages[0]
+    assert "BetterForecastHourly" in messages[1]
+    assert forecast is not None
+    assert forecast.model_extra is None
+    assert "other" not in forecast.model_dump()
+
+
+def test_endpoint_skips_intermediate_dict() -> None:
+    client = client_for(json.dumps(STATIONS).encode())
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        stations = client.stations()
+    assert stations == StationSet(**STATIONS)
+    response = client.transport.last  # type: ignore[attr-defined]
+    assert isinstance(response, LazyResponse)
+    assert response.deferred
+    assert client.stations.raw() == STATIONS
+
+
+def test_lazy_content() -> None:
+    response = LazyResponse("u", {}, 200, b'{"a": 1}')
+    assert response.deferred
+    assert response.content == {"a": 1}
+    assert not response.deferred
+    assert LazyResponse("u", {}, 200, b"").content is None
+    assert LazyResponse("u", {}, 200, b"<html>").content is None
+    assert LazyResponse("u", {}, 200, b"a,b", is_json=False).content is None
+
+
+def test_empty_body_decodes_to_none() -> None:
+    assert client_for(b"").stations() is None
+
+
+@pytest.mark.parametrize("mode", ["validated", "trusted", "read_only"])
+def test_non_json_body_decodes_to_none(mode: str) -> None:
+    client = client_for(b"<html>Down for maintenance</html>", HTML["content-type"])
+    with client.trusted(mode == "trusted"), client.read_only(mode == "read_only"):
+        assert client.stations() is None
+        assert client.stations.raw() is None
+
+
+@pytest.mark.asyncio
+async def test_non_json_body_decodes_to_none_on_executor() -> None:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"<html>", headers=HTML)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tempest = Tempest(
+            token="t",
+            transport=AsyncTransport(client),
+            decode_executor=executor,
+            decode_min_bytes=0,
+        )
+        assert await tempest.stations() is None
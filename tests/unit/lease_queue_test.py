@@ -0,0 +1,146 @@
+"""Tests for the SQLite lease queue."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tempestwx._backfill import BackfillRunner, LeaseQueue, WorkUnit, plan
+from tests.helpers import FakeAsyncClient
+
+START = 1_700_000_000
+
+
+class BlockingClient:
+    """Async client stub whose fetches wait until released."""
+
+    is_async = True
+
+    def __init__(self, on_fetch: Any = None) -> None:
+        """Initialize with an optional hook called when a fetch starts."""
+        self.on_fetch = on_fetch
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def obs_station(self, station_id: int, **_: Any) -> int:
+        """Return the station id once released."""
+        if self.on_fetch is not None:
+            self.on_fetch()
+        self.started.set()
+        await self.release.wait()
+        return station_id
+
+
+def run_worker(path: str, worker_id: str) -> list[str]:
+    """Run a backfill worker process; return the keys it completed."""
+    done: list[str] = []
+    with LeaseQueue(path, worker_id=worker_id) as queue:
+        queue.add(plan("obs_station", range(1, 21), START, START + 5 * 86_400))
+        runner = BackfillRunner(
+            FakeAsyncClient(delay=0.002), queue, sink=lambda u, _: done.append(u.key)
+        )
+        asyncio.run(runner.run())
+    return done
+
+
+def test_worker_processes_share_the_queue(tmp_path: Path) -> None:
+    path = str(tmp_path / "backfill.db")
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=3, mp_context=context) as pool:
+        results = list(pool.map(run_worker, [path] * 3, ["a", "b", "c"]))
+    keys = [key for worker in results for key in worker]
+    assert len(keys) == len(set(keys)) == 20 * 6  # no unit fetched twice
+    with LeaseQueue(path) as queue:
+        assert queue.remaining() == 0
+        assert queue.counts() == {"done": 120}
+
+
+def test_expired_leases_are_reclaimed(tmp_path: Path) -> None:
+    now = [0.0]
+    path = tmp_path / "q.db"
+    units = plan("obs_station", [1, 2], START, START + 60)
+    first = LeaseQueue(path, worker_id="a", lease_seconds=10, clock=lambda: now[0])
+    second = LeaseQueue(path, worker_id="b", lease_seconds=10, clock=lambda: now[0])
+    assert first.add(units) == 2
+    assert second.add(units) == 0
+
+    claimed = first.claim(2)
+    assert claimed == units
+    assert second.claim() == []
+    now[0] = 5.0
+    assert first.renew(claimed[0])
+    now[0] = 12.0  # second unit's lease expired, first was renewed
+    assert second.claim(2) == [claimed[1]]
+    assert not first.renew(claimed[1])
+    assert first.complete(claimed[0])
+    assert not first.complete(claimed[1])
+    assert second.remaining() == 1
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_lease_expiring_mid_fetch_counts_once(tmp_path: Path) -> None:
+    now = [0.0]
+    path = tmp_path / "q.db"
+    options: dict[str, Any] = {"lease_seconds": 10, "clock": lambda: now[0]}
+    first = LeaseQueue(path, worker_id="a", heartbeat=5, **options)
+    second = LeaseQueue(path, worker_id="b", **options)
+    first.add(plan("obs_station", [1], START, START + 60))
+
+    def stall() -> None:
+        now[0] = 20.0  # the fetch outlives the lease without a renewal
+
+    client = BlockingClient(on_fetch=stall)
+    delivered: list[str] = []
+    runner = BackfillRunner(
+        client, first, sink=lambda *_: delivered.append("a"), concurrency=1
+    )
+    task = asyncio.create_task(runner.run())
+    await client.started.wait()
+    (unit,) = second.claim()
+    assert second.complete(unit)
+    client.release.set()
+    progress = await task
+    assert delivered == ["a"]  # delivered at least once...
+    assert (progress.completed, progress.lost) == (0, 1)  # ...but counted once
+    assert not first.fail(unit, "late")
+    assert second.counts() == {"done": 1}
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_keeps_the_lease(tmp_path: Path) -> None:
+    path = tmp_path / "q.db"
+    first = LeaseQueue(path, worker_id="a", lease_seconds=0.2, heartbeat=0.02)
+    second = LeaseQueue(path, worker_id="b", lease_seconds=0.2)
+    first.add(plan("obs_station", [1], START, START + 60))
+    client = BlockingClient()
+    task = asyncio.create_task(BackfillRunner(client, first).run())
+    await client.started.wait()
+    await asyncio.sleep(0.5)  # well past the unrenewed lease
+    assert second.claim() == []
+    client.release.set()
+    progress = await task
+    assert (progress.completed, progress.lost) == (1, 0)
+    first.close()
+    second.close()
+
+
+def test_failures_use_up_attempts(tmp_path: Path) -> None:
+    with LeaseQueue(tmp_path / "q.db", max_attempts=2) as queue:
+        queue.add(plan("obs_station", [1], START, START + 60))
+        (unit,) = queue.claim()
+        assert queue.fail(unit, "boom")
+        assert queue.claim() == [unit]
+        queue.fail(unit, "boom again")
+        assert not queue.fail(unit, "not leased")
+        assert queue.claim() == []
+        assert queue.failed == {unit: "boom again"}
+        assert isinstance(unit, WorkUnit)
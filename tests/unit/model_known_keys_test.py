@@ -0,0 +1,84 @@
+"""Tests for the unknown-attribute check of response models."""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from pydantic import AliasChoices, AliasPath, Field, ValidationError
+
+from tempestwx._models._serializer import Model, UnknownModelAttributeWarning
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.device_observation import DeviceObservation
+
+FORECAST: dict[str, Any] = {"forecast": {"hourly": [{"time": 1, "new_field": 2}]}}
+
+
+class Aliased(Model):
+    """Model with every supported kind of alias."""
+
+    plain: int | None = None
+    named: int | None = Field(None, alias="name")
+    choice: int | None = Field(None, validation_alias=AliasChoices("a", "b"))
+    nested: int | None = Field(None, validation_alias=AliasPath("outer", 0))
+
+
+@pytest.fixture
+def check_disabled() -> Generator[None]:
+    """Disable the unknown-attribute check for the duration of a test."""
+    Model.warn_unknown_attributes = False
+    try:
+        yield
+    finally:
+        Model.warn_unknown_attributes = True
+
+
+def test_aliases_are_known() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        model = Aliased(plain=0, name=1, b=2, outer=[3])
+        observation = DeviceObservation(type="obs_st")
+    assert (model.plain, model.named, model.choice, model.nested) == (0, 1, 2, 3)
+    assert observation.type_ == "obs_st"
+
+
+def test_unknown_attributes_warn_once_each() -> None:
+    with pytest.warns(UnknownModelAttributeWarning) as record:
+        model = Aliased(name=1, a=2, outer=[3], extra=4)
+    assert len(record) == 1
+    assert "`extra`" in str(record[0].message)
+    assert model.model_extra is None
+    assert "extra" not in model.model_dump()
+
+
+def test_unknown_names_cannot_be_assigned() -> None:
+    model = Aliased(plain=1)
+    model.plain = 2
+    with pytest.raises(ValidationError, match="Object has no attribute 'bogus'"):
+        model.bogus = 1
+    assert model.model_dump() == {
+        "plain": 2,
+        "named": None,
+        "choice": None,
+        "nested": None,
+    }
+    assert model.__pydantic_extra__ is None
+
+
+def test_nested_models_are_checked() -> None:
+    with pytest.warns(UnknownModelAttributeWarning, match="BetterForecastHourly"):
+        BetterForecast(**FORECAST)
+
+
+@pytest.mark.usefixtures("check_disabled")
+def test_global_switch_disables_check() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        forecast = BetterForecast(**FORECAST, other=1)
+    assert forecast.forecast is not None
+    assert forecast.forecast.hourly is not None
+    assert forecast.forecast.hourly[0].time == 1
+    assert forecast.model_extra is None
+    assert forecast.forecast.hourly[0].model_extra is None
@@ -0,0 +1,54 @@
+"""Tests for batch columnar decoding of obs_st arrays."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from tempestwx._models.obs_st import (
+    OBS_ST_FIELDS,
+    ObsStColumns,
+    Raw,
+    TempestObservation,
+)
+
+ROWS: list[list[Raw]] = [
+    [
+        *(1700000000, 0.1, 0.4, 1.2, 270, 3, 1001.4, 12.5, 71, 5000, 1.5, 42),
+        *(0.0, 0, None, 0, 2.61, 1, 0.2, None, None, 1),
+    ],
+    [1700000060, None, "0.5", 1.3, 275, 3, 1001.3, 12.4, 70, 4900, 1.4, 40],
+    [1700000120],
+]
+
+
+def test_columns_match_per_row_decoding() -> None:
+    columns = TempestObservation.from_arrays(ROWS)
+    assert isinstance(columns, ObsStColumns)
+    assert len(columns) == len(ROWS)
+    assert columns.fields == OBS_ST_FIELDS
+    assert columns["wind_average"] == [0.4, 0.5, None]
+    assert columns["precipitation_analysis_type"] == [1, None, None]
+    expected = [TempestObservation.from_array(row) for row in ROWS]
+    assert list(columns.rows()) == expected
+    assert columns.row(1) == expected[1]
+    assert columns.row(-1) == expected[-1]
+    assert columns.to_arrays() == [row.to_array() for row in expected]
+
+
+def test_rows_are_built_on_demand() -> None:
+    rows = TempestObservation.from_arrays(ROWS).rows()
+    assert next(rows).timestamp == 1700000000
+    with pytest.raises(IndexError):
+        TempestObservation.from_arrays(ROWS).row(3)
+
+
+def test_invalid_and_empty_input() -> None:
+    with pytest.raises(ValidationError):
+        TempestObservation.from_arrays([[1, "calm"]])
+    with pytest.raises(ValidationError):
+        TempestObservation.from_arrays([[1] + [None] * 12 + [1.5]])
+    empty = TempestObservation.from_arrays([])
+    assert len(empty) == 0
+    assert empty["timestamp"] == []
+    assert list(empty.rows()) == []
@@ -0,0 +1,72 @@
+"""Tests for the columnar observation frame."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tempestwx._models.observation_frame import ObservationFrame
+from tempestwx._models.station_observations import StationObservation
+
+np = pytest.importorskip("numpy")
+
+OB_FIELDS = ["timestamp", "air_temperature", "lightning_strike_count", "trend"]
+OBS: list[list[Any]] = [
+    [1000, 12.5, 0, "steady"],
+    [1060, None, 2, None],
+    [1120, 13, None, "rising"],
+    [1180, 13.5, 1],
+]
+
+
+def frame() -> ObservationFrame:
+    """Return the frame of the sample observations."""
+    return StationObservation(ob_fields=OB_FIELDS, obs=OBS).to_frame()
+
+
+def test_columns_are_typed_with_masks() -> None:
+    f = frame()
+    assert f.fields == tuple(OB_FIELDS)
+    assert len(f) == 4
+    assert f["timestamp"].dtype == np.int64
+    assert f["air_temperature"].dtype == np.float64
+    assert f["lightning_strike_count"].dtype == np.int64
+    assert f["trend"].dtype.kind == "U"
+    assert f.mask("air_temperature").tolist() == [True, False, True, True]
+    assert f.valid("air_temperature").tolist() == [12.5, 13.0, 13.5]
+    assert f.mask("trend").tolist() == [True, False, True, False]
+    assert f.to_obs() == [[*row, None][:4] for row in OBS]
+
+
+def test_time_lookup_and_zero_copy_slices() -> None:
+    f = frame()
+    assert f.index(1120) == 2
+    with pytest.raises(KeyError):
+        f.index(1121)
+    window = f.between(1060, 1180)
+    assert window["timestamp"].tolist() == [1060, 1120]
+    assert np.shares_memory(window["air_temperature"], f["air_temperature"])
+    assert np.shares_memory(window.mask("trend"), f.mask("trend"))
+    assert len(f.between(2000)) == 0
+    assert len(f.between(end=1000)) == 0
+    assert len(f.between()) == 4
+
+
+def test_rows_are_sorted_by_key() -> None:
+    shuffled = [OBS[2], OBS[0], [None, 9.0], OBS[3], OBS[1]]
+    f = ObservationFrame.from_obs(OB_FIELDS, shuffled)
+    assert f.mask("timestamp").tolist() == [False, True, True, True, True]
+    assert f.valid("timestamp").tolist() == [1000, 1060, 1120, 1180]
+    assert f.rows(1, 5).to_obs() == frame().to_obs()
+    assert f.index(1120) == 3
+    assert f.between(1060, 1180)["air_temperature"].tolist() == [0.0, 13.0]
+
+
+def test_empty_and_invalid_inputs() -> None:
+    assert len(StationObservation().to_frame()) == 0
+    assert len(StationObservation(ob_fields=OB_FIELDS).to_frame()) == 0
+    with pytest.raises(ValueError, match="ob_fields"):
+        StationObservation(obs=OBS).to_frame()
+    with pytest.raises(ValueError, match="repeat"):
+        ObservationFrame.from_obs(["a", "a"], [[1, 2]])
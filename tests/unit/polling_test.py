@@ -0,0 +1,166 @@
+"""Tests for the adaptive polling scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any
+
+import pytest
+
+from tempestwx._client.polling import PollScheduler
+from tempestwx._models.station_observation_latest import StationObservationLatest
+from tests.helpers import FakeAsyncClient, FakeClock
+
+
+def make_scheduler(
+    **kwargs: Any,
+) -> tuple[PollScheduler, FakeAsyncClient, FakeClock]:
+    client = FakeAsyncClient()
+    clock = FakeClock(1_000.0)
+    scheduler = PollScheduler(
+        client, clock=clock, rng=random.Random(0), jitter=0.0, **kwargs
+    )
+    return scheduler, client, clock
+
+
+def test_requires_async_client() -> None:
+    class SyncClient:
+        is_async = False
+
+    with pytest.raises(ValueError):
+        PollScheduler(SyncClient())
+
+
+@pytest.mark.parametrize(
+    "options", [{"report_delay": 0.0}, {"report_delay": -1.0}, {"max_concurrency": 0}]
+)
+def test_rejects_invalid_options(options: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        PollScheduler(FakeAsyncClient(), **options)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_poll_due_bounds_concurrency() -> None:
+    class SlowClient(FakeAsyncClient):
+        active = 0
+        peak = 0
+
+        async def obs_station_latest(self, station_id: int) -> StationObservationLatest:
+            SlowClient.active += 1
+            SlowClient.peak = max(SlowClient.peak, SlowClient.active)
+            await asyncio.sleep(0.001)
+            SlowClient.active -= 1
+            return await super().obs_station_latest(station_id)
+
+    scheduler = PollScheduler(
+        SlowClient(), clock=FakeClock(1_000.0), jitter=0.0, max_concurrency=3
+    )
+    for station_id in range(1, 11):
+        scheduler.add(station_id)
+
+    assert await scheduler.poll_due() == 10
+    assert SlowClient.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_polls_just_after_expected_report() -> None:
+    scheduler, client, clock = make_scheduler(report_delay=5.0)
+    scheduler.add(1, interval=60.0)
+    client.timestamps[1] = 990.0
+
+    assert await scheduler.poll_due() == 1
+    # Next report expected at 990 + 60, polled 5s after
+    assert scheduler.state(1).next_due == pytest.approx(1055.0)
+
+    clock.now = 1054.0
+    assert await scheduler.poll_due() == 0
+    clock.now = 1055.0
+    client.timestamps[1] = 1050.0
+    assert await scheduler.poll_due() == 1
+    assert scheduler.state(1).last_obs == 1050.0
+
+
+def test_learns_cadence_from_timestamps() -> None:
+    scheduler, _, _ = make_scheduler(default_interval=60.0)
+    scheduler.add(1)
+    for i in range(8):
+        scheduler.observe(1, 1_000.0 + 70.0 * i)
+    assert scheduler.state(1).interval == pytest.approx(70.0, abs=0.5)
+
+    # A single long gap is an outage; a repeated one is a slower cadence
+    scheduler.observe(1, 5_000.0)
+    assert scheduler.state(1).interval == pytest.approx(70.0, abs=0.5)
+    scheduler.observe(1, 5_000.0 + (5_000.0 - 1_490.0))
+    assert scheduler.state(1).interval == 3_510.0
+
+
+def test_reporting_interval_overrides_estimate() -> None:
+    scheduler, _, _ = make_scheduler()
+    scheduler.add(1)
+    scheduler.observe(1, 1_000.0, reporting_interval=5)
+    assert scheduler.state(1).interval == 300.0
+    assert scheduler.observe(1, 900.0) is False
+
+
+@pytest.mark.asyncio
+async def test_offline_station_backs_off() -> None:
+    scheduler, client, clock = make_scheduler(max_backoff=600.0)
+    scheduler.add(1)
+    client.fail.add(1)
+    delays = []
+    for _ in range(5):
+        clock.now = scheduler.state(1).next_due
+        await scheduler.poll_due()
+        delays.append(scheduler.state(1).next_due - clock.now)
+    assert delays == sorted(delays)
+    assert delays[-1] == 600.0
+    assert scheduler.state(1).failures == 5
+
+
+@pytest.mark.asyncio
+async def test_remove_discards_pending_entry() -> None:
+    scheduler, client, _ = make_scheduler()
+    scheduler.add(1)
+    scheduler.add(2)
+    scheduler.remove(1)
+    await scheduler.poll_due()
+    assert client.calls == [(2,)]
+    assert 1 not in scheduler
+
+
+@pytest.mark.asyncio
+async def test_callback_receives_new_observations_only() -> None:
+    seen: list[int] = []
+
+    async def on_obs(station_id: int, _: StationObservationLatest) -> None:
+        seen.append(station_id)
+
+    scheduler, client, clock = make_scheduler()
+    scheduler.on_observation = on_obs
+    scheduler.add(7)
+    client.timestamps[7] = 999.0
+    await scheduler.poll_due()
+    clock.now = scheduler.state(7).next_due
+    await scheduler.poll_due()  # unchanged timestamp
+    assert seen == [7]
+    assert scheduler.state(7).stale_polls == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_keeps_station_scheduled() -> None:
+    def on_obs(_station_id: int, _latest: StationObservationLatest) -> None:
+        raise RuntimeError("sink down")
+
+    scheduler, client, clock = make_scheduler(on_observation=on_obs)
+    scheduler.add(7, interval=60.0)
+    client.timestamps[7] = 999.0
+    assert await scheduler.poll_due() == 1
+    state = scheduler.state(7)
+    assert state.callback_errors == 1
+    assert isinstance(state.last_callback_error, RuntimeError)
+    assert scheduler.next_due() == state.next_due == 999.0 + 60.0 + 5.0
+    clock.now = state.next_due
+    client.timestamps[7] = 1059.0
+    assert await scheduler.poll_due() == 1
+    assert state.callback_errors == 2
@@ -0,0 +1,112 @@
+"""Tests for prepared endpoint calls."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._client.endpoint import PreparedCall
+from tempestwx._http import Request, Response, Transport
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.station_observation_latest import StationObservationLatest
+
+
+class RecordingTransport(Transport):
+    """Transport recording requests and answering with canned content."""
+
+    def __init__(self, content: dict[str, Any], asynchronous: bool = False) -> None:
+        """Initialize with canned content and synchronicity."""
+        self.requests: list[Request] = []
+        self._content = content
+        self._async = asynchronous
+
+    def _respond(self, request: Request) -> Response:
+        self.requests.append(request)
+        return Response(
+            url=request.url, headers={}, status_code=200, content=self._content
+        )
+
+    def send(self, request: Request) -> Any:
+        """Return the canned response (or a coroutine for async mode)."""
+        if self._async:
+
+            async def respond() -> Response:
+                return self._respond(request)
+
+            return respond()
+        return self._respond(request)
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return self._async
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+def test_prepare_builds_once_and_resends_with_fresh_headers() -> None:
+    transport = RecordingTransport({"station_id": 1, "obs": []})
+    client = Tempest(token="first", transport=transport)
+    latest = client.obs_station_latest.prepare(1)
+    assert isinstance(latest, PreparedCall)
+    assert transport.requests == []
+
+    assert isinstance(latest(), StationObservationLatest)
+    with client.token_as("second"):
+        latest()
+    first, second = transport.requests
+    assert first.url == second.url
+    assert first.url.endswith("observations/station/1")
+    assert (first.headers or {})["Authorization"] == "Bearer first"
+    assert (second.headers or {})["Authorization"] == "Bearer second"
+    # The prepared request itself is never mutated by sending
+    assert latest.request.headers is None
+
+
+def test_prepare_validates_arguments_up_front() -> None:
+    client = Tempest(token="t", transport=RecordingTransport({}))
+    with pytest.raises(ValueError):
+        client.forecast.prepare(1, units_temp="kelvin")
+    with pytest.raises(ValueError):
+        client.obs_station_latest.prepare(0)
+
+
+@pytest.mark.asyncio
+async def test_prepared_call_async() -> None:
+    transport = RecordingTransport({"status": {"status_code": 0}}, asynchronous=True)
+    client = Tempest(token="t", transport=transport)
+    forecast = client.forecast.prepare(42, units_temp="f")
+    result = await forecast()
+    assert isinstance(result, BetterForecast)
+    assert (transport.requests[0].params or {})["units_temp"] == "f"
+
+
+@pytest.mark.asyncio
+async def test_prepared_call_async_authorizes_when_awaited() -> None:
+    transport = RecordingTransport({"station_id": 1, "obs": []}, asynchronous=True)
+    client = Tempest(token="first", transport=transport)
+    pending = client.obs_station_latest.prepare(1)()
+    with client.token_as("second"):
+        await pending
+    assert (transport.requests[0].headers or {})["Authorization"] == "Bearer second"
+
+    # An unawaited call never builds or sends its request
+    client.obs_station_latest.prepare(1)().close()
+    assert len(transport.requests) == 1
+
+
+def test_endpoint_keeps_method_metadata() -> None:
+    client = Tempest(token="t", transport=RecordingTransport({"stations": []}))
+    assert client.stations.__name__ == "stations"
+    assert "station" in (Tempest.stations.__doc__ or "")
+    # Unbound form still works
+    assert Tempest.stations(client) is not None
+
+
+def test_raw_returns_undecoded_content() -> None:
+    content = {"station_id": 1, "obs": []}
+    client = Tempest(token="t", transport=RecordingTransport(content))
+    assert client.obs_station_latest.raw(1) == content
@@ -0,0 +1,102 @@
+"""Tests for read-only model variants."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import pickle
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from tempestwx import Tempest
+from tempestwx._http import AsyncTransport, SyncTransport
+from tempestwx._models._read_only import ReadOnlyModel, read_only
+from tempestwx._models.device import Device, DeviceType
+from tempestwx._models.device_observation import DeviceObservation
+from tempestwx._models.station_set import StationSet
+from tempestwx._models.status import Status
+from tests.helpers import STATIONS, StaticTransport
+
+
+def handler(_request: httpx.Request) -> httpx.Response:
+    """Answer with the stations payload."""
+    return httpx.Response(200, json=STATIONS)
+
+
+def test_variant_mirrors_model() -> None:
+    variant = read_only(Device)
+    assert variant is read_only(Device)
+    assert variant.__name__ == "ReadOnlyDevice"
+    assert variant.model is Device
+    assert [f.name for f in dataclasses.fields(variant)] == list(  # type: ignore[arg-type]
+        Device.__pydantic_fields__
+    )
+    device = variant.validate({"device_id": 1, "device_type": "HB", "notes": " x "})
+    assert not hasattr(device, "__dict__")
+    assert device.device_type is DeviceType.HB  # type: ignore[attr-defined]
+    assert device.notes == "x"  # type: ignore[attr-defined]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        device.notes = "y"  # type: ignore[attr-defined]
+
+
+def test_validation_matches_model() -> None:
+    stations = read_only(StationSet).validate_json(json.dumps(STATIONS).encode())
+    assert isinstance(stations.stations[0], ReadOnlyModel)  # type: ignore[attr-defined]
+    assert stations.to_model() == StationSet(**STATIONS)
+    observation = read_only(DeviceObservation).validate({"type": "obs_st"})
+    assert observation.type_ == "obs_st"  # type: ignore[attr-defined]
+    status = read_only(Status).validate({"status_message": " "})
+    assert status.status_message is None  # type: ignore[attr-defined]
+    with pytest.raises(ValidationError):
+        read_only(Status).validate({"status_code": "1"})
+
+
+def test_pickle_round_trip() -> None:
+    stations = read_only(StationSet).validate(STATIONS)
+    assert pickle.loads(pickle.dumps(stations)) == stations
+
+
+def test_client_option_and_scope() -> None:
+    transport = SyncTransport(httpx.Client(transport=httpx.MockTransport(handler)))
+    client = Tempest(token="t", transport=transport, read_only=True)
+    stations = client.stations()
+    assert type(stations) is read_only(StationSet)
+    with client.read_only(False):
+        assert isinstance(client.stations(), StationSet)
+    assert client.stations.raw() == STATIONS
+
+
+def test_scope_with_parsed_content() -> None:
+    client = Tempest(token="t", transport=StaticTransport(STATIONS), trusted=True)
+    with client.read_only():
+        stations = client.stations()
+    assert type(stations) is read_only(StationSet)
+    assert stations.to_model() == StationSet(**STATIONS)
+
+
+@pytest.mark.asyncio
+async def test_read_only_decoding_on_executor() -> None:
+    transport = AsyncTransport(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        client = Tempest(
+            token="t",
+            transport=transport,
+            read_only=True,
+            decode_executor=executor,
+            decode_min_bytes=0,
+        )
+        stations = await client.stations()
+    assert type(stations) is read_only(StationSet)
+
+
+def test_unknown_attributes_are_dropped_silently() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        device = read_only(Device).validate({"device_id": 1, "x": 1})
+    assert not hasattr(device, "x")
@@ -0,0 +1,59 @@
+"""Tests for memoized request construction."""
+
+from __future__ import annotations
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._client import base
+from tempestwx._client.api.tempest_home.observations.observations import (
+    _parse_obs_fields,
+)
+from tempestwx._client.base import TempestBase
+from tempestwx._models.units_default import Bucket, UnitsPrecip, UnitsTemp
+
+
+def test_validate_units_is_memoized_and_coerces() -> None:
+    base._cached_units.cache_clear()
+    first = TempestBase._validate_units("f", "mph", "inhg", "in", "mi")
+    second = TempestBase._validate_units("f", "mph", "inhg", "in", "mi")
+    assert first is second
+    assert first[0] is UnitsTemp.f
+    assert first[3] is UnitsPrecip.in_
+    assert base._cached_units.cache_info().hits == 1
+
+
+def test_invalid_values_raise_and_are_not_cached() -> None:
+    with pytest.raises(ValueError, match="Invalid units_wind"):
+        TempestBase._validate_units("c", "furlongs", "mb", "mm", "km")
+    with pytest.raises(ValueError, match="Invalid units_temp"):
+        TempestBase._validate_units(["c"], "mph", "mb", "mm", "km")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Invalid bucket"):
+        TempestBase._validate_enum_param("bucket", 7, Bucket)
+    with pytest.raises(ValueError, match="snake_case"):
+        _parse_obs_fields("timestamp,Air-Temp")
+
+
+def test_parse_obs_fields_returns_shared_tuple() -> None:
+    parsed = _parse_obs_fields(" timestamp, air_temperature ,")
+    assert parsed == ("timestamp", "air_temperature")
+    assert _parse_obs_fields(" timestamp, air_temperature ,") is parsed
+
+
+def test_headers_are_fresh_per_call() -> None:
+    client = Tempest(token="t1")
+    headers = client._create_headers()
+    headers["X-Extra"] = "1"
+    assert client._create_headers() == {
+        "Authorization": "Bearer t1",
+        "Content-Type": "application/json",
+    }
+    with client.token_as("t2"):
+        assert client._create_headers()["Authorization"] == "Bearer t2"
+
+
+def test_build_url_reuses_prefix_and_keeps_absolute_urls() -> None:
+    client = Tempest(token="t")
+    base = client.settings.api_uri_normalized
+    assert client._build_url("/stations/1") == base + "stations/1"
+    assert client._build_url("https://example.test/x") == "https://example.test/x"
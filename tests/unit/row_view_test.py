@@ -0,0 +1,80 @@
+"""Tests for lazy row views of raw observation arrays."""
+
+from __future__ import annotations
+
+import pytest
+
+from tempestwx._models.obs_sky import SkyObservation
+from tempestwx._models.obs_st import Raw, TempestObservation
+from tempestwx._models.row_view import RowView, row_view, row_views
+from tempestwx._models.stats_day import StatsDay
+from tempestwx._models.status import Status
+
+OBS: list[list[Raw]] = [
+    [
+        *(1700000000, 0.1, 0.4, 1.2, 270, 3, 1001.4, 12.5, 71, 5000, 1.5, 42),
+        *(0.0, 0, None, 0, 2.61, 1, 0.2, None, None, 1),
+    ],
+    [1700000060, None, 0.5, 1.3],
+]
+
+
+def test_view_reads_array_positions() -> None:
+    view = row_view(TempestObservation)
+    assert view is row_view(TempestObservation)
+    assert view.__name__ == "TempestObservationView"
+    assert view.fields == tuple(TempestObservation.__pydantic_fields__)
+    first, second = row_views(TempestObservation, OBS)
+    assert not hasattr(first, "__dict__")
+    assert first.air_temperature == 12.5  # type: ignore[attr-defined]
+    assert first.precipitation_analysis_type == 1  # type: ignore[attr-defined]
+    assert second.wind_average == 0.5  # type: ignore[attr-defined]
+    assert second.air_temperature is None  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError):
+        first.air_temperature = 1.0  # type: ignore[attr-defined]
+
+
+def test_views_share_rows() -> None:
+    rows = [list(row) for row in OBS]
+    view = row_view(TempestObservation)(rows, 0)
+    assert view == row_view(TempestObservation)(OBS, 0)
+    rows[0][7] = 9.5
+    assert view.air_temperature == 9.5  # type: ignore[attr-defined]
+    assert view.index == 0
+    assert view != row_view(TempestObservation)(OBS, 0)
+
+
+def test_matches_models() -> None:
+    for row, view in zip(OBS, row_views(TempestObservation, OBS), strict=True):
+        model = TempestObservation.from_array(row)
+        assert view.to_model() == model
+        assert view.to_array() == model.to_array()
+        assert [getattr(view, name) for name in view.fields] == model.to_array()
+    sky = row_view(SkyObservation)([[1700000000, 5000, 1.5]], 0)
+    assert sky.uv == 1.5  # type: ignore[attr-defined]
+    day = row_view(StatsDay)([[1001.4, 1003.0, 999.8, 12.5]], 0)
+    assert day.temperature == 12.5  # type: ignore[attr-defined]
+    assert day.to_model() == StatsDay.from_array([1001.4, 1003.0, 999.8, 12.5])
+    assert "pressure_high=1003.0" in repr(day)
+    assert isinstance(day, RowView)
+
+
+def test_stats_day_rows_skip_the_day_label() -> None:
+    rows: list[list[Raw]] = [
+        ["2024-01-01", 1013.2, 1015.0, 1011.1, 4.5, 9.0, -1.5],
+        [1010.0, None, None, 6.25],
+        ["1012.8", None, None, 5.5],
+    ]
+    day, week, numeric = row_views(StatsDay, rows)
+    assert day.pressure == 1013.2  # type: ignore[attr-defined]
+    assert day.temperature_low == -1.5  # type: ignore[attr-defined]
+    assert day.precipitation_analysis_type is None  # type: ignore[attr-defined]
+    assert day.to_model() == StatsDay.from_array(rows[0][1:])
+    assert week.temperature == 6.25  # type: ignore[attr-defined]
+    assert numeric.pressure == "1012.8"  # type: ignore[attr-defined]
+    assert numeric.temperature == 5.5  # type: ignore[attr-defined]
+
+
+def test_rejects_models_without_arrays() -> None:
+    with pytest.raises(ValueError, match="array model"):
+        row_view(Status)
@@ -0,0 +1,134 @@
+"""Tests for the priority-aware request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._http import Priority, Request, RequestScheduler, Response, Transport
+
+
+class GatedAsyncTransport(Transport):
+    """Async transport holding history requests until released."""
+
+    def __init__(self) -> None:
+        """Initialize with the gate closed."""
+        self.gate = asyncio.Event()
+
+    async def send(self, request: Request) -> Response:
+        """Wait for the gate on history requests, then return an empty body."""
+        if "/observations/stn/" in request.url:
+            await self.gate.wait()
+        return Response(url=request.url, headers={}, status_code=200, content={})
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return True
+
+    async def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+class EmptyTransport(Transport):
+    """Sync transport returning an empty body."""
+
+    def send(self, request: Request) -> Response:
+        """Return an empty body."""
+        return Response(url=request.url, headers={}, status_code=200, content={})
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return False
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+@pytest.mark.asyncio
+async def test_realtime_never_waits_behind_bulk() -> None:
+    scheduler = RequestScheduler(max_concurrency=2, reserved=1)
+    transport = GatedAsyncTransport()
+    client = Tempest(token="t", transport=transport, scheduler=scheduler)
+
+    backfill = [asyncio.create_task(client.obs_station(1)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    stats = scheduler.stats()
+    assert stats[Priority.BULK].in_flight == 1
+    assert stats[Priority.BULK].queued == 4
+
+    await asyncio.wait_for(client.obs_station_latest(1), timeout=1)
+    assert scheduler.stats()[Priority.REALTIME].dispatched == 1
+
+    transport.gate.set()
+    await asyncio.gather(*backfill)
+    stats = scheduler.stats()
+    assert stats[Priority.BULK].dispatched == 5
+    assert stats[Priority.BULK].max_queued == 4
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_queuing_between_classes() -> None:
+    scheduler = RequestScheduler(max_concurrency=1, reserved=0)
+    order: list[Priority] = []
+
+    async def request(priority: Priority) -> None:
+        await scheduler.aacquire(priority)
+        order.append(priority)
+        scheduler.release(priority)
+
+    await scheduler.aacquire()  # hold the only slot while requests queue
+    tasks = [
+        asyncio.create_task(request(p))
+        for _ in range(10)
+        for p in (Priority.BULK, Priority.INTERACTIVE)
+    ]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    # Default weights give INTERACTIVE four dispatches per BULK dispatch
+    assert order[:5].count(Priority.INTERACTIVE) == 4
+    assert order[:10].count(Priority.INTERACTIVE) == 8
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue() -> None:
+    scheduler = RequestScheduler(max_concurrency=1, reserved=0)
+    await scheduler.aacquire()
+    waiter = asyncio.create_task(scheduler.aacquire(Priority.BULK))
+    await asyncio.sleep(0)
+    assert scheduler.stats()[Priority.BULK].queued == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert scheduler.stats()[Priority.BULK].queued == 0
+    scheduler.release()
+    assert scheduler.in_flight == 0
+
+
+def test_rate_limit_and_priority_override() -> None:
+    scheduler = RequestScheduler(max_concurrency=4, rate=50.0, burst=1)
+    client = Tempest(token="t", transport=EmptyTransport(), scheduler=scheduler)
+    start = time.monotonic()
+    with client.priority(Priority.BULK):
+        for _ in range(5):
+            client.stations()
+    assert time.monotonic() - start >= 0.07
+    stats = scheduler.stats()
+    assert stats[Priority.BULK].dispatched == 5
+    assert stats[Priority.INTERACTIVE].dispatched == 0
+    assert stats[Priority.BULK].max_wait > 0
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        RequestScheduler(max_concurrency=1, reserved=1)
+    with pytest.raises(ValueError):
+        RequestScheduler(rate=0)
+    with pytest.raises(ValueError):
+        RequestScheduler(weights={Priority.BULK: 0})
@@ -0,0 +1,160 @@
+"""Tests for the station metadata cache."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Coroutine
+from typing import Any, cast
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._cache import StationCache
+from tempestwx._http import Request, Response, Transport
+from tempestwx._models.station_set import StationSet
+
+
+def station(station_id: int, modified: int) -> dict[str, Any]:
+    return {
+        "station_id": station_id,
+        "name": f"Station {station_id}",
+        "last_modified_epoch": modified,
+        "devices": [{"device_id": station_id * 10, "device_type": "ST"}],
+    }
+
+
+class StationsTransport(Transport):
+    """Transport serving a mutable list of stations per token."""
+
+    def __init__(self, asynchronous: bool = False) -> None:
+        """Initialize with two stations for token ``t``, one for ``other``."""
+        self.stations = [station(1, 100), station(2, 100)]
+        self.other = [station(1, 300)]
+        self.requests = 0
+        self._async = asynchronous
+
+    def _respond(self, request: Request) -> Response:
+        self.requests += 1
+        headers = request.headers or {}
+        owned = self.stations if headers["Authorization"] == "Bearer t" else self.other
+        stations = copy.deepcopy(owned)
+        if not request.url.endswith("stations"):
+            station_id = int(request.url.rsplit("/", 1)[1])
+            stations = [s for s in stations if s["station_id"] == station_id]
+        content = {"status": {"status_code": 0}, "stations": stations}
+        return Response(url=request.url, headers={}, status_code=200, content=content)
+
+    def send(self, request: Request) -> Any:
+        """Return the station list (or a coroutine for async mode)."""
+        if self._async:
+
+            async def respond() -> Response:
+                return self._respond(request)
+
+            return respond()
+        return self._respond(request)
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return self._async
+
+    def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+def test_unchanged_stations_keep_identity() -> None:
+    transport = StationsTransport()
+    cache = StationCache(Tempest(token="t", transport=transport))
+    first = cache.stations()
+    second = cache.stations()
+    assert isinstance(first, StationSet)
+    assert second is first
+    assert transport.requests == 2
+
+    transport.stations[1] = station(2, 200)
+    third = cache.stations()
+    assert isinstance(third, StationSet)
+    assert third is not first
+    assert first.stations is not None
+    assert third.stations is not None
+    assert third.stations[0] is first.stations[0]
+    assert third.stations[1] is not first.stations[1]
+    assert third.stations[1].last_modified_epoch == 200
+    stats = cache.stats()
+    assert (stats.rebuilt, stats.reused) == (3, 3)
+
+
+def test_removed_stations_are_dropped() -> None:
+    transport = StationsTransport()
+    cache = StationCache(Tempest(token="t", transport=transport))
+    cache.stations()
+    del transport.stations[0]
+    cache.stations()
+    assert cache.get(1) is None
+    assert cache.get(2) is not None
+    assert cache.stats().removed == 1
+
+
+def test_single_station_shares_the_cache() -> None:
+    transport = StationsTransport()
+    cache = StationCache(Tempest(token="t", transport=transport))
+    result = cache.stations()
+    single = cache.station(2)
+    assert isinstance(result, StationSet)
+    assert isinstance(single, StationSet)
+    assert result.stations is not None
+    assert single.stations is not None
+    assert single.stations[0] is result.stations[1]
+    with pytest.raises(ValueError):
+        cache.station(0)
+
+
+def test_stations_are_scoped_to_the_token() -> None:
+    transport = StationsTransport()
+    client = Tempest(token="t", transport=transport)
+    cache = StationCache(client)
+    mine = cache.stations()
+    with client.token_as("other"):
+        theirs = cache.stations()
+        assert cache.get(2) is None
+        assert cache.station(2) is not None
+    assert isinstance(mine, StationSet)
+    assert isinstance(theirs, StationSet)
+    assert theirs.stations is not None
+    assert [s.last_modified_epoch for s in theirs.stations] == [300]
+    assert cache.stations() is mine
+    assert cache.get(1) is not None
+    assert cache.get(1).last_modified_epoch == 100  # type: ignore[union-attr]
+    assert len(cache) == 3
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    assert len(cache) == 1
+
+
+def test_token_scopes_are_bounded() -> None:
+    client = Tempest(token="t", transport=StationsTransport())
+    cache = StationCache(client, max_tokens=1)
+    cache.stations()
+    assert cache.get(1) is not None
+    with client.token_as("other"):
+        cache.stations()
+    assert cache.get(1) is None  # the scope of "t" was dropped
+    assert len(cache) == 1
+    assert all(isinstance(k, bytes) and b"other" not in k for k in cache._scopes)
+    with pytest.raises(ValueError):
+        StationCache(client, max_tokens=0)
+
+
+@pytest.mark.asyncio
+async def test_async_client() -> None:
+    transport = StationsTransport(asynchronous=True)
+    cache = StationCache(Tempest(token="t", transport=transport))
+
+    async def stations() -> StationSet | None:
+        return await cast(Coroutine[None, None, StationSet | None], cache.stations())
+
+    first = await stations()
+    assert await stations() is first
+    cache.invalidate()
+    assert await stations() is not first
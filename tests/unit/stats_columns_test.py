@@ -0,0 +1,52 @@
+"""Tests for columnar views of station statistics."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tempestwx._models.stats_day import StatsDay
+from tempestwx._models.stats_set import StatsSet
+
+np = pytest.importorskip("numpy")
+
+STATS: dict[str, Any] = {
+    "station_id": 7,
+    "type": "stats",
+    "stats_day": [
+        ["2024-01-01", 1013.2, 1015.0, 1011.1, 4.5, 9.0, -1.5],
+        ["2024-01-02", "1012.8", None, None, 5.5],
+        ["2024-01-03"],
+    ],
+    "stats_week": [[1010.0, None, None, 6.25], [1011.0, None, None, 7.75]],
+    "stats_week_time": [["2024-01-01", "2024-01-07"], ["2024-01-08", "2024-01-14"]],
+    "stats_month": [[1012.0, None, None, 8.5]],
+}
+
+
+def test_day_columns_are_typed_and_labelled() -> None:
+    frame = StatsSet(**STATS).to_columns()
+    assert frame.key == "time"
+    assert frame.fields == ("time", *StatsDay.__pydantic_fields__)
+    assert frame["time"].tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert frame["pressure"].dtype == np.float64
+    assert frame["pressure"].tolist() == [1013.2, 1012.8, 0.0]
+    assert frame.valid("temperature").tolist() == [4.5, 5.5]
+    assert frame.mask("precipitation_type").tolist() == [False, False, False]
+    row = StatsDay.from_array(STATS["stats_day"][1][1:])
+    assert frame.rows(1, 2).to_obs()[0][1:] == row.to_array()
+
+
+def test_periods_align_with_time_labels() -> None:
+    stats = StatsSet(**STATS)
+    weeks = stats.to_columns("week")
+    assert weeks["time"].tolist() == ["2024-01-01", "2024-01-08"]
+    assert weeks.between("2024-01-05")["temperature"].tolist() == [7.75]
+    assert weeks.index("2024-01-01") == 0
+    months = stats.to_columns("month")
+    assert months.mask("time").tolist() == [False]
+    assert months["temperature"].tolist() == [8.5]
+    assert len(stats.to_columns("year")) == 0
+    with pytest.raises(ValueError, match="period"):
+        stats.to_columns("hour")
@@ -0,0 +1,51 @@
+"""Tests for case-insensitive StrEnum lookups."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from tempestwx._models.better_forecast_hourly_forecast import (
+    BetterForecastHourlyForecast,
+)
+from tempestwx._models.device import DeviceType
+from tempestwx._models.units_default import Conditions, UnitsPrecip
+
+CONDITIONS = TypeAdapter(Conditions)
+
+
+def test_values_and_names_ignore_case() -> None:
+    assert CONDITIONS.validate_python("Partly Cloudy") is Conditions.partly_cloudy
+    assert CONDITIONS.validate_python("PARTLY CLOUDY") is Conditions.partly_cloudy
+    assert CONDITIONS.validate_python("partly_cloudy") is Conditions.partly_cloudy
+    assert Conditions("rain likely") is Conditions.rain_likely
+    assert UnitsPrecip("IN") is UnitsPrecip.in_
+    assert UnitsPrecip["IN_"] is UnitsPrecip.in_
+    assert DeviceType["hb"] is DeviceType.HB
+    assert DeviceType("st") is DeviceType.ST
+    model = BetterForecastHourlyForecast(conditions="CLEAR")  # type: ignore[arg-type]
+    assert model.conditions is Conditions.clear
+
+
+def test_misses_raise_value_errors() -> None:
+    with pytest.raises(ValidationError, match="'Hail' is not a valid Conditions"):
+        CONDITIONS.validate_python("Hail")
+    with pytest.raises(ValueError, match="Hail"):
+        Conditions("Hail")
+    with pytest.raises(KeyError):
+        Conditions["Clear Skies"]
+    with pytest.raises(ValidationError):
+        BetterForecastHourlyForecast(conditions="Hail")  # type: ignore[arg-type]
+
+
+def test_member_names_keep_their_case() -> None:
+    assert list(DeviceType) == [
+        DeviceType.HB,
+        DeviceType.AR,
+        DeviceType.SK,
+        DeviceType.ST,
+    ]
+    assert "HB" in DeviceType.__members__
+    assert pickle.loads(pickle.dumps(DeviceType.HB)) is DeviceType.HB
@@ -0,0 +1,95 @@
+"""Tests for the multi-tenant token pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._auth import QuotaExceededError, TokenPool
+from tempestwx._http import Request, Response, Transport
+from tests.helpers import FakeClock
+
+
+class RecordingAsyncTransport(Transport):
+    """Async transport recording the bearer token of every request."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded requests."""
+        self.tokens: list[str] = []
+
+    async def send(self, request: Request) -> Response:
+        """Record the Authorization header and return an empty station set."""
+        await asyncio.sleep(0)
+        headers = request.headers or {}
+        self.tokens.append(headers["Authorization"].removeprefix("Bearer "))
+        return Response(url=request.url, headers={}, status_code=200, content={})
+
+    @property
+    def is_async(self) -> bool:
+        """Return transport asynchronicity mode."""
+        return True
+
+    async def close(self) -> None:
+        """Close transport (no-op)."""
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_use_their_own_tenant_token() -> None:
+    pool = TokenPool()
+    for i in range(50):
+        pool.add(f"t{i}", f"token-{i}")
+    transport = RecordingAsyncTransport()
+    client = Tempest(token="base", transport=transport, token_pool=pool)
+
+    async def call(i: int) -> None:
+        with client.tenant(f"t{i}"):
+            await client.stations()
+
+    await asyncio.gather(*(call(i) for i in range(50)))
+    assert sorted(transport.tokens) == sorted(f"token-{i}" for i in range(50))
+    assert all(pool.usage(f"t{i}").total == 1 for i in range(50))
+    # Outside any scope, the base token is used
+    await client.stations()
+    assert transport.tokens[-1] == "base"
+
+
+@pytest.mark.asyncio
+async def test_token_as_takes_precedence_over_tenant() -> None:
+    pool = TokenPool()
+    pool.add("acme", "acme-token")
+    transport = RecordingAsyncTransport()
+    client = Tempest(token="base", transport=transport, token_pool=pool)
+    with client.tenant("acme"), client.token_as("explicit"):
+        await client.stations()
+    assert transport.tokens == ["explicit"]
+
+
+@pytest.mark.asyncio
+async def test_quota_exceeded_raises_before_sending() -> None:
+    clock = FakeClock()
+    pool = TokenPool(clock=clock)
+    pool.add("acme", "acme-token", quota=2, window=60.0)
+    transport = RecordingAsyncTransport()
+    client = Tempest(token="base", transport=transport, token_pool=pool)
+    with client.tenant("acme"):
+        await client.stations()
+        await client.stations()
+        with pytest.raises(QuotaExceededError) as excinfo:
+            await client.stations()
+        assert excinfo.value.retry_after == 60.0
+        clock.now = 60.0  # window resets
+        await client.stations()
+    assert len(transport.tokens) == 3
+    usage = pool.usage("acme")
+    assert (usage.total, usage.rejected, usage.window_requests) == (3, 1, 1)
+
+
+def test_tenant_requires_pool_and_known_tenant() -> None:
+    client = Tempest(token="base")
+    with pytest.raises(RuntimeError), client.tenant("acme"):
+        pass
+    pooled = Tempest(token="base", token_pool=TokenPool())
+    with pytest.raises(KeyError), pooled.tenant("missing"):
+        pass
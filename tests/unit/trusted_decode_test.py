@@ -0,0 +1,119 @@
+"""Tests for trusted decoding without validation."""
+
+from __future__ import annotations
+
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from tempestwx import Tempest
+from tempestwx._http import AsyncTransport
+from tempestwx._models._construct import construct
+from tempestwx._models._serializer import UnknownModelAttributeWarning
+from tempestwx._models.better_forecast import BetterForecast
+from tempestwx._models.device import DeviceType
+from tempestwx._models.station import StationCapability
+from tempestwx._models.station_set import StationSet
+from tempestwx._models.stats_set import StatsSet
+from tempestwx._models.units_default import Conditions
+from tests.helpers import STATIONS, STATUS, StaticTransport
+
+FORECAST: dict[str, Any] = {
+    "status": STATUS,
+    "current_conditions": {"time": 1, "conditions": "Clear"},
+    "forecast": {
+        "hourly": [{"time": 1, "conditions": "Rain Likely", "precip_type": "rain"}],
+        "daily": [{"day_num": 1, "conditions": "Cloudy"}],
+    },
+}
+STATS: dict[str, Any] = {
+    "status": STATUS,
+    "type": "stats_day",
+    "stats_day": [["2024-01-01", 1013.2, None]],
+}
+
+
+@pytest.mark.parametrize(
+    ("cls", "data"),
+    [(StationSet, STATIONS), (BetterForecast, FORECAST), (StatsSet, STATS)],
+)
+def test_construct_matches_validation(cls: Any, data: dict[str, Any]) -> None:
+    validated = cls(**data)
+    trusted = construct(cls, data)
+    assert trusted == validated
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_dump() == validated.model_dump()
+
+
+def test_nested_models_and_enums_are_converted() -> None:
+    stations = construct(StationSet, STATIONS)
+    assert stations.stations is not None
+    station = stations.stations[0]
+    assert station.devices is not None
+    assert station.devices[1].device_type is DeviceType.ST
+    assert station.devices[1].device_meta is not None
+    assert station.devices[1].device_meta.agl == 2
+    assert station.capabilities is not None
+    assert station.capabilities[0].capability is StationCapability.wind
+    forecast = construct(BetterForecast, FORECAST)
+    assert forecast.current_conditions is not None
+    assert forecast.current_conditions.conditions is Conditions.clear
+    stats = construct(StatsSet, STATS)
+    assert stats.type_ == "stats_day"
+
+
+def test_enum_names_fall_back_to_case_insensitive_lookup() -> None:
+    data = {"stations": [{"capabilities": [{"capability": "WIND"}]}]}
+    stations = construct(StationSet, data)
+    assert stations.stations is not None
+    assert stations.stations[0].capabilities is not None
+    assert stations.stations[0].capabilities[0].capability is StationCapability.wind
+
+
+def test_trusted_client_skips_unknown_attribute_check() -> None:
+    content = {**STATIONS, "undocumented": 1}
+    client = Tempest(token="t", transport=StaticTransport(content), trusted=True)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert client.stations() == StationSet(**STATIONS)
+    with client.trusted(False), pytest.warns(UnknownModelAttributeWarning):
+        client.stations()
+
+
+def test_trusted_scope_and_prepared_calls() -> None:
+    content = {**FORECAST, "undocumented": 1}
+    client = Tempest(token="t", transport=StaticTransport(content))
+    prepared = client.forecast.prepare(1)
+    with pytest.warns(UnknownModelAttributeWarning):
+        prepared()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with client.trusted():
+            assert isinstance(prepared(), BetterForecast)
+            assert isinstance(client.forecast(1), BetterForecast)
+        assert client.stations.raw() == content
+
+
+@pytest.mark.asyncio
+async def test_trusted_decoding_on_executor() -> None:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={**STATIONS, "undocumented": 1})
+
+    transport = AsyncTransport(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        client = Tempest(
+            token="t",
+            transport=transport,
+            trusted=True,
+            decode_executor=executor,
+            decode_min_bytes=0,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = await client.stations()
+    assert result == StationSet(**STATIONS)